@@ -34,6 +34,7 @@ from .core import dr  # noqa: F401
 from .core.context import ClusterArchiveContext, HostContext, HostArchiveContext, SerializedArchiveContext  # noqa: F401
 from .core.dr import SkipComponent  # noqa: F401
 from .core.hydration import create_context
+from .core.parser_cache import ParserCache, set_cache as set_parser_cache  # noqa: F401
 from .core.plugins import combiner, fact, metadata, parser, rule  # noqa: F401
 from .core.plugins import datasource, condition, incident  # noqa: F401
 from .core.plugins import make_response, make_metadata, make_fingerprint  # noqa: F401
@@ -185,8 +186,8 @@ def apply_configs(config):
                 addition to any packages previosly loaded for the `-p` option
 
             configs:
-                name, enabled, metadata, and timeout. All keys are optional except
-                name.
+                name, enabled, metadata, timeout, and tail. All keys are optional
+                except name.
 
                 name is the prefix or exact name of any loaded component. Any
                 component starting with name will have the associated configuration
@@ -201,6 +202,10 @@ def apply_configs(config):
                 metadata is any dictionary that you want to attach to the
                 component. The dictionary can be retrieved by the component at
                 runtime.
+
+                tail sets the tail window of any file datasource so that only
+                the end of the file is read, e.g. ``{"lines": 10000}`` or
+                ``{"hours": 24}``. See :mod:`insights.util.tail`.
     """
     default_enabled = config.get('default_component_enabled', False)
     delegate_keys = sorted(dr.DELEGATES, key=dr.get_name)
@@ -219,6 +224,8 @@ def apply_configs(config):
                         setattr(c, k, v)
                 if hasattr(c, "timeout"):
                     c.timeout = comp_cfg.get("timeout", c.timeout)
+                if hasattr(c, "tail"):
+                    c.tail = comp_cfg.get("tail", c.tail)
             if cname == name:
                 break
 
@@ -253,6 +260,7 @@ def run(component=None, root=None, print_summary=False,
         p.add_argument("-s", "--syslog", help="Log results to syslog.", action="store_true")
         p.add_argument("-D", "--debug", help="Verbose debug output.", action="store_true")
         p.add_argument("--context", help="Execution Context. Defaults to HostContext if an archive isn't passed.")
+        p.add_argument("--parser-cache", help="Directory for caching parser results between runs.")
 
         class Args(object):
             pass
@@ -285,6 +293,8 @@ def run(component=None, root=None, print_summary=False,
 
         logging.basicConfig(level=logging.DEBUG if args.debug else logging.INFO if args.verbose else logging.ERROR)
         context = _load_context(args.context) or context
+        if args.parser_cache:
+            set_parser_cache(ParserCache(args.parser_cache))
         inventory = args.inventory
 
         root = args.archive or root
@@ -13,9 +13,36 @@ import re
 
 from .utilities import determine_hostname, _expand_paths, write_data_to_file
 from .insights_spec import InsightsFile, InsightsCommand
+from insights.util import which
 
 logger = logging.getLogger(__name__)
 
+COMPRESSION_EXTENSIONS = {
+    "none": "",
+    "zstd": ".zst",
+}
+"""
+Archive extensions for compressors whose name isn't their extension.
+"""
+
+COMPRESSION_PROGRAMS = {
+    "zstd": ["zstd", "-q"],
+}
+"""
+Compressors that tar doesn't support with a single letter flag.
+"""
+
+PARALLEL_COMPRESSION_PROGRAMS = {
+    "gz": ["pigz"],
+    "xz": ["xz", "-T0"],
+    "bz2": ["pbzip2"],
+    "zstd": ["zstd", "-q", "-T0"],
+}
+"""
+Multi-threaded compressors used when parallel compression is requested and
+the program is installed.
+"""
+
 
 class InsightsArchive(object):
     """
@@ -23,7 +50,7 @@ class InsightsArchive(object):
     and files to the insights archive
     """
 
-    def __init__(self, compressor="gz", target_name=None):
+    def __init__(self, compressor="gz", target_name=None, parallel=False):
         """
         Initialize the Insights Archive
         Create temp dir, archive dir, and command dir
@@ -38,6 +65,7 @@ class InsightsArchive(object):
         self.archive_dir = self.create_archive_dir()
         self.cmd_dir = self.create_command_dir()
         self.compressor = compressor
+        self.parallel = parallel
 
     def create_archive_dir(self):
         """
@@ -112,22 +140,47 @@ class InsightsArchive(object):
             "none": ""
         }.get(compressor, "z")
 
+    def get_compression_program(self, compressor):
+        """
+        Returns the command line of an external compressor to pipe the tar
+        stream through, or None if tar should compress by itself.
+        """
+        if self.parallel:
+            program = PARALLEL_COMPRESSION_PROGRAMS.get(compressor)
+            if program and which(program[0]):
+                return program
+        return COMPRESSION_PROGRAMS.get(compressor)
+
     def create_tar_file(self, full_archive=False):
         """
         Create tar file to be compressed
         """
         tar_file_name = os.path.join(self.archive_tmp_dir, self.archive_name)
-        ext = "" if self.compressor == "none" else ".%s" % self.compressor
+        ext = COMPRESSION_EXTENSIONS.get(self.compressor, ".%s" % self.compressor)
         tar_file_name = tar_file_name + ".tar" + ext
         logger.debug("Tar File: " + tar_file_name)
-        subprocess.call(shlex.split("tar c%sfS %s -C %s ." % (
-            self.get_compression_flag(self.compressor),
-            tar_file_name,
-            # for the docker "uber archive,"use archive_dir
-            #   rather than tmp_dir for all the files we tar,
-            #   because all the individual archives are in there
-            self.tmp_dir if not full_archive else self.archive_dir)),
-            stderr=subprocess.PIPE)
+        # for the docker "uber archive,"use archive_dir
+        #   rather than tmp_dir for all the files we tar,
+        #   because all the individual archives are in there
+        src = self.tmp_dir if not full_archive else self.archive_dir
+        program = self.get_compression_program(self.compressor)
+        if program:
+            logger.debug("Compressing with: %s", " ".join(program))
+            with open(os.devnull, "wb") as null:
+                with open(tar_file_name, "wb") as out:
+                    tar = subprocess.Popen(["tar", "cfS", "-", "-C", src, "."],
+                                           stdout=subprocess.PIPE,
+                                           stderr=null)
+                    compress = subprocess.Popen(program, stdin=tar.stdout, stdout=out)
+                    tar.stdout.close()
+                    compress.communicate()
+                    tar.wait()
+        else:
+            subprocess.call(shlex.split("tar c%sfS %s -C %s ." % (
+                self.get_compression_flag(self.compressor),
+                tar_file_name,
+                src)),
+                stderr=subprocess.PIPE)
         self.delete_archive_dir()
         logger.debug("Tar File Size: %s", str(os.path.getsize(tar_file_name)))
         return tar_file_name
@@ -366,7 +366,8 @@ def collect(config, pconn):
             return False
 
         archive = InsightsArchive(compressor=config.compressor,
-                                  target_name=target['name'])
+                                  target_name=target['name'],
+                                  parallel=config.compressor_parallel)
         atexit.register(_delete_archive_internal, config, archive)
 
         # determine the target type and begin collection
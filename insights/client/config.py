@@ -81,6 +81,12 @@ DEFAULT_OPTS = {
         'help': argparse.SUPPRESS,
         'action': 'store'
     },
+    'compressor_parallel': {
+        'default': False,
+        'opt': ['--compressor-parallel'],
+        'help': argparse.SUPPRESS,
+        'action': 'store_true'
+    },
     'conf': {
         'default': constants.default_conf_file,
         'opt': ['--conf', '-c'],
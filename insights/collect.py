@@ -65,6 +65,15 @@ client:
         - name: insights.specs.Specs
           enabled: true
 
+    # Compression used for the archive when collect is asked to compress.
+    # One of gz, bz2, xz or zstd.
+    compressor: gz
+
+    # Optional directory of a content addressed store shared between
+    # collections. Persisted file and command output is deduplicated into it
+    # and the archive's metadata refers to it by digest.
+    # blob_store: /var/lib/insights/blobs
+
     run_strategy:
         name: parallel
         args:
@@ -82,8 +91,9 @@ plugins:
     # configuration of loaded components. names are prefixes, so any component with
     # a fully qualified name that starts with a key will get the associated
     # configuration applied. Can specify timeout, which will apply to command
-    # datasources. Can specify metadata, which must be a dictionary and will be
-    # merged with the components' default metadata.
+    # datasources. Can specify tail, which limits file datasources to the end
+    # of the file by bytes, lines, or hours. Can specify metadata, which must be
+    # a dictionary and will be merged with the components' default metadata.
     configs:
         - name: insights.specs.Specs
           enabled: true
@@ -91,6 +101,12 @@ plugins:
         - name: insights.specs.default.DefaultSpecs
           enabled: true
 
+        # Only collect the last day of the system log.
+        # - name: insights.specs.default.DefaultSpecs.messages
+        #   enabled: true
+        #   tail:
+        #       hours: 24
+
         - name: insights.parsers.hostname
           enabled: true
 
@@ -178,17 +194,32 @@ def get_to_persist(persisters):
     return results
 
 
-def create_archive(path, remove_path=True):
+COMPRESSORS = {
+    "gz": ("-z", ".tar.gz"),
+    "bz2": ("-j", ".tar.bz2"),
+    "xz": ("-J", ".tar.xz"),
+    "zstd": ("--use-compress-program=zstd", ".tar.zst"),
+}
+"""
+tar flag and archive extension for each supported compressor.
+"""
+
+
+def create_archive(path, remove_path=True, compressor="gz"):
     """
-    Creates a tar.gz of the path using the path basename + "tar.gz"
+    Creates a compressed tar of the path using the path basename + the
+    extension of the compressor, "tar.gz" by default.
     The resulting file is in the parent directory of the original path, and
     the original path is removed.
     """
+    if compressor not in COMPRESSORS:
+        raise ValueError("Unsupported compressor: %s" % compressor)
+    flag, ext = COMPRESSORS[compressor]
     root_path = os.path.dirname(path)
     relative_path = os.path.basename(path)
-    archive_path = path + ".tar.gz"
+    archive_path = path + ext
 
-    cmd = [["tar", "-C", root_path, "-czf", archive_path, relative_path]]
+    cmd = [["tar", "-C", root_path, flag, "-cf", archive_path, relative_path]]
     call(cmd, env=SAFE_ENV)
     if remove_path:
         fs.remove(path)
@@ -225,12 +256,13 @@ def collect(manifest=default_manifest, tmp_path=None, compress=False):
         tmp_path (str): The temporary directory that will be used to create a
             working directory for storing component output as well as the final
             tar.gz if one is generated.
-        compress (boolean): True to create a tar.gz and remove the original
-            workspace containing output. False to leave the workspace without
-            creating a tar.gz
+        compress (boolean): True to create a compressed tar and remove the
+            original workspace containing output. False to leave the workspace
+            without creating an archive. The compression is set by the
+            manifest's client.compressor and defaults to gz.
 
     Returns:
-        The full path to the created tar.gz or workspace.
+        The full path to the created archive or workspace.
     """
 
     manifest = load_manifest(manifest)
@@ -260,12 +292,12 @@ def collect(manifest=default_manifest, tmp_path=None, compress=False):
     parallel = run_strategy.get("name") == "parallel"
     pool_args = run_strategy.get("args", {})
     with get_pool(parallel, pool_args) as pool:
-        h = Hydration(output_path, pool=pool)
+        h = Hydration(output_path, pool=pool, blob_store=client.get("blob_store"))
         broker.add_observer(h.make_persister(to_persist))
         dr.run_all(broker=broker, pool=pool)
 
     if compress:
-        return create_archive(output_path)
+        return create_archive(output_path, compressor=client.get("compressor", "gz"))
     return output_path
 
 
@@ -0,0 +1,216 @@
+"""
+Log Timeline
+============
+
+Combiner that merges the time stamped lines of several logs into a single
+timeline which can be queried by time range and by source.  It uses the
+results of the :class:`insights.parsers.messages.Messages`,
+:class:`insights.parsers.journal_since_boot.JournalSinceBoot`,
+:class:`insights.parsers.secure.Secure` and
+:class:`insights.parsers.dmesg.DmesgLineList` parsers, each of which is
+optional.
+
+The timeline is only built the first time it's queried.  It reuses the time
+stamps the parsers have already parsed for ``get_after`` and vice versa, so
+looking at the same window in several logs doesn't scan each of them again.
+
+Lines without a time stamp are continuations of the line before them, and
+appear in the timeline right after it with its time stamp.
+
+Logs such as ``/var/log/messages`` don't record the year.  Their lines are
+placed in the year of the latest time stamp of the logs that do, or in the
+current year if none do, and are moved back a year before each December to
+January rollover.  ``dmesg`` time stamps count seconds since boot, so they
+are placed relative to the last ``kernel: Linux version`` line of the other
+logs, and are left out if there isn't one.
+
+Examples:
+    >>> from datetime import datetime, timedelta
+    >>> timeline = shared[LogTimeline]
+    >>> timeline.sources
+    ['DmesgLineList', 'Messages']
+    >>> oom = timeline.between(datetime(2018, 5, 18, 15, 0), sources=['DmesgLineList'], s='Out of memory')[0]
+    >>> oom.timestamp
+    datetime.datetime(2018, 5, 18, 15, 24, 28, 2)
+    >>> [e.line for e in timeline.around(oom.timestamp, timedelta(seconds=5), sources=['Messages'])]
+    ['May 18 15:24:28 host kernel: Out of memory: Kill process 11597 (java)']
+"""
+import bisect
+import datetime
+from collections import namedtuple
+
+import six
+
+from insights.core.plugins import combiner
+from insights.parsers.dmesg import DmesgLineList
+from insights.parsers.journal_since_boot import JournalSinceBoot
+from insights.parsers.messages import Messages
+from insights.parsers.secure import Secure
+
+Entry = namedtuple("Entry", field_names=["timestamp", "source", "line"])
+"""namedtuple: A line of the timeline, with the name of the log it came from."""
+
+BOOT_MARKER = "kernel: Linux version"
+"""str: The message logged by the kernel when the system boots."""
+
+
+class Timeline(object):
+    """
+    A timeline of the lines of any number of
+    :class:`insights.core.LogFileOutput` parsers.
+
+    Parameters:
+        logs (dict): parsers keyed on the source name to use for them.
+        year (int): the year for logs without one in their time stamps.
+            Taken from the other logs when not given.
+    """
+    def __init__(self, logs, year=None):
+        self.logs = dict((k, v) for k, v in logs.items() if v is not None)
+        self.year = year
+        self._times = None
+        self._refs = None
+
+    @property
+    def sources(self):
+        """list: The sorted names of the sources in the timeline."""
+        return sorted(self.logs)
+
+    def _stamp_columns(self):
+        """
+        Returns the time stamp of every line of each log other than dmesg
+        with the year filled in, keyed on source name.
+        """
+        columns = {}
+        yearless = []
+        years = []
+        for name, log in self.logs.items():
+            if isinstance(log, DmesgLineList):
+                continue
+            stamps = log.line_timestamps()
+            columns[name] = stamps
+            if log.timestamps_have_year:
+                years.extend(s.year for s in stamps if s is not None)
+            else:
+                yearless.append(name)
+
+        year = self.year or (max(years) if years else datetime.date.today().year)
+        for name in yearless:
+            columns[name] = self._fill_year(columns[name], year)
+        return columns
+
+    @staticmethod
+    def _fill_year(stamps, year):
+        """
+        Puts the last time stamp in year and earlier ones back a year for
+        each new year between them and it.
+        """
+        offsets = []
+        offset = 0
+        previous = None
+        for s in stamps:
+            if s is not None:
+                if previous is not None and previous.month == 12 and s.month == 1:
+                    offset += 1
+                previous = s
+            offsets.append(offset)
+
+        result = []
+        for s, o in zip(stamps, offsets):
+            if s is not None:
+                try:
+                    s = s.replace(year=year - offset + o)
+                except ValueError:
+                    # 29th of February outside a leap year
+                    s = None
+            result.append(s)
+        return result
+
+    @staticmethod
+    def _dmesg_stamps(log, boot):
+        return [boot + datetime.timedelta(seconds=s) if s is not None else None
+                for s in log.line_timestamps()]
+
+    def _build(self):
+        columns = self._stamp_columns()
+
+        boots = [s for name, stamps in columns.items()
+                 for s, line in zip(stamps, self.logs[name].lines)
+                 if s is not None and BOOT_MARKER in line]
+        for name, log in self.logs.items():
+            if isinstance(log, DmesgLineList) and boots:
+                columns[name] = self._dmesg_stamps(log, max(boots))
+
+        keys = []
+        names = sorted(columns)
+        for k, name in enumerate(names):
+            current = None
+            for i, stamp in enumerate(columns[name]):
+                if stamp is not None:
+                    current = stamp
+                if current is not None:
+                    keys.append((current, k, i))
+        keys.sort()
+        self._times = [t for t, _, _ in keys]
+        self._refs = [(names[k], i) for _, k, i in keys]
+
+    def between(self, start=None, end=None, sources=None, s=None):
+        """
+        Returns the lines of the timeline from `start` up to but not
+        including `end`, in time order.
+
+        Parameters:
+            start (datetime.datetime): the earliest time to include.  The
+                timeline starts at the beginning when not given.
+            end (datetime.datetime): the time to stop at.  The timeline
+                goes to the end when not given.
+            sources (list): the names of the sources to include, or all of
+                them when not given.
+            s (str or list): one or more strings that each line must
+                contain.
+
+        Returns:
+            (list): :class:`Entry` tuples.
+        """
+        if self._times is None:
+            self._build()
+        lo = bisect.bisect_left(self._times, start) if start is not None else 0
+        hi = bisect.bisect_left(self._times, end) if end is not None else len(self._times)
+        words = [s] if isinstance(s, six.string_types) else (s or [])
+        sources = set(sources) if sources is not None else None
+
+        result = []
+        for n in six.moves.range(lo, hi):
+            name, i = self._refs[n]
+            if sources is not None and name not in sources:
+                continue
+            line = self.logs[name].lines[i]
+            if all(w in line for w in words):
+                result.append(Entry(self._times[n], name, line))
+        return result
+
+    def around(self, timestamp, window, sources=None, s=None):
+        """
+        Returns the lines within `window` either side of `timestamp`, as
+        for :meth:`between`.
+
+        Parameters:
+            timestamp (datetime.datetime): the time of interest.
+            window (datetime.timedelta): how far before and after it to look.
+        """
+        return self.between(timestamp - window, timestamp + window, sources=sources, s=s)
+
+
+@combiner(optional=[Messages, JournalSinceBoot, Secure, DmesgLineList])
+class LogTimeline(Timeline):
+    """
+    Combiner providing the timeline of the system logs.  Each source is named
+    after its parser class: ``Messages``, ``JournalSinceBoot``, ``Secure``
+    and ``DmesgLineList``.
+    """
+    def __init__(self, messages, journal, secure, dmesg):
+        super(LogTimeline, self).__init__({
+            "Messages": messages,
+            "JournalSinceBoot": journal,
+            "Secure": secure,
+            "DmesgLineList": dmesg,
+        })
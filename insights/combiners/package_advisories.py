@@ -0,0 +1,115 @@
+"""
+Package Advisories
+==================
+
+Combiner that checks a table of advisories against the packages in
+:class:`insights.parsers.installed_rpms.InstalledRpms` all at once.
+
+An advisory names a package and the range of its versions that are
+affected: from the version it was introduced in, if known, up to but not
+including the version it was fixed in.  Versions are given as
+``[epoch:]version[-release]`` strings, and a version without a release
+matches every release of that version.
+
+Checking thousands of advisories with a rule each means thousands of
+lookups and comparisons per host.  Instead the advisories are sorted by
+package and merged with the sorted installed package names in one pass, and
+each comparison is a comparison of the precomputed
+:attr:`insights.parsers.installed_rpms.InstalledRpm.sort_key` tuples.
+
+Examples:
+    >>> advisories = [
+    ...     Advisory('RHSA-2017:1931', 'bash', '4.2.46-28.el7'),
+    ...     Advisory('RHSA-2014:1306', 'bash', '4.2.45-5.el7_0.4', introduced='4.2.45-5.el7'),
+    ...     Advisory('RHSA-2018:0998', 'openssl', '1:1.0.2k-12.el7'),
+    ... ]
+    >>> hits = shared[PackageAdvisories].affected(advisories)
+    >>> [(h.advisory.id, h.rpm.nvr) for h in hits]
+    [('RHSA-2017:1931', 'bash-4.2.46-20.el7_2'), ('RHSA-2018:0998', 'openssl-1.0.2k-8.el7')]
+"""
+from collections import namedtuple
+from itertools import groupby
+
+from insights.core.plugins import combiner
+from insights.parsers.installed_rpms import InstalledRpms
+from insights.parsers.rpm_vercmp import evr_key
+
+Advisory = namedtuple("Advisory", field_names=["id", "package", "fixed", "introduced"])
+"""
+namedtuple: An advisory affecting ``package`` from version ``introduced``
+up to but not including version ``fixed``.  Either may be ``None`` for no
+bound, and ``introduced`` defaults to ``None``.
+"""
+Advisory.__new__.__defaults__ = (None,)
+
+Hit = namedtuple("Hit", field_names=["advisory", "rpm"])
+"""namedtuple: An installed package affected by an advisory."""
+
+
+def bound_key(version):
+    """
+    Returns the sort key of a ``[epoch:]version[-release]`` string, without
+    the release part when there's no release, or ``None`` for no version.
+    Installed packages are compared with it on as many parts as it has.
+    """
+    if version is None:
+        return None
+    epoch, sep, rest = version.partition(":")
+    if not sep:
+        epoch, rest = "0", version
+    if "-" in rest:
+        ver, rel = rest.rsplit("-", 1)
+        return evr_key(epoch, ver, rel)
+    return evr_key(epoch, rest, None)[:2]
+
+
+@combiner(InstalledRpms)
+class PackageAdvisories(object):
+    """
+    Combiner checking advisories against the installed packages.
+
+    Parameters:
+        rpms (InstalledRpms): the installed packages.
+    """
+    def __init__(self, rpms):
+        self.packages = rpms.packages
+        """dict: Installed packages keyed by package name."""
+        self._names = sorted(rpms.packages)
+
+    def affected(self, advisories):
+        """
+        Returns every installed package in the affected range of each
+        advisory.
+
+        Parameters:
+            advisories (iterable): :class:`Advisory` tuples or plain tuples
+                of the same fields.
+
+        Returns:
+            (list): :class:`Hit` tuples, ordered by package name, then in
+            the order the advisories were given and then in the order the
+            installed versions are listed in :class:`InstalledRpms`.
+        """
+        table = sorted((Advisory(*a) for a in advisories), key=lambda a: a.package)
+        names = self._names
+        n = 0
+        hits = []
+        for package, group in groupby(table, key=lambda a: a.package):
+            while n < len(names) and names[n] < package:
+                n += 1
+            if n == len(names):
+                break
+            if names[n] != package:
+                continue
+
+            installed = [(rpm, rpm.sort_key) for rpm in self.packages[package]]
+            for advisory in group:
+                introduced = bound_key(advisory.introduced)
+                fixed = bound_key(advisory.fixed)
+                for rpm, key in installed:
+                    if introduced is not None and key[:len(introduced)] < introduced:
+                        continue
+                    if fixed is not None and key[:len(fixed)] >= fixed:
+                        continue
+                    hits.append(Hit(advisory, rpm))
+        return hits
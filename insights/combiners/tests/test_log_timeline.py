@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta
+
+from insights.combiners.log_timeline import LogTimeline, Timeline
+from insights.core import LogFileOutput
+from insights.parsers.dmesg import DmesgLineList
+from insights.parsers.messages import Messages
+from insights.parsers.secure import Secure
+from insights.tests import context_wrap
+
+MESSAGES = """
+Dec 31 23:58:01 host kernel: Linux version 3.10.0-693.el7.x86_64
+Dec 31 23:58:05 host systemd: Started Session 1 of user root.
+Jan  1 00:00:10 host kernel: Out of memory: Kill process 11597 (java)
+Jan  1 00:00:10 host kernel: Killed process 11597 (java)
+Jan  1 00:05:00 host yum[11954]: Updated: sos-3.2-40.el6.noarch
+""".strip()
+
+SECURE = """
+Dec 31 23:59:30 host sshd[2100]: Accepted publickey for root from 192.0.2.1
+Jan  1 00:00:11 host sshd[2200]: pam_unix(sshd:session): session opened for user root
+""".strip()
+
+DMESG = """
+[    0.000000] Initializing cgroup subsys cpuset
+[  129.000000] java invoked oom-killer: gfp_mask=0x201da, order=0
+[  129.000000] Out of memory: Kill process 11597 (java) score 900
+continuation of the oom report
+""".strip()
+
+
+class AccessLog(LogFileOutput):
+    time_format = '%Y-%m-%d %H:%M:%S'
+
+
+ACCESS = """
+2017-12-31 23:59:59 GET /
+2018-01-01 00:00:09 GET /slow
+2018-01-01 00:00:12 GET /
+""".strip()
+
+
+def test_log_timeline():
+    timeline = LogTimeline(Messages(context_wrap(MESSAGES)), None,
+                           Secure(context_wrap(SECURE)), DmesgLineList(context_wrap(DMESG)))
+    timeline.year = 2018
+    assert timeline.sources == ['DmesgLineList', 'Messages', 'Secure']
+
+    entries = timeline.between()
+    assert len(entries) == 11
+    assert [e.timestamp for e in entries] == sorted(e.timestamp for e in entries)
+    # dmesg is placed relative to the boot line
+    assert entries[0] == (datetime(2017, 12, 31, 23, 58, 1), 'DmesgLineList',
+                          '[    0.000000] Initializing cgroup subsys cpuset')
+    assert entries[1] == (datetime(2017, 12, 31, 23, 58, 1), 'Messages', MESSAGES.splitlines()[0])
+    assert entries[-1].timestamp == datetime(2018, 1, 1, 0, 5)
+
+    oom = timeline.between(datetime(2018, 1, 1), s='Out of memory')
+    assert [e.source for e in oom] == ['DmesgLineList', 'Messages']
+    assert oom[0].timestamp == datetime(2018, 1, 1, 0, 0, 10)
+
+    near = timeline.around(oom[0].timestamp, timedelta(seconds=2), sources=['Secure', 'DmesgLineList'])
+    assert [e.line for e in near] == [
+        '[  129.000000] java invoked oom-killer: gfp_mask=0x201da, order=0',
+        '[  129.000000] Out of memory: Kill process 11597 (java) score 900',
+        'continuation of the oom report',
+        'Jan  1 00:00:11 host sshd[2200]: pam_unix(sshd:session): session opened for user root',
+    ]
+
+    assert timeline.between(datetime(2018, 1, 1, 0, 0, 11), datetime(2018, 1, 1, 0, 5),
+                            s=['session', 'root']) == [
+        (datetime(2018, 1, 1, 0, 0, 11), 'Secure', SECURE.splitlines()[1])
+    ]
+
+
+def test_year_from_other_logs():
+    timeline = Timeline({
+        'access': AccessLog(context_wrap(ACCESS)),
+        'messages': Messages(context_wrap(MESSAGES)),
+    })
+    entries = timeline.between(datetime(2018, 1, 1), datetime(2018, 1, 1, 0, 1))
+    assert [(e.source, e.timestamp.second) for e in entries] == [
+        ('access', 9), ('messages', 10), ('messages', 10), ('access', 12)
+    ]
+
+
+def test_no_boot_line():
+    timeline = LogTimeline(None, None, Secure(context_wrap(SECURE)), DmesgLineList(context_wrap(DMESG)))
+    assert timeline.sources == ['DmesgLineList', 'Secure']
+    assert [e.source for e in timeline.between()] == ['Secure', 'Secure']
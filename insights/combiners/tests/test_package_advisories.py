@@ -0,0 +1,59 @@
+from insights.combiners.package_advisories import Advisory, PackageAdvisories, bound_key
+from insights.parsers.installed_rpms import InstalledRpms
+from insights.tests import context_wrap
+
+RPMS = """
+bash-4.2.46-20.el7_2.x86_64
+kernel-3.10.0-327.el7.x86_64
+kernel-3.10.0-514.el7.x86_64
+openssl-1:1.0.2k-8.el7.x86_64
+zsh-5.0.2-28.el7.x86_64
+""".strip()
+
+ADVISORIES = [
+    Advisory('A-1', 'bash', '4.2.46-28.el7'),
+    Advisory('A-2', 'bash', '4.2.45-5.el7_0.4', introduced='4.2.45-5.el7'),
+    Advisory('A-3', 'openssl', '1:1.0.2k-12.el7'),
+    Advisory('A-4', 'openssl', '1.0.2k-12.el7'),
+    Advisory('A-5', 'kernel', '3.10.0-693.el7', introduced='3.10.0-400.el7'),
+    Advisory('A-6', 'kernel', '3.10.0'),
+    ('A-7', 'zsh', None, '5.0'),
+    Advisory('A-8', 'not-installed', '1.0-1'),
+]
+
+
+def test_bound_key():
+    assert bound_key(None) is None
+    assert len(bound_key('1.0')) == 2
+    assert bound_key('1:1.0-1')[0] == 1
+    assert bound_key('1.0-1')[0] == 0
+
+
+def test_affected():
+    rpms = InstalledRpms(context_wrap(RPMS))
+    hits = PackageAdvisories(rpms).affected(ADVISORIES)
+    assert [(h.advisory.id, h.rpm.nvr) for h in hits] == [
+        ('A-1', 'bash-4.2.46-20.el7_2'),
+        ('A-5', 'kernel-3.10.0-514.el7'),
+        ('A-3', 'openssl-1.0.2k-8.el7'),
+        ('A-7', 'zsh-5.0.2-28.el7'),
+    ]
+
+
+def test_nothing_installed():
+    rpms = InstalledRpms(context_wrap(""))
+    assert PackageAdvisories(rpms).affected(ADVISORIES) == []
+
+
+def test_affected_order():
+    rpms = InstalledRpms(context_wrap(RPMS))
+    advisories = [
+        Advisory('K-2', 'kernel', '3.10.0-600.el7'),
+        Advisory('K-1', 'kernel', '3.10.0-400.el7'),
+    ]
+    hits = PackageAdvisories(rpms).affected(advisories)
+    assert [(h.advisory.id, h.rpm.nvr) for h in hits] == [
+        ('K-2', 'kernel-3.10.0-327.el7'),
+        ('K-2', 'kernel-3.10.0-514.el7'),
+        ('K-1', 'kernel-3.10.0-327.el7'),
+    ]
@@ -49,6 +49,7 @@ class Node(object):
         self.ctx = ctx
         self.pos = None
         self.parent = None
+        self._names = None
 
     def select(self, *queries, **kwargs):
         """
@@ -160,7 +161,28 @@ class Node(object):
         endswith
         startswith
         """
-        return select(*queries, **kwargs)(self.children)
+        return select(*queries, **kwargs)(self.children, tree=self)
+
+    def named(self, name):
+        """
+        Returns the nodes anywhere beneath this one whose names case-fold to
+        `name`, in document order.  The index behind it is built on first
+        use, so call :meth:`clear_index` after changing the tree.
+        """
+        if self._names is None:
+            names = {}
+
+            def inner(children):
+                for c in children:
+                    names.setdefault(_fold(c.name), []).append(c)
+                    inner(c.children)
+            inner(self.children)
+            self._names = names
+        return self._names.get(_fold(name), [])
+
+    def clear_index(self):
+        """ Forgets the index of node names used by :meth:`named`. """
+        self._names = None
 
     def find(self, *queries, **kwargs):
         """
@@ -578,6 +600,10 @@ else:
         return text.lower()
 
 
+def _fold(name):
+    return caseless(name) if isinstance(name, six.string_types) else name
+
+
 # DSL for querying trees of Nodes. Start with `select`.
 def __or(funcs, args):
     """ Support list sugar for "or" of two predicates. Used inside `select`. """
@@ -718,34 +744,84 @@ def __compose(g, f):
 first = 0
 last = -1
 
+QUERY_CACHE_SIZE = 1024
+"""
+The number of compiled queries :func:`select` remembers before starting over.
+"""
+
+_QUERIES = {}
+
+
+def __signature(query):
+    """ Returns a hashable key for a query, telling lists and tuples apart. """
+    if isinstance(query, (list, tuple)):
+        return (type(query), tuple(__signature(q) for q in query))
+    return query
+
+
+def __copy(query):
+    """ Copies the lists in a query so later changes to them can't leak into the cache. """
+    if isinstance(query, (list, tuple)):
+        return type(query)(__copy(q) for q in query)
+    return query
+
+
+def __name_key(query):
+    """
+    Returns the name that nodes must case-fold to in order to match query,
+    or None if query doesn't limit the name that way.
+    """
+    if isinstance(query, tuple):
+        query = query[0] if query else None
+    if isinstance(query, six.string_types):
+        return query
+    if isinstance(query, eq) and isinstance(query.value, six.string_types):
+        return query.value
+    return None
+
 
 def select(*queries, **kwargs):
     """
     Builds a function that will execute the specified queries against a list of
-    Nodes.
+    Nodes.  Queries are compiled once and reused for the same arguments.
     """
+    try:
+        key = (__signature(queries), tuple(sorted(kwargs.items())))
+        return _QUERIES[key]
+    except TypeError:
+        key = None
+    except KeyError:
+        pass
+
+    compiled = _compile(__copy(queries), kwargs)
+    if key is not None:
+        if len(_QUERIES) >= QUERY_CACHE_SIZE:
+            _QUERIES.clear()
+        _QUERIES[key] = compiled
+    return compiled
+
+
+def _compile(queries, kwargs):
     def make_query(*args):
-        def simple_query(nodes):
-            if len(args) == 0:
-                return nodes
-            pred = args[0]
-            results = []
-            if isinstance(pred, list):
-                funcs = [make_query(q) for q in pred]
+        if len(args) == 0:
+            return lambda nodes: nodes
+        pred = args[0]
+        if isinstance(pred, list):
+            funcs = [make_query(q) for q in pred]
+
+            def simple_query(nodes):
                 return __or(funcs, nodes)
-            elif isinstance(pred, tuple):
-                name, attrs = pred[0], pred[1:]
-                name_pred = __make_name_pred(name)
-                attrs_pred = __make_attrs_pred(attrs)
-                for n in nodes:
-                    if name_pred(n.name) and attrs_pred(n.attrs):
-                        results.append(n)
-            else:
-                name_pred = __make_name_pred(pred)
-                for n in nodes:
-                    if name_pred(n.name):
-                        results.append(n)
-            return results
+        elif isinstance(pred, tuple):
+            name_pred = __make_name_pred(pred[0])
+            attrs_pred = __make_attrs_pred(pred[1:])
+
+            def simple_query(nodes):
+                return [n for n in nodes if name_pred(n.name) and attrs_pred(n.attrs)]
+        else:
+            name_pred = __make_name_pred(pred)
+
+            def simple_query(nodes):
+                return [n for n in nodes if name_pred(n.name)]
         if len(args) > 1:
             return __compose(make_query(*args[1:]), simple_query)
         return simple_query
@@ -770,15 +846,21 @@ def select(*queries, **kwargs):
                 results.append(r)
         return results
 
-    def compiled_query(nodes):
+    query = make_query(*queries)
+    name_key = __name_key(queries[0]) if queries else None
+
+    def compiled_query(nodes, tree=None):
         """
         This is the compiled query that can be run against a configuration.
+        When `tree` is the node that `nodes` are the children of, deep
+        queries for a name only look at the nodes with that name.
         """
-        query = make_query(*queries)
-
         roots = kwargs.get("roots", True)
         if kwargs.get("deep", False):
-            results = deep_query(query, nodes)
+            if tree is not None and name_key is not None:
+                results = [c for c in tree.named(name_key) if query([c])]
+            else:
+                results = deep_query(query, nodes)
             if roots:
                 results = unique([r.root for r in results])
         elif roots:
@@ -2,7 +2,8 @@ from insights.configtree import startswith, istartswith
 from insights.configtree import endswith, iendswith
 from insights.configtree import contains, icontains
 from insights.configtree import eq, ieq, le, ile, lt, ilt, ge, ige, gt, igt
-from insights.configtree import first, last  # noqa: F401
+from insights.configtree import first, last, select  # noqa: F401
+from insights.configtree import Directive
 from insights.combiners.httpd_conf import _HttpdConf, HttpdConfTree
 from insights.combiners.httpd_conf import in_network, is_private
 from insights.tests import context_wrap
@@ -392,3 +393,38 @@ def test_directives_and_sections():
     assert len(result.sections) == 7
     assert len(result.find_all(startswith("Dir")).directives) == 1
     assert len(result.find_all(startswith("Dir")).sections) == 1
+
+
+def test_queries_are_cached():
+    assert select("VirtualHost", deep=True) is select("VirtualHost", deep=True)
+    assert select("VirtualHost", deep=True) is not select("VirtualHost")
+    assert select(["A", "B"]) is not select(("A", "B"))
+
+    query = ["Directory", "Alias"]
+    compiled = select(query)
+    query.append("FilesMatch")
+    assert select(["Directory", "Alias"]) is compiled
+    assert select(query) is not compiled
+
+
+def test_name_index():
+    httpd1 = _HttpdConf(context_wrap(HTTPD_CONF_NEST_1, path='/etc/httpd/conf/httpd.conf'))
+    httpd2 = _HttpdConf(context_wrap(HTTPD_CONF_NEST_3, path='/etc/httpd/conf.d/00-a.conf'))
+    httpd3 = _HttpdConf(context_wrap(HTTPD_CONF_NEST_4, path='/etc/httpd/conf.d/01-b.conf'))
+    result = HttpdConfTree([httpd1, httpd2, httpd3])
+    children = result.doc.children
+
+    for query in ["IfModule", ("IfModule", "!php5_module"), eq("ifmodule"), ieq("ifmodule")]:
+        for roots in (True, False):
+            expected = select(query, deep=True, roots=roots)(children)
+            assert result.select(query, deep=True, roots=roots).children == expected.children
+    assert result.find_all("IfModule", "RewriteEngine").children == \
+        select("IfModule", "RewriteEngine", deep=True, roots=False)(children).children
+    assert len(result.doc.named("ifmodule")) == len(result.find_all(ieq("IfModule")))
+
+    vhost = result.doc.children[-1]
+    count = len(result.find_all("Alias"))
+    vhost.children.append(Directive(name="Alias", attrs=["/new"]))
+    result.doc.clear_index()
+    assert len(result.find_all("Alias")) == count + 1
+    assert result.find("Alias", one=last).value == "/new"
@@ -1,3 +1,4 @@
+import bisect
 import datetime
 import io
 import json
@@ -8,6 +9,7 @@ import re
 import shlex
 import yaml
 import six
+import weakref
 from fnmatch import fnmatch
 
 from insights.configtree import from_dict, iniconfig, Root, select, first
@@ -17,8 +19,9 @@ from insights.contrib.ConfigParser import RawConfigParser
 from insights.parsers import ParseException, SkipException
 from insights.core.plugins import ContentException
 from insights.core.serde import deserializer, serializer
+from insights.core import dr
 from . import ls_parser
-from insights.util import deprecated
+from insights.util import deprecated, parallel_search, timestamps
 
 import sys
 # Since XPath expression is not supported by the ElementTree in Python 2.6,
@@ -30,6 +33,11 @@ if sys.version_info[0] == 2 and sys.version_info[1] <= 6:
 else:
     import xml.etree.ElementTree as ET
 
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
 log = logging.getLogger(__name__)
 
 
@@ -380,6 +388,10 @@ class ConfigCombiner(ConfigComponent):
         # flatten all content from nested includes into a main doc
         self.doc = Root(children=flatten(self.main.doc.children, include_finder))
 
+        # The includes changed the documents after they were searched
+        for conf in confs:
+            conf.doc.clear_index()
+
     def find_matches(self, confs, pattern):
         results = [c for c in confs if fnmatch(c.file_path, pattern)]
         return sorted(results, key=operator.attrgetter("file_name"))
@@ -686,7 +698,7 @@ class YAMLParser(Parser, LegacyItemAccess):
     """
     def parse_content(self, content):
         try:
-            if type(content) is list:
+            if isinstance(content, list):
                 self.data = yaml.safe_load('\n'.join(content))
             else:
                 self.data = yaml.safe_load(content)
@@ -720,6 +732,65 @@ class JSONParser(Parser, LegacyItemAccess):
         self.doc = from_dict(self.data)
 
 
+class _ScanCondition(object):
+    """
+    One condition of a declarative scanner: a test of a field of the scanned
+    object, or of the object itself when `field` is None.  Results are
+    remembered per value, since scanned data tends to repeat.
+    """
+    __slots__ = ("field", "op", "value", "check", "memo")
+
+    MEMO_SIZE = 4096
+
+    OPERATORS = {
+        "equals": lambda value: lambda v: v == value,
+        "contains": lambda value: lambda v: value in v,
+        "startswith": lambda value: lambda v: v.startswith(value),
+        "endswith": lambda value: lambda v: v.endswith(value),
+        "regex": lambda value: lambda v, s=re.compile(value).search: s(v) is not None,
+    }
+
+    def __init__(self, field, op, value):
+        self.field = field
+        self.op = op
+        self.value = value
+        self.check = self.OPERATORS[op](value)
+        self.memo = {}
+
+    @classmethod
+    def parse(cls, key, value):
+        """
+        Returns the condition for a scanner keyword: ``op`` applies to the
+        object itself, ``field__op`` to one of its fields and ``field`` tests
+        a field for equality.
+        """
+        if key in cls.OPERATORS:
+            return cls(None, key, value)
+        field, _, op = key.rpartition("__")
+        if field and op in cls.OPERATORS:
+            return cls(field, op, value)
+        return cls(key, "equals", value)
+
+    def test_value(self, v):
+        if v is None:
+            return False
+        try:
+            return self.memo[v]
+        except KeyError:
+            result = bool(self.check(v))
+            if len(self.memo) < self.MEMO_SIZE:
+                self.memo[v] = result
+            return result
+        except TypeError:
+            return bool(self.check(v))
+
+    def __call__(self, obj):
+        if self.field is None:
+            return self.test_value(obj)
+        get = getattr(obj, "get", None)
+        return self.test_value(get(self.field) if get else None)
+
+
 class ScanMeta(type):
     def __new__(cls, name, parents, dct):
         dct["scanners"] = []
@@ -784,6 +855,14 @@ class Scannable(six.with_metaclass(ScanMeta, Parser)):
     nothing is collected (so avoid returning empty lists, empty dicts, empty
     strings or False).
 
+    Scanners can also be declared as keyword conditions with `any_where()`
+    and `collect_where()`.  These are compiled together, so a condition shared
+    by several scanners is only tested once per object, and the result for a
+    value is remembered for the next object with the same value::
+
+        AnacondaLog.any_where('has_fcoe', contains='/usr/libexec/fcoe/fcoe_edd.sh')
+        Lsof.collect_where('root_devices', USER='root', NAME__startswith='/dev/')
+
     """
 
     @classmethod
@@ -828,6 +907,121 @@ class Scannable(six.with_metaclass(ScanMeta, Parser)):
 
         cls._scan(result_key, scanner)
 
+    @classmethod
+    def _scan_where(cls, kind, result_key, push_filter, conditions):
+        if not conditions:
+            raise ValueError("'%s' needs at least one condition" % result_key)
+        conditions = [_ScanCondition.parse(k, v) for k, v in sorted(conditions.items())]
+        if push_filter:
+            cls._push_filter(result_key, conditions)
+
+        def scanner(self, obj):
+            if not hasattr(self, result_key):
+                setattr(self, result_key, False if kind == "any" else [])
+            if all(c(obj) for c in conditions):
+                if kind == "any":
+                    setattr(self, result_key, True)
+                else:
+                    getattr(self, result_key).append(obj)
+
+        scanner.conditions = (kind, result_key, conditions)
+        cls._scan(result_key, scanner)
+
+    @classmethod
+    def _push_filter(cls, result_key, conditions):
+        """
+        Adds the longest string every object matching the conditions must
+        contain as a filter of the parser's datasource.
+        """
+        from insights.core.filters import add_filter
+        literals = [c.value for c in conditions
+                    if c.op != "regex" and isinstance(c.value, six.string_types) and c.value]
+        delegate = dr.get_delegate(cls)
+        if not literals or not (delegate and delegate.requires):
+            raise ValueError("'%s' can't be pushed down as a filter" % result_key)
+        add_filter(delegate.requires[0], max(literals, key=len))
+
+    @classmethod
+    def any_where(cls, result_key, push_filter=False, **conditions):
+        """
+        Sets the `result_key` to True if any object meets all of the
+        conditions, and False otherwise.
+
+        Each keyword is a condition.  ``field=value`` requires a field of the
+        object to equal value, and ``field__op=value`` applies one of the
+        operators ``equals``, ``contains``, ``startswith``, ``endswith`` or
+        ``regex`` to it.  A bare operator, like ``contains=value``, applies to
+        the object itself, for parsers that yield strings.
+
+        If `push_filter` is True, the longest string the conditions require
+        is added as a filter of the parser's datasource, so that collection
+        drops lines that can't match.  Only do this when the parser needs
+        nothing else from the datasource.
+        """
+        cls._scan_where("any", result_key, push_filter, conditions)
+
+    @classmethod
+    def collect_where(cls, result_key, push_filter=False, **conditions):
+        """
+        Sets the `result_key` to the list of objects that meet all of the
+        conditions.  The conditions and `push_filter` are the same as for
+        :meth:`any_where`.
+        """
+        cls._scan_where("collect", result_key, push_filter, conditions)
+
+    @classmethod
+    def _condition_plan(cls):
+        """
+        Returns the declarative scanners of the class as a list of distinct
+        conditions and a list of (kind, result_key, condition numbers), or
+        None if there aren't any.  The plan is cached on the class until
+        more scanners are registered.
+        """
+        cached = cls.__dict__.get("_cached_condition_plan")
+        if cached and cached[0] == len(cls.scanners):
+            return cached[1]
+
+        plan = None
+        declared = [s.conditions for s in cls.scanners if hasattr(s, "conditions")]
+        if declared:
+            distinct = []
+            numbers = {}
+            scans = []
+            for kind, result_key, conditions in declared:
+                nums = []
+                for c in conditions:
+                    key = (c.field, c.op, c.value)
+                    if key not in numbers:
+                        numbers[key] = len(distinct)
+                        distinct.append(c)
+                    nums.append(numbers[key])
+                scans.append((kind, result_key, nums))
+            plan = (distinct, scans)
+        cls._cached_condition_plan = (len(cls.scanners), plan)
+        return plan
+
+    def _start_conditions(self, plan):
+        for kind, result_key, _ in plan[1]:
+            setattr(self, result_key, False if kind == "any" else [])
+
+    def _run_conditions(self, plan, obj):
+        conditions, scans = plan
+        results = [None] * len(conditions)
+        for kind, result_key, nums in scans:
+            if kind == "any" and getattr(self, result_key):
+                continue
+            for n in nums:
+                result = results[n]
+                if result is None:
+                    result = results[n] = conditions[n](obj)
+                if not result:
+                    break
+            else:
+                if kind == "any":
+                    setattr(self, result_key, True)
+                else:
+                    getattr(self, result_key).append(obj)
+
     def parse(self, content):
         """
         Default 'parsing' method. Subclasses should override this method with
@@ -837,11 +1031,252 @@ class Scannable(six.with_metaclass(ScanMeta, Parser)):
             yield line
 
     def parse_content(self, content):
+        plan = self._condition_plan()
+        scanners = self.scanners
+        if plan:
+            self._start_conditions(plan)
+            scanners = [s for s in scanners if not hasattr(s, "conditions")]
         for obj in self.parse(content):
-            for scanner in self.scanners:
+            if plan:
+                self._run_conditions(plan, obj)
+            for scanner in scanners:
                 scanner(self, obj)
 
 
+class LineIndex(object):
+    """
+    Postings of the line numbers that contain given strings, used by
+    :class:`LogFileOutput` when its ``indexed`` attribute is set.
+
+    Postings for the `seeds`, normally the filters of the datasource, are
+    built together in one pass over the lines. Postings for any other string
+    are built the first time it's searched for. If an indexed string is a
+    substring of the one being searched for, only the lines in its postings
+    are scanned.
+
+    Parameters:
+        lines (list): the lines to index.
+        seeds (iterable): strings to index up front.
+    """
+    def __init__(self, lines, seeds=None):
+        self.lines = lines
+        self.postings = {}
+        seeds = sorted(set(w for w in (seeds or []) if w))
+        if seeds:
+            for w in seeds:
+                self.postings[w] = []
+            prefilter = re.compile("|".join(re.escape(w) for w in seeds))
+            for i, l in enumerate(lines):
+                if prefilter.search(l):
+                    for w in seeds:
+                        if w in l:
+                            self.postings[w].append(i)
+
+    def lookup(self, word):
+        """
+        Returns the sorted list of the numbers of the lines that contain word.
+        """
+        if word in self.postings:
+            return self.postings[word]
+
+        candidates = None
+        for w in self.postings:
+            if w in word and (candidates is None or len(self.postings[w]) < len(candidates)):
+                candidates = self.postings[w]
+        if candidates is None:
+            candidates = range(len(self.lines))
+        lines = self.lines
+        result = self.postings[word] = [i for i in candidates if word in lines[i]]
+        return result
+
+    def search(self, words):
+        """
+        Returns the sorted list of the numbers of the lines that contain all of
+        the words.
+        """
+        postings = sorted((self.lookup(w) for w in words), key=len)
+        if len(postings) == 1:
+            return postings[0]
+        others = [set(p) for p in postings[1:]]
+        return [i for i in postings[0] if all(i in o for o in others)]
+
+
+def _compile_time_format(time_format):
+    """
+    Converts a ``LogFileOutput.time_format`` into ``(time_re, parse_fn,
+    logs_have_year)``: a regular expression that finds the time stamp in a
+    line, a function that turns the matched text into a datetime, and whether
+    the format includes the year.
+    """
+    # Annoyingly, strptime insists that it get the whole time string and
+    # nothing but the time string.  However, for most logs we only have a
+    # string with the timestamp in it.  We can't just catch the ValueError
+    # because at that point we do not actually have a valid datetime
+    # object.  So we convert the time format string to a regex, use that
+    # to find just the timestamp, and then use strptime on that.  Thanks,
+    # Python.  All these need to cope with different languages and
+    # character sets.  Note that we don't include time zone or other
+    # outputs (e.g. day-of-year) that don't usually occur in time stamps.
+    format_conversion_for = {
+        'a': r'\w{3}', 'A': r'\w+',  # Week day name
+        'w': r'[0123456]',  # Week day number
+        'd': r'([0 ][123456789]|[12]\d|3[01])',  # Day of month
+        'b': r'\w{3}', 'B': r'\w+',  # Month name
+        'm': r'([0 ]\d|1[012])',  # Month number
+        'y': r'\d{2}', 'Y': r'\d{4}',  # Year
+        'H': r'([01 ]\d|2[0123])',  # Hour - 24 hour format
+        'I': r'([0 ]?\d|1[012])',  # Hour - 12 hour format
+        'p': r'\w{2}',  # AM / PM
+        'M': r'([012345]\d)',  # Minutes
+        'S': r'([012345]\d|60)',  # Seconds, including leap second
+        'f': r'\d{6}',  # Microseconds
+    }
+
+    # Construct the regex from the time string
+    timefmt_re = re.compile(r'%(\w)')
+
+    def replacer(match):
+        if match.group(1) in format_conversion_for:
+            return format_conversion_for[match.group(1)]
+        else:
+            raise ParseException(
+                "get_after does not understand strptime format '{c}'".format(
+                    c=match.group(0)
+                )
+            )
+
+    # Please do not attempt to be tricky and put a regular expression
+    # inside your time format, as we are going to also use it in
+    # strptime too and that may not work out so well.
+
+    # Check time_format - must be string or list.  Set the 'logs_have_year'
+    # flag and timestamp parser function appropriately.
+    # Grab values of dict as a list first
+    if isinstance(time_format, dict):
+        time_format = list(time_format.values())
+    if isinstance(time_format, six.string_types):
+        logs_have_year = ('%Y' in time_format or '%y' in time_format)
+        time_re = re.compile('(' + timefmt_re.sub(replacer, time_format) + ')')
+
+        # A parser equivalent to strptime with the time_format string.
+        parse_fn = timestamps.get_parser(time_format)
+    elif isinstance(time_format, list):
+        logs_have_year = all('%Y' in tf or '%y' in tf for tf in time_format)
+        time_re = re.compile('(' + '|'.join(
+            timefmt_re.sub(replacer, tf) for tf in time_format
+        ) + ')')
+
+        parsers = [timestamps.get_parser(tf) for tf in time_format]
+
+        def test_all_parsers(logstamp):
+            # One of these must match, because the regex has selected only
+            # strings that will match.
+            for parse in parsers:
+                try:
+                    ts = parse(logstamp)
+                except ValueError:
+                    pass
+            return ts
+        parse_fn = test_all_parsers
+    else:
+        raise ParseException(
+            "get_after does not recognise time formats of type {t}".format(
+                t=type(time_format)
+            )
+        )
+    return time_re, parse_fn, logs_have_year
+
+
+class _TimestampColumn(object):
+    """
+    The time stamps of a list of log lines, parsed on first access and
+    remembered.  Lines without a time stamp have ``None``.
+    """
+    _unparsed = object()
+
+    def __init__(self, lines, time_re, parse_fn):
+        self.lines = lines
+        self.time_re = time_re
+        self.parse_fn = parse_fn
+        self.stamps = [self._unparsed] * len(lines)
+        self.ordered = None
+        self._stamped = None
+
+    def __getitem__(self, i):
+        stamp = self.stamps[i]
+        if stamp is self._unparsed:
+            match = self.time_re.search(self.lines[i])
+            stamp = self.stamps[i] = self.parse_fn(match.group(0)) if match else None
+        return stamp
+
+    def is_ordered(self):
+        """
+        Returns True if the time stamps never decrease from one line to the
+        next.  All time stamps are parsed the first time this is called.
+        """
+        if self.ordered is None:
+            stamped = [(self[i], i) for i in six.moves.range(len(self.lines)) if self[i] is not None]
+            self.ordered = all(a[0] <= b[0] for a, b in zip(stamped, stamped[1:]))
+            self._stamped = ([t for t, _ in stamped], [i for _, i in stamped])
+        return self.ordered
+
+    def first_at_or_after(self, timestamp):
+        """
+        Returns the index of the first line whose time stamp is at or after
+        timestamp, or the number of lines if there is none.  Only meaningful
+        when :meth:`is_ordered` is True.
+        """
+        times, indices = self._stamped
+        pos = bisect.bisect_left(times, timestamp)
+        return indices[pos] if pos < len(indices) else len(self.lines)
+
+
+class LogRecord(Mapping):
+    """
+    A read only dictionary view of one log line, returned by the searches of
+    :class:`LogFileOutput` when its ``lazy_records`` attribute is set.  Only
+    the raw line is kept until a field other than ``raw_message`` is looked
+    up, at which point the line is parsed by the parser's ``_parse_line``.
+
+    Records compare equal to the dictionaries ``_parse_line`` returns and
+    are pickled as plain dictionaries.
+    """
+    __slots__ = ("raw_message", "_parse", "_fields")
+
+    def __init__(self, line, parse):
+        self.raw_message = line
+        self._parse = parse
+        self._fields = None
+
+    @property
+    def fields(self):
+        """ The dictionary of parsed fields. """
+        if self._fields is None:
+            self._fields = self._parse(self.raw_message)
+            self._parse = None
+        return self._fields
+
+    def __getitem__(self, key):
+        if key == "raw_message" and self._fields is None:
+            return self.raw_message
+        return self.fields[key]
+
+    def __contains__(self, key):
+        return key in self.fields
+
+    def __iter__(self):
+        return iter(self.fields)
+
+    def __len__(self):
+        return len(self.fields)
+
+    def __repr__(self):
+        return repr(self.fields)
+
+    def __reduce__(self):
+        return (dict, (self.fields,))
+
+
 class LogFileOutput(six.with_metaclass(ScanMeta, Parser)):
     """
     Class for parsing log file content.
@@ -899,22 +1334,138 @@ class LogFileOutput(six.with_metaclass(ScanMeta, Parser)):
       allows the item keys to provide some form of documentation.
     """
 
+    indexed = False
+    """
+    Set to True in a subclass, or on the class at run time, to answer `get`,
+    `in` and `get_after` searches from a :class:`LineIndex` built on the
+    first search.  It is seeded with the filters of the parser's datasource,
+    which is worthwhile for logs that are searched many times.
+    """
+
+    search_workers = None
+    """
+    Set to a number of processes in a subclass, or on the class at run time,
+    to split `get` and `in` searches of long logs across that many forked
+    workers with :mod:`insights.util.parallel_search`.  Logs shorter than
+    its ``MIN_LINES`` are still searched in a single process.
+    """
+
+    lazy_records = False
+    """
+    Set to True in a subclass, or on the class at run time, to have `get`,
+    `get_after` and `keep_scan` return :class:`LogRecord` objects that parse
+    each line only when one of its fields is first used, instead of
+    dictionaries.
+    """
+
+    _line_indexes = weakref.WeakKeyDictionary()
+    _timestamp_columns = weakref.WeakKeyDictionary()
+
     def parse_content(self, content):
         """
         Use all the defined scanners to search the log file, setting the
         properties defined in the scanner.
         """
         self.lines = content
+        self._run_scanners()
+
+    def _run_scanners(self):
+        """
+        Runs the registered scanners. Those registered with `token_scan` and
+        `keep_scan` are evaluated together in a single pass over the lines
+        unless the class overrides the methods they rely on. Other scanners
+        are then called in the order they were registered.
+        """
+        plan = self._scan_plan()
+        if plan:
+            self._run_fused_scanners(*plan)
         for scanner in self.scanners:
-            scanner(self)
+            if not (plan and getattr(scanner, "search", None)):
+                scanner(self)
+
+    @classmethod
+    def _scan_plan(cls):
+        """
+        Compiles the `token_scan` and `keep_scan` scanners of the class into
+        a prefilter that matches any of their search words plus the list of
+        searches. The plan is cached on the class until more scanners are
+        registered.
+        """
+        cached = cls.__dict__.get("_fused_scan_plan")
+        if cached and cached[0] == len(cls.scanners):
+            return cached[1]
+
+        plan = None
+        fusable = all(six.get_unbound_function(getattr(cls, m)) is
+                      six.get_unbound_function(getattr(LogFileOutput, m))
+                      for m in ("get", "__contains__", "_valid_search"))
+        searches = [s.search for s in cls.scanners if getattr(s, "search", None)]
+        if fusable and searches:
+            words = set()
+            for _, _, token in searches:
+                words.update([token] if isinstance(token, six.string_types) else token)
+            words = sorted(words, key=len, reverse=True)
+            plan = (re.compile("|".join(re.escape(w) for w in words)), searches)
+        cls._fused_scan_plan = (len(cls.scanners), plan)
+        return plan
+
+    def _run_fused_scanners(self, prefilter, searches):
+        tokens = []
+        keeps = []
+        for kind, result_key, token in searches:
+            match = self._valid_search(token)
+            if kind == "token":
+                setattr(self, result_key, False)
+                tokens.append((result_key, match))
+            else:
+                setattr(self, result_key, [])
+                keeps.append((getattr(self, result_key), match))
+
+        for line in self.lines:
+            if not prefilter.search(line):
+                continue
+            if tokens:
+                found = [t for t in tokens if t[1](line)]
+                for t in found:
+                    setattr(self, t[0], True)
+                    tokens.remove(t)
+            for results, match in keeps:
+                if match(line):
+                    results.append(self._record(line))
+            if not tokens and not keeps:
+                break
 
     def __contains__(self, s):
         """
         Returns true if any line contains the given text string.
         """
         search_by_expression = self._valid_search(s)
+        if self.indexed and s is not None:
+            return bool(self._search_index(s))
+        if self.search_workers and s is not None:
+            return parallel_search.contains(self.lines, s, self.search_workers)
         return any(search_by_expression(l) for l in self.lines)
 
+    def _index_seeds(self):
+        """
+        Returns the filters of the datasource the parser depends on.
+        """
+        from insights.core.filters import get_filters
+        delegate = dr.get_delegate(type(self))
+        if delegate and delegate.requires:
+            return get_filters(delegate.requires[0])
+        return set()
+
+    def _search_index(self, s):
+        """
+        Returns the sorted numbers of the lines matching `s`, which must have
+        been validated by `_valid_search`.
+        """
+        index = self._line_indexes.get(self)
+        if index is None or index.lines is not self.lines:
+            index = self._line_indexes[self] = LineIndex(self.lines, self._index_seeds())
+        return index.search([s] if isinstance(s, six.string_types) else s)
+
     def _parse_line(self, line):
         """
         Parse the line into a dictionary and return it. Only wrap with
@@ -922,6 +1473,15 @@ class LogFileOutput(six.with_metaclass(ScanMeta, Parser)):
         """
         return {'raw_message': line}
 
+    def _record(self, line):
+        """
+        Returns the result for a matching line: a :class:`LogRecord` if
+        `lazy_records` is set, otherwise the dictionary from `_parse_line`.
+        """
+        if self.lazy_records:
+            return LogRecord(line, self._parse_line)
+        return self._parse_line(line)
+
     def _valid_search(self, s):
         """
         Check this given `s`, it must be a string or a list of strings.
@@ -950,11 +1510,56 @@ class LogFileOutput(six.with_metaclass(ScanMeta, Parser)):
         """
         ret = []
         search_by_expression = self._valid_search(s)
+        if self.indexed and s is not None:
+            lines = self.lines
+            return [self._record(lines[i]) for i in self._search_index(s)]
+        if self.search_workers and s is not None:
+            lines = self.lines
+            return [self._record(lines[i]) for i in parallel_search.search(lines, s, self.search_workers)]
         for l in self.lines:
             if search_by_expression(l):
-                ret.append(self._parse_line(l))
+                ret.append(self._record(l))
         return ret
 
+    def get_columns(self, s=None, fields=None):
+        """
+        Returns the lines that contain `s` as columns rather than rows: a
+        dictionary mapping each field of the parsed lines to a list with one
+        value per line, or ``None`` where a line lacks that field.  Only the
+        lists are kept, which is much smaller than a dictionary per line when
+        many lines match.
+
+        Parameters:
+            s(str or list): one or more strings to search for.
+                If not supplied, all lines are used.
+            fields(list): the fields to return.  If not supplied, every
+                field found in the lines is returned.
+
+        Returns:
+            (dict): field names mapped to lists of the same length.
+        """
+        search_by_expression = self._valid_search(s)
+        if s is None:
+            lines = self.lines
+        elif self.indexed:
+            lines = [self.lines[i] for i in self._search_index(s)]
+        else:
+            lines = [l for l in self.lines if search_by_expression(l)]
+
+        if fields is not None and list(fields) == ['raw_message']:
+            return {'raw_message': list(lines)}
+
+        columns = dict((f, []) for f in fields) if fields is not None else {}
+        for count, line in enumerate(lines):
+            info = self._parse_line(line)
+            if fields is None:
+                for k in info:
+                    if k not in columns:
+                        columns[k] = [None] * count
+            for k, column in columns.items():
+                column.append(info.get(k))
+        return columns
+
     @classmethod
     def scan(cls, result_key, func):
         """
@@ -983,6 +1588,7 @@ class LogFileOutput(six.with_metaclass(ScanMeta, Parser)):
             return token in self
 
         cls.scan(result_key, _scan)
+        cls.scanners[-1].search = ("token", result_key, token)
 
     @classmethod
     def keep_scan(cls, result_key, token):
@@ -994,6 +1600,7 @@ class LogFileOutput(six.with_metaclass(ScanMeta, Parser)):
             return self.get(token)
 
         cls.scan(result_key, _scan)
+        cls.scanners[-1].search = ("keep", result_key, token)
 
     def get_after(self, timestamp, s=None):
         """
@@ -1043,6 +1650,12 @@ class LogFileOutput(six.with_metaclass(ScanMeta, Parser)):
             more likely to be in the sought range.  This paragraph is sponsored
             by syslog.
 
+        The time stamp of each line is parsed only once per object and kept
+        for later calls.  When the format includes the year and the time
+        stamps are in order, lines before the sought time are skipped with a
+        binary search instead of being scanned.  Logs whose time stamps are
+        out of order are always scanned from the start.
+
         Parameters:
             timestamp(datetime.datetime): lines before this time are ignored.
             s(str or list): one or more strings to search for.
@@ -1060,105 +1673,40 @@ class LogFileOutput(six.with_metaclass(ScanMeta, Parser)):
                 made to recognise or parse the time zone or other obscure
                 values like day of year or week of year.
         """
-        time_format = self.time_format
-
-        # Annoyingly, strptime insists that it get the whole time string and
-        # nothing but the time string.  However, for most logs we only have a
-        # string with the timestamp in it.  We can't just catch the ValueError
-        # because at that point we do not actually have a valid datetime
-        # object.  So we convert the time format string to a regex, use that
-        # to find just the timestamp, and then use strptime on that.  Thanks,
-        # Python.  All these need to cope with different languages and
-        # character sets.  Note that we don't include time zone or other
-        # outputs (e.g. day-of-year) that don't usually occur in time stamps.
-        format_conversion_for = {
-            'a': r'\w{3}', 'A': r'\w+',  # Week day name
-            'w': r'[0123456]',  # Week day number
-            'd': r'([0 ][123456789]|[12]\d|3[01])',  # Day of month
-            'b': r'\w{3}', 'B': r'\w+',  # Month name
-            'm': r'([0 ]\d|1[012])',  # Month number
-            'y': r'\d{2}', 'Y': r'\d{4}',  # Year
-            'H': r'([01 ]\d|2[0123])',  # Hour - 24 hour format
-            'I': r'([0 ]?\d|1[012])',  # Hour - 12 hour format
-            'p': r'\w{2}',  # AM / PM
-            'M': r'([012345]\d)',  # Minutes
-            'S': r'([012345]\d|60)',  # Seconds, including leap second
-            'f': r'\d{6}',  # Microseconds
-        }
-
-        # Construct the regex from the time string
-        timefmt_re = re.compile(r'%(\w)')
+        time_re, parse_fn, logs_have_year = self._time_parser()
+        stamps = self._timestamp_column(time_re, parse_fn)
 
-        def replacer(match):
-            if match.group(1) in format_conversion_for:
-                return format_conversion_for[match.group(1)]
-            else:
-                raise ParseException(
-                    "get_after does not understand strptime format '{c}'".format(
-                        c=match.group(0)
-                    )
-                )
-
-        # Please do not attempt to be tricky and put a regular expression
-        # inside your time format, as we are going to also use it in
-        # strptime too and that may not work out so well.
-
-        # Check time_format - must be string or list.  Set the 'logs_have_year'
-        # flag and timestamp parser function appropriately.
-        # Grab values of dict as a list first
-        if isinstance(time_format, dict):
-            time_format = list(time_format.values())
-        if isinstance(time_format, six.string_types):
-            logs_have_year = ('%Y' in time_format or '%y' in time_format)
-            time_re = re.compile('(' + timefmt_re.sub(replacer, time_format) + ')')
-
-            # Curry strptime with time_format string.
-            def test_parser(logstamp):
-                return datetime.datetime.strptime(logstamp, time_format)
-            parse_fn = test_parser
-        elif isinstance(time_format, list):
-            logs_have_year = all('%Y' in tf or '%y' in tf for tf in time_format)
-            time_re = re.compile('(' + '|'.join(
-                timefmt_re.sub(replacer, tf) for tf in time_format
-            ) + ')')
-
-            def test_all_parsers(logstamp):
-                # One of these must match, because the regex has selected only
-                # strings that will match.
-                for tf in time_format:
-                    try:
-                        ts = datetime.datetime.strptime(logstamp, tf)
-                    except ValueError:
-                        pass
-                return ts
-            parse_fn = test_all_parsers
+        eleven_months = datetime.timedelta(days=330)
+        search_by_expression = self._valid_search(s)
+        lines = self.lines
+        candidates = None
+        if s and self.indexed:
+            candidates = self._search_index(s)
+            s = None
+
+        # Logs with a year whose time stamps are known to be in order can
+        # skip straight to the first line at or after the timestamp. Every
+        # earlier line with a time stamp is earlier than it, so nothing
+        # before that point would be included anyway.
+        start = 0
+        if logs_have_year and (not s or stamps.ordered is not None):
+            if stamps.is_ordered():
+                start = stamps.first_at_or_after(timestamp)
+
+        if candidates is not None:
+            indices = candidates[bisect.bisect_left(candidates, start):]
         else:
-            raise ParseException(
-                "get_after does not recognise time formats of type {t}".format(
-                    t=type(time_format)
-                )
-            )
-
-        # Most logs will appear in string format, but some logs (e.g.
-        # Messages) are available in list-of-dicts format.  So we choose one
-        # of two 'date_compare' functions.  HOWEVER: we still have to check
-        # the string found for a valid date, because log parsing often fails.
-        # Because of generators, we check this per line
+            indices = six.moves.range(start, len(lines))
 
-        # Now try to find the time stamp in each log line and add lines to
-        # our output if they are currently being included in the log.
-
-        eleven_months = datetime.timedelta(days=330)
         including_lines = False
-        search_by_expression = self._valid_search(s)
-        for line in self.lines:
+        for i in indices:
+            line = lines[i]
             # If `s` is not None, keywords must be found in the line
             if s and not search_by_expression(line):
                 continue
             # Otherwise, search all lines
-            match = time_re.search(line)
-            if match:
-                logstamp = parse_fn(match.group(0))
+            logstamp = stamps[i]
+            if logstamp is not None:
                 if not logs_have_year:
                     # Substitute timestamp year for logstamp year
                     logstamp = logstamp.replace(year=timestamp.year)
@@ -1173,14 +1721,74 @@ class LogFileOutput(six.with_metaclass(ScanMeta, Parser)):
                 if logstamp >= timestamp:
                     # Later - include
                     including_lines = True
-                    yield self._parse_line(line)
+                    yield self._record(line)
                 else:
                     # Earlier - start excluding
                     including_lines = False
             else:
                 # If we're including lines, add this continuation line
                 if including_lines:
-                    yield self._parse_line(line)
+                    yield self._record(line)
+
+    def line_timestamps(self):
+        """
+        Returns the time stamp of each line as a ``datetime.datetime``, or
+        ``None`` for lines without one, parsed with the object's
+        ``time_format``.  The time stamps are parsed once per object and
+        shared with :meth:`get_after`.  See :attr:`timestamps_have_year` for
+        what the year of each time stamp means.
+
+        Returns:
+            (list): one time stamp or ``None`` for each of the lines.
+        """
+        time_re, parse_fn, _ = self._time_parser()
+        column = self._timestamp_column(time_re, parse_fn)
+        return [column[i] for i in six.moves.range(len(self.lines))]
+
+    @property
+    def timestamps_have_year(self):
+        """
+        bool: Whether the ``time_format`` includes the year.  When it
+        doesn't, the years of the :meth:`line_timestamps` are placeholders.
+        """
+        return self._time_parser()[2]
+
+    def _time_parser(self):
+        """
+        Returns ``(time_re, parse_fn, logs_have_year)`` for the object's
+        ``time_format``.  They are built once per format and cached on the
+        class.
+        """
+        time_format = self.time_format
+        if isinstance(time_format, dict):
+            key = tuple(time_format.values())
+        elif isinstance(time_format, list):
+            key = tuple(time_format)
+        else:
+            key = time_format
+
+        cls = type(self)
+        cache = cls.__dict__.get("_time_parsers")
+        if cache is None:
+            cache = cls._time_parsers = {}
+        try:
+            return cache[key]
+        except (KeyError, TypeError):
+            pass
+        result = _compile_time_format(time_format)
+        cache[key] = result
+        return result
+
+    def _timestamp_column(self, time_re, parse_fn):
+        """
+        Returns the :class:`_TimestampColumn` of the lines for the given time
+        parser, creating it if needed.  Time stamps are parsed at most once
+        per line for the life of the object.
+        """
+        column = self._timestamp_columns.get(self)
+        if column is None or column.lines is not self.lines or column.time_re is not time_re:
+            column = self._timestamp_columns[self] = _TimestampColumn(self.lines, time_re, parse_fn)
+        return column
 
 
 class Syslog(LogFileOutput):
@@ -1252,7 +1860,7 @@ class Syslog(LogFileOutput):
             if len(info_splits) == 5:
                 logstamp = ' '.join(info_splits[:3])
                 try:
-                    datetime.datetime.strptime(logstamp, self.time_format)
+                    timestamps.strptime(logstamp, self.time_format)
                 except ValueError:
                     return msg_info
                 msg_info['timestamp'] = logstamp
@@ -1484,6 +2092,7 @@ class FileListing(Parser):
         the content.
         """
         self.listings = ls_parser.parse(content, self.first_path)
+        self._path_tree = None
 
         # No longer need the first path found, if any.
         delattr(self, 'first_path')
@@ -1548,16 +2157,88 @@ class FileListing(Parser):
         """
         if path[0] != '/':
             return None
-        path_parts = path.split('/')
-        # Note that here the first element will be '' because it's before the
-        # first separator.  That's OK, the join puts it back together.
-        directory = '/'.join(path_parts[:-1])
-        name = path_parts[-1]
+        directory, _, name = path.rpartition('/')
         if directory not in self.listings:
             return None
-        if name not in self.listings[directory]['entries']:
+        entries = self.listings[directory]['entries']
+        if name not in entries:
             return None
-        return self.listings[directory]['entries'][name]
+        return entries[name]
+
+    def _tree(self):
+        """
+        Returns the trie of the listed directories, a dict of dicts keyed
+        on path component.  The ``None`` key of a node holds the name of the
+        listing at that path, if there is one.
+        """
+        if self._path_tree is None:
+            tree = {}
+            for directory in self.listings:
+                if not directory or directory[0] != '/':
+                    continue
+                node = tree
+                for part in directory.split('/'):
+                    if part:
+                        node = node.setdefault(part, {})
+                node[None] = directory
+            self._path_tree = tree
+        return self._path_tree
+
+    def listings_under(self, directory):
+        """
+        The sorted names of the listed directories at or beneath the given
+        directory.
+        """
+        node = self._tree()
+        for part in directory.split('/'):
+            if part:
+                node = node.get(part)
+                if node is None:
+                    return []
+        found = []
+        pending = [node]
+        while pending:
+            node = pending.pop()
+            for key, value in node.items():
+                if key is None:
+                    found.append(value)
+                else:
+                    pending.append(value)
+        return sorted(found)
+
+    def scan(self, *queries):
+        """
+        Finds the entries matching each query in one pass over all of the
+        listings.  The '.' and '..' entries are skipped.
+
+        Parameters:
+            queries: names from :data:`insights.core.ls_parser.QUERIES`, such
+                as ``'world_writable'`` or ``'setuid'``, or functions taking
+                an :class:`insights.core.ls_parser.Entry` and returning
+                True for the entries to find.
+
+        Returns:
+            dict: The sorted paths of the matching entries, keyed on query.
+
+        Examples:
+            >>> file_listing.scan('world_writable', 'setuid')['setuid']
+            ['/usr/bin/passwd', '/usr/bin/su']
+        """
+        tests = [(q, ls_parser.QUERIES[q] if isinstance(q, six.string_types) else q) for q in queries]
+        found = dict((q, []) for q in queries)
+        for directory, listing in self.listings.items():
+            if not directory:
+                continue
+            prefix = '' if directory == '/' else directory
+            for name, entry in listing['entries'].records.items():
+                if name in ('.', '..'):
+                    continue
+                for query, test in tests:
+                    if test(entry):
+                        found[query].append(prefix + '/' + name)
+        for paths in found.values():
+            paths.sort()
+        return found
 
 
 class AttributeDict(dict):
@@ -4,13 +4,13 @@ import logging
 import os
 import tempfile
 from contextlib import contextmanager
-from insights.util import fs, subproc
+from insights.util import fs, subproc, which
 from insights.util.content_type import from_file as content_type_from_file
 
 logger = logging.getLogger(__name__)
 
 
-COMPRESSION_TYPES = ("zip", "tar", "gz", "bz2", "xz")
+COMPRESSION_TYPES = ("zip", "tar", "gz", "bz2", "xz", "zst")
 
 
 class InvalidArchive(Exception):
@@ -43,8 +43,9 @@ class ZipExtractor(object):
 
 class TarExtractor(object):
 
-    def __init__(self, timeout=None):
+    def __init__(self, timeout=None, parallel=False):
         self.timeout = timeout
+        self.parallel = parallel
         self.tmp_dir = None
         self.created_tmp_dir = False
 
@@ -53,13 +54,30 @@ class TarExtractor(object):
         "application/x-gzip": "-z",
         "application/gzip": "-z",
         "application/x-bzip2": "-j",
+        "application/zstd": "--use-compress-program=zstd",
+        "application/x-zstd": "--use-compress-program=zstd",
         "application/x-tar": ""
     }
 
+    PARALLEL_PROGRAMS = {
+        "application/x-xz": "pixz",
+        "application/x-gzip": "pigz",
+        "application/gzip": "pigz",
+        "application/x-bzip2": "pbzip2",
+    }
+    """
+    Multi-threaded decompressors used instead of the TAR_FLAGS when
+    ``parallel`` is set and the program is installed.
+    """
+
     def _tar_flag_for_content_type(self, content_type):
         flag = self.TAR_FLAGS.get(content_type)
         if flag is None:
             raise InvalidContentType(content_type)
+        if self.parallel:
+            program = self.PARALLEL_PROGRAMS.get(content_type)
+            if program and which(program):
+                return "--use-compress-program=%s" % program
         return flag
 
     def from_path(self, path, extract_dir=None, content_type=None):
@@ -93,7 +111,7 @@ class Extraction(object):
 
 
 @contextmanager
-def extract(path, timeout=None, extract_dir=None, content_type=None):
+def extract(path, timeout=None, extract_dir=None, content_type=None, parallel=False):
     """
     Extract path into a temporary directory in `extract_dir`.
 
@@ -102,12 +120,15 @@ def extract(path, timeout=None, extract_dir=None, content_type=None):
 
     If the extraction takes longer than `timeout` seconds, the temporary path
     is removed, and an exception is raised.
+
+    If `parallel` is True, tar archives are decompressed with a multi-threaded
+    program when one is installed for the compression type.
     """
     content_type = content_type or content_type_from_file(path)
     if content_type == "application/zip":
         extractor = ZipExtractor(timeout=timeout)
     else:
-        extractor = TarExtractor(timeout=timeout)
+        extractor = TarExtractor(timeout=timeout, parallel=parallel)
 
     try:
         ctx = extractor.from_path(path, extract_dir=extract_dir, content_type=content_type)
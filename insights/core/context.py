@@ -127,7 +127,22 @@ class ExecutionContext(object):
     def __init__(self, root="/", timeout=None, all_files=None):
         self.root = root
         self.timeout = timeout
-        self.all_files = all_files or []
+        self.all_files = all_files
+
+    @property
+    def all_files(self):
+        """
+        The files of the archive the context was created for. If the context
+        was given a callable instead of a list, it's called the first time the
+        files are needed.
+        """
+        if callable(self._all_files):
+            self._all_files = self._all_files() or []
+        return self._all_files
+
+    @all_files.setter
+    def all_files(self, value):
+        self._all_files = value if value is not None else []
 
     def check_output(self, cmd, timeout=None, keep_rc=False, env=None):
         """ Subclasses can override to provide special
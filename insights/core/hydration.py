@@ -1,5 +1,6 @@
 import logging
 import os
+from functools import partial
 from itertools import product
 
 from insights.core import archives
@@ -20,11 +21,45 @@ def get_all_files(path):
     return all_files
 
 
+MARKERS = [("insights_archive.txt", SerializedArchiveContext),
+           ("insights_commands", HostArchiveContext),
+           ("sos_commands", SosArchiveContext),
+           ("JBOSS_HOME", JDRContext)]
+"""
+Names whose presence in an archive identifies its context, in priority order.
+"""
+
+
+def probe(path, max_depth=3):
+    """
+    Looks for the archive markers directly beneath path without listing the
+    whole tree. Directories are visited breadth first, and the search stops at
+    the first directory containing a marker or after max_depth levels.
+
+    Returns:
+        (common_path, context) or (None, None) if no marker was found.
+    """
+    level = [path]
+    for _ in range(max_depth + 1):
+        next_level = []
+        for d in level:
+            try:
+                names = set(os.listdir(d))
+            except OSError:
+                continue
+            for m, ctx in MARKERS:
+                if m in names:
+                    return d, ctx
+            for n in sorted(names):
+                p = os.path.join(d, n)
+                if os.path.isdir(p) and not os.path.islink(p):
+                    next_level.append(p)
+        level = next_level
+    return None, None
+
+
 def identify(files):
-    markers = {"insights_archive.txt": SerializedArchiveContext,
-               "insights_commands": HostArchiveContext,
-               "sos_commands": SosArchiveContext,
-               "JBOSS_HOME": JDRContext}
+    markers = dict(MARKERS)
 
     for f, m in product(files, markers):
         if m in f:
@@ -46,10 +81,15 @@ def create_context(path, context=None):
     if arc:
         return ClusterArchiveContext(path, all_files=arc)
 
-    all_files = get_all_files(path)
-    if not all_files:
-        raise archives.InvalidArchive("No files in archive")
+    common_path, ctx = probe(path)
+    if common_path is not None:
+        # the full listing is only built if something asks for it.
+        all_files = partial(get_all_files, path)
+    else:
+        all_files = get_all_files(path)
+        if not all_files:
+            raise archives.InvalidArchive("No files in archive")
+        common_path, ctx = identify(all_files)
 
-    common_path, ctx = identify(all_files)
     context = context or ctx
     return context(common_path, all_files=all_files)
@@ -1,9 +1,33 @@
 """
 This module contains logic for parsing ls output. It attempts to handle
 output when selinux is enabled or disabled and also skip "bad" lines.
+
+The entries of each directory are parsed into compact :class:`Entry` tuples
+the first time the directory is used, and the dictionary for an entry is
+only made when it's looked up.
 """
+from collections import namedtuple
+
 import six
 
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+FIELDS = ("links", "owner", "group", "size", "major", "minor", "date", "name",
+          "link", "se_user", "se_role", "se_type", "se_mls")
+"""
+The fields parsed from the part of an ls line after the permission bits, in
+the order the ``_parse_*`` helpers return them.  Fields a line doesn't have
+are ``None``.
+"""
+
+SELINUX_FIELDS = set(["se_user", "se_role", "se_type", "se_mls"])
+
+Entry = namedtuple("Entry", ["type", "perms"] + list(FIELDS) + ["raw_entry"])
+"""namedtuple: A parsed ls line, with ``None`` for the fields it doesn't have."""
+
 
 def parse_path(path):
     """
@@ -20,49 +44,68 @@ def parse_path(path):
     return path, link
 
 
-def parse_non_selinux(parts):
+def _as_dict(values):
     """
-    Parse part of an ls output line that isn't selinux.
+    Turns the values of :data:`FIELDS` into a dict of the fields the line
+    has.  Lines with SELinux information have all of its fields.
+    """
+    selinux = values[9] is not None
+    return dict((k, v) for k, v in zip(FIELDS, values)
+                if v is not None or (selinux and k in SELINUX_FIELDS))
 
-    Args:
-        parts (list): A four element list of strings representing the initial
-            parts of an ls line after the permission bits. The parts are link
-            count, owner, group, and everything else.
 
-    Returns:
-        A dict containing links, owner, group, date, and name. If the line
-        represented a device, major and minor numbers are included.  Otherwise,
-        size is included. If the raw name was a symbolic link, link is
-        included.
-    """
+def _parse_non_selinux(parts):
     links, owner, group, last = parts
-    result = {
-        "links": int(links),
-        "owner": owner,
-        "group": group,
-    }
+    size = major = minor = None
 
     # device numbers only go to 256.
     # If a comma is in the first four characters, the next two elements are
     # major and minor device numbers. Otherwise, the next element is the size.
     if "," in last[:4]:
         major, minor, rest = last.split(None, 2)
-        result["major"] = int(major.rstrip(","))
-        result["minor"] = int(minor)
+        major = int(major.rstrip(","))
+        minor = int(minor)
     else:
         size, rest = last.split(None, 1)
-        result["size"] = int(size)
+        size = int(size)
 
     # The date part is always 12 characters regardless of content.
-    result["date"] = rest[:12]
+    date = rest[:12]
 
     # Jump over the date and the following space to get the path part.
     path, link = parse_path(rest[13:])
-    result["name"] = path
-    if link:
-        result["link"] = link
+    return (int(links), owner, group, size, major, minor, date, path,
+            link or None, None, None, None, None)
 
-    return result
+
+def parse_non_selinux(parts):
+    """
+    Parse part of an ls output line that isn't selinux.
+
+    Args:
+        parts (list): A four element list of strings representing the initial
+            parts of an ls line after the permission bits. The parts are link
+            count, owner, group, and everything else.
+
+    Returns:
+        A dict containing links, owner, group, date, and name. If the line
+        represented a device, major and minor numbers are included.  Otherwise,
+        size is included. If the raw name was a symbolic link, link is
+        included.
+    """
+    return _as_dict(_parse_non_selinux(parts))
+
+
+def _parse_selinux(parts):
+    owner, group = parts[:2]
+    selinux = parts[2].split(":")
+    lsel = len(selinux)
+    path, link = parse_path(parts[-1])
+    return (None, owner, group, None, None, None, None, path, link or None,
+            selinux[0],
+            selinux[1] if lsel > 1 else None,
+            selinux[2] if lsel > 2 else None,
+            selinux[3] if lsel > 3 else None)
 
 
 def parse_selinux(parts):
@@ -79,23 +122,24 @@ def parse_selinux(parts):
         name. If the raw name was a symbolic link, link is also included.
 
     """
+    return _as_dict(_parse_selinux(parts))
 
-    owner, group = parts[:2]
-    selinux = parts[2].split(":")
+
+def _parse_rhel8_selinux(parts):
+    links, owner, group, last = parts
+
+    selinux = parts[3].split(":")
     lsel = len(selinux)
-    path, link = parse_path(parts[-1])
-    result = {
-        "owner": owner,
-        "group": group,
-        "se_user": selinux[0],
-        "se_role": selinux[1] if lsel > 1 else None,
-        "se_type": selinux[2] if lsel > 2 else None,
-        "se_mls": selinux[3] if lsel > 3 else None,
-        "name": path
-    }
-    if link:
-        result["link"] = link
-    return result
+    selinux, size, last = parts[-1].split(None, 2)
+    selinux = selinux.split(":")
+    date = last[:12]
+    path, link = parse_path(last[13:])
+    return (int(links), owner, group, int(size), None, None, date, path,
+            link or None,
+            selinux[0],
+            selinux[1] if lsel > 1 else None,
+            selinux[2] if lsel > 2 else None,
+            selinux[3] if lsel > 3 else None)
 
 
 def parse_rhel8_selinux(parts):
@@ -113,32 +157,89 @@ def parse_rhel8_selinux(parts):
         link is also included.
 
     """
+    return _as_dict(_parse_rhel8_selinux(parts))
 
-    links, owner, group, last = parts
 
-    selinux = parts[3].split(":")
-    lsel = len(selinux)
-    selinux, size, last = parts[-1].split(None, 2)
-    selinux = selinux.split(":")
-    date = last[:12]
-    path, link = parse_path(last[13:])
-    result = {
-        "links": int(links),
-        "owner": owner,
-        "group": group,
-        "se_user": selinux[0],
-        "se_role": selinux[1] if lsel > 1 else None,
-        "se_type": selinux[2] if lsel > 2 else None,
-        "se_mls": selinux[3] if lsel > 3 else None,
-        "size": int(size),
-        "name": path,
-        "date": date,
-    }
-    if link:
-        result["link"] = link
+def parse_entry(line):
+    """
+    Parse an ls output line into an :class:`Entry`.
+    """
+    # we can't split(None, 5) here b/c rhel 6/7 selinux lines only have
+    # 4 parts before the path, and the path itself could contain
+    # spaces. Unfortunately, this means we have to split the line again
+    # below
+    parts = line.split(None, 4)
+    perms = parts[0]
+    if parts[1][0].isdigit():
+        # We have to split the line again to see if this is a RHEL8
+        # selinux stanza. This assumes that the context section will
+        # always have at least two pieces separated by ':'.
+        if ":" in line.split()[4]:
+            rest = _parse_rhel8_selinux(parts[1:])
+        else:
+            rest = _parse_non_selinux(parts[1:])
+    else:
+        rest = _parse_selinux(parts[1:])
+    return Entry(perms[0], perms[1:], *(rest + (line,)))
+
+
+def entry_dict(entry, directory):
+    """
+    Returns the dict form of an :class:`Entry` in directory.
+    """
+    result = _as_dict(entry[2:-1])
+    result["type"] = entry.type
+    result["perms"] = entry.perms
+    result["raw_entry"] = entry.raw_entry
+    result["dir"] = directory
     return result
 
 
+class Entries(Mapping):
+    """
+    The entries of a directory keyed by name.  Each entry is kept as an
+    :class:`Entry` and the dict for it is made the first time it's looked
+    up.
+    """
+    def __init__(self, directory, records):
+        self.directory = directory
+        self.records = records
+        self._dicts = {}
+
+    def __getitem__(self, name):
+        try:
+            return self._dicts[name]
+        except KeyError:
+            pass
+        result = entry_dict(self.records[name], self.directory)
+        self._dicts[name] = result
+        return result
+
+    def __contains__(self, name):
+        return name in self.records
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def __len__(self):
+        return len(self.records)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+QUERIES = {
+    "world_writable": lambda e: e.type != "l" and e.perms[7:8] == "w",
+    "setuid": lambda e: e.perms[2:3] in ("s", "S"),
+    "setgid": lambda e: e.perms[5:6] in ("s", "S"),
+    "sticky": lambda e: e.perms[8:9] in ("t", "T"),
+}
+"""
+Named queries for :meth:`insights.core.FileListing.scan`, as functions of
+an :class:`Entry`.  Symbolic links always have all permissions, so they
+aren't world writable.
+"""
+
 PASS_KEYS = set(["name", "total"])
 DELAYED_KEYS = ["entries", "files", "dirs", "specials"]
 
@@ -174,39 +275,15 @@ class Directory(dict):
 
     def _load(self):
         dirs = []
-        ents = {}
+        records = {}
         files = []
         specials = []
         for line in self.body:
-            # we can't split(None, 5) here b/c rhel 6/7 selinux lines only have
-            # 4 parts before the path, and the path itself could contain
-            # spaces. Unfortunately, this means we have to split the line again
-            # below
-            parts = line.split(None, 4)
-            perms = parts[0]
-            typ = perms[0]
-            entry = {
-                "type": typ,
-                "perms": perms[1:]
-            }
-            if parts[1][0].isdigit():
-                # We have to split the line again to see if this is a RHEL8
-                # selinux stanza. This assumes that the context section will
-                # always have at least two pieces separated by ':'.
-                if ":" in line.split()[4]:
-                    rest = parse_rhel8_selinux(parts[1:])
-                else:
-                    rest = parse_non_selinux(parts[1:])
-            else:
-                rest = parse_selinux(parts[1:])
-
-            # Update our entry and put it into the correct buckets
-            # based on its type.
-            entry.update(rest)
-            entry["raw_entry"] = line
-            entry["dir"] = self["name"]
-            nm = entry["name"]
-            ents[nm] = entry
+            entry = parse_entry(line)
+            typ = entry.type
+            nm = entry.name
+            records[nm] = entry
+            # put it into the correct buckets based on its type.
             if typ not in "bcd":
                 files.append(nm)
             elif typ == "d":
@@ -214,7 +291,7 @@ class Directory(dict):
             elif typ in "bc":
                 specials.append(nm)
 
-        self.update({"entries": ents,
+        self.update({"entries": Entries(self["name"], records),
                      "files": files,
                      "dirs": dirs,
                      "specials": specials})
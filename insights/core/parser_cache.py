@@ -0,0 +1,197 @@
+"""
+The parser_cache module provides an optional on disk cache of parser
+instances. When a cache is installed with :func:`set_cache`, the
+:class:`insights.core.plugins.parser` component type consults it before
+constructing a parser from a datasource. Entries are keyed on the parser's
+fully qualified name, a version derived from the insights release and the
+source of every module in the parser's class hierarchy and of the shared
+:data:`HELPER_MODULES`, and a hash of the datasource content, so a change to
+either the parser code or its input results in a miss.
+
+Only parsers that consume the whole content of a datasource are cached.
+:class:`insights.core.StreamParser` subclasses and datasources that don't
+expose content as a list of lines or as bytes are always parsed.
+"""
+import hashlib
+import importlib
+import inspect
+import logging
+import os
+import tempfile
+
+import six
+from six.moves import cPickle as pickle
+
+from insights.core import dr
+from insights.util import fs
+
+log = logging.getLogger(__name__)
+
+HELPER_MODULES = (
+    "insights.configtree",
+    "insights.core",
+    "insights.core.ls_parser",
+    "insights.core.spec_factory",
+    "insights.parsers",
+)
+"""
+Modules of helpers that parsers call, whose source is part of every parser's
+version.
+"""
+
+_CACHE = None
+_HELPERS = None
+
+
+def set_cache(cache):
+    """
+    Installs the :class:`ParserCache` consulted by parser components. Pass
+    ``None`` to disable caching.
+    """
+    global _CACHE
+    _CACHE = cache
+
+
+def get_cache():
+    """ Returns the installed :class:`ParserCache` or ``None``. """
+    return _CACHE
+
+
+def _module_source(name):
+    try:
+        return inspect.getsource(importlib.import_module(name))
+    except Exception:
+        return name
+
+
+def _helpers_version():
+    """
+    Returns a hash of the insights release and the source of the
+    :data:`HELPER_MODULES`.
+    """
+    global _HELPERS
+    if _HELPERS is None:
+        from insights import get_nvr
+        h = hashlib.sha256(get_nvr().encode("utf-8"))
+        for name in HELPER_MODULES:
+            h.update(_module_source(name).encode("utf-8"))
+        _HELPERS = h.hexdigest()
+    return _HELPERS
+
+
+def _hash_content(content):
+    if isinstance(content, six.binary_type):
+        return hashlib.sha256(content).hexdigest()
+    if isinstance(content, list) and all(isinstance(l, six.string_types) for l in content):
+        h = hashlib.sha256()
+        for l in content:
+            h.update(l.encode("utf-8") if isinstance(l, six.text_type) else l)
+            h.update(b"\n")
+        return h.hexdigest()
+
+
+class ParserCache(object):
+    """
+    Stores pickled parser instances beneath a directory.
+
+    Args:
+        path (str): directory for the cache entries. It's created if needed.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._versions = {}
+        fs.ensure_path(path, mode=0o770)
+
+    def version(self, component):
+        """
+        Returns a hash of the source of every module in the mro of the
+        component, the insights release and the source of the
+        :data:`HELPER_MODULES`. It changes whenever the parser, any class it
+        inherits from or the shared parsing helpers change.
+        """
+        try:
+            return self._versions[component]
+        except KeyError:
+            pass
+
+        h = hashlib.sha256(_helpers_version().encode("utf-8"))
+        seen = set(HELPER_MODULES)
+        for cls in inspect.getmro(component):
+            name = cls.__module__
+            if name in seen or name in ("builtins", "__builtin__"):
+                continue
+            seen.add(name)
+            try:
+                h.update(inspect.getsource(inspect.getmodule(cls)).encode("utf-8"))
+            except Exception:
+                h.update(name.encode("utf-8"))
+        version = self._versions[component] = h.hexdigest()
+        return version
+
+    def key(self, component, ds):
+        """
+        Returns the cache key for parsing ds with component or ``None`` if
+        the pair can't be cached.
+        """
+        from insights.core import StreamParser
+        if not inspect.isclass(component) or issubclass(component, StreamParser):
+            return
+
+        digest = _hash_content(getattr(ds, "content", None))
+        if digest is None:
+            return
+
+        h = hashlib.sha256()
+        for part in (dr.get_name(component),
+                     self.version(component),
+                     digest,
+                     getattr(ds, "relative_path", None),
+                     getattr(ds, "args", None),
+                     getattr(ds, "last_client_run", None)):
+            h.update(str(part).encode("utf-8"))
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def _entry(self, key):
+        return os.path.join(self.path, key[:2], key + ".pkl")
+
+    def get(self, key):
+        """ Returns the cached parser for key or ``None``. """
+        path = self._entry(key)
+        if not os.path.exists(path):
+            return
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as ex:
+            log.debug("Discarding unreadable parser cache entry %s: %r" % (path, ex))
+            os.remove(path)
+
+    def put(self, key, obj):
+        """ Stores obj under key. Objects that can't be pickled are skipped. """
+        path = self._entry(key)
+        fs.ensure_path(os.path.dirname(path), mode=0o770)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(obj, f, pickle.HIGHEST_PROTOCOL)
+            os.rename(tmp, path)
+        except Exception as ex:
+            log.debug("Couldn't cache %s: %r" % (dr.get_name(type(obj)), ex))
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def parse(self, component, ds):
+        """
+        Returns a parser instance for ds, from the cache if possible.
+        """
+        key = self.key(component, ds)
+        if key is None:
+            return component(ds)
+
+        obj = self.get(key)
+        if obj is None:
+            obj = component(ds)
+            if obj is not None:
+                self.put(key, obj)
+        return obj
@@ -31,7 +31,7 @@ import traceback
 from pprint import pformat
 from six import StringIO
 
-from insights.core import dr
+from insights.core import dr, parser_cache
 from insights.util.subproc import CalledProcessError
 from insights import settings
 
@@ -116,11 +116,21 @@ class parser(PluginType):
         group = kwargs.get('group', dr.GROUPS.single)
         super(parser, self).__init__(*args, group=group)
 
+    def parse(self, ds):
+        """
+        Returns the parser instance for a single datasource value, consulting
+        the :mod:`insights.core.parser_cache` if one is installed.
+        """
+        cache = parser_cache.get_cache()
+        if cache is None:
+            return self.component(ds)
+        return cache.parse(self.component, ds)
+
     def invoke(self, broker):
         dep_value = broker[self.requires[0]]
         if not isinstance(dep_value, list):
             try:
-                return self.component(dep_value)
+                return self.parse(dep_value)
             except ContentException as ce:
                 log.debug(ce)
                 broker.add_exception(self.component, ce, traceback.format_exc())
@@ -133,7 +143,7 @@ class parser(PluginType):
         results = []
         for d in dep_value:
             try:
-                r = self.component(d)
+                r = self.parse(d)
                 if r is not None:
                     results.append(r)
             except dr.SkipComponent:
@@ -5,10 +5,17 @@ serializer and deserializer functions for types. It also provides a
 load objects from the file system. The Hydration class includes a
 :py:func`Hydration.make_persister` method that returns a function appropriate
 to register as an observer on a :py:class:`Broker`.
+
+Hydration can optionally be given a :py:class:`BlobStore`. When one is
+provided, any supplementary data file a serializer writes is moved into the
+store under the sha256 of its content, and the metadata for the component
+records the digest in a ``blob`` key next to the file's ``relative_path``.
+Identical outputs from many archives are then kept only once.
 """
 import json as ser
 import logging
 import os
+import shutil
 import time
 import traceback
 from glob import glob
@@ -114,20 +121,149 @@ def unmarshal(data, root=None):
     return deserialize(data, root=root)
 
 
+def _blob_refs(results):
+    """
+    Yields the serialized object dictionaries in marshalled results that refer
+    to a supplementary data file.
+    """
+    if results is None:
+        return
+    for r in (results if isinstance(results, list) else [results]):
+        obj = r.get("object") if isinstance(r, dict) else None
+        if isinstance(obj, dict) and "relative_path" in obj:
+            yield obj
+
+
+def referenced_blobs(*meta_data_dirs):
+    """
+    Returns the set of blob digests referenced by the component metadata
+    files in the given directories.
+    """
+    refs = set()
+    for d in meta_data_dirs:
+        for path in glob(os.path.join(d, "*")):
+            try:
+                with open(path) as f:
+                    doc = ser.load(f)
+                refs.update(o["blob"] for o in _blob_refs(doc.get("results")) if "blob" in o)
+            except Exception as ex:
+                log.warning("Could not read blob references from %s: %r" % (path, ex))
+    return refs
+
+
+class BlobStore(object):
+    """
+    A content addressed store for the supplementary data written by
+    serializers. Blobs are named by the sha256 of their content and fanned
+    out into subdirectories by the first two characters of the digest, so a
+    single store can be shared by any number of :py:class:`Hydration`
+    instances.
+
+    Args:
+        root (str): directory that holds the blobs. It's created if needed.
+    """
+    def __init__(self, root):
+        self.root = root
+
+    def path(self, digest):
+        """ Returns the path of the blob with the given digest. """
+        return os.path.join(self.root, digest[:2], digest)
+
+    def __contains__(self, digest):
+        return os.path.exists(self.path(digest))
+
+    def __iter__(self):
+        for path in glob(os.path.join(self.root, "*", "*")):
+            yield os.path.basename(path)
+
+    def put(self, path):
+        """
+        Moves the file at path into the store and returns its digest. If the
+        store already has a blob with the same content, the file is simply
+        removed.
+        """
+        digest = fs.sha256(path)
+        dst = self.path(digest)
+        if os.path.exists(dst):
+            os.remove(path)
+        else:
+            fs.ensure_path(os.path.dirname(dst), mode=0o770)
+            shutil.move(path, dst)
+        return digest
+
+    def get(self, digest, dst):
+        """
+        Materializes the blob with the given digest at dst. A hard link is
+        used when possible, and the content is copied otherwise.
+        """
+        src = self.path(digest)
+        if not os.path.exists(src):
+            raise ValueError("Blob %s not found in %s." % (digest, self.root))
+        fs.ensure_path(os.path.dirname(dst), mode=0o770)
+        if os.path.exists(dst):
+            os.remove(dst)
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copyfile(src, dst)
+
+    def gc(self, referenced):
+        """
+        Removes every blob whose digest isn't in referenced.
+
+        Args:
+            referenced (set): digests that are still in use. See
+                :py:func:`referenced_blobs`.
+
+        Returns:
+            list: the digests of the removed blobs.
+        """
+        removed = []
+        for digest in list(self):
+            if digest not in referenced:
+                os.remove(self.path(digest))
+                removed.append(digest)
+        return removed
+
+
 class Hydration(object):
     """
     The Hydration class is responsible for saving and loading insights
     components. It puts metadata about a component's evaluation in a metadata
     file for the component and allows the serializer for a component to put raw
     data beneath a working directory.
+
+    If blob_store is given, either as a :py:class:`BlobStore` or as the path
+    to one, the raw data is deduplicated into it. See :py:class:`BlobStore`.
     """
-    def __init__(self, root=None, meta_data="meta_data", data="data", pool=None):
+    def __init__(self, root=None, meta_data="meta_data", data="data", pool=None, blob_store=None):
         self.root = root
         self.meta_data = os.path.join(root, meta_data) if root else None
         self.data = os.path.join(root, data) if root else None
         self.ser_name = dr.get_base_module_name(ser)
         self.created = False
         self.pool = pool
+        if blob_store is not None and not isinstance(blob_store, BlobStore):
+            blob_store = BlobStore(blob_store)
+        self.blob_store = blob_store
+
+    def _data_path(self, obj):
+        return os.path.join(self.data, obj["relative_path"].lstrip("/"))
+
+    def _store_blobs(self, results):
+        for obj in _blob_refs(results):
+            path = self._data_path(obj)
+            if os.path.isfile(path) and not os.path.islink(path):
+                obj["blob"] = self.blob_store.put(path)
+
+    def _fetch_blobs(self, results):
+        for obj in _blob_refs(results):
+            if "blob" in obj:
+                if self.blob_store is None:
+                    raise ValueError("%s is stored as a blob but no blob store is set." % obj["relative_path"])
+                path = self._data_path(obj)
+                if not os.path.exists(path):
+                    self.blob_store.get(obj["blob"], path)
 
     def _hydrate_one(self, doc):
         """ Returns (component, results, errors, duration) """
@@ -138,6 +274,7 @@ class Hydration(object):
             raise ValueError("{} is not a loaded component.".format(name))
         exec_time = doc["exec_time"]
         ser_time = doc["ser_time"]
+        self._fetch_blobs(doc["results"])
         results = unmarshal(doc["results"], root=self.data)
         return (key, results, exec_time, ser_time)
 
@@ -189,6 +326,8 @@ class Hydration(object):
             try:
                 start = time.time()
                 doc["results"] = marshal(value, root=self.data, pool=self.pool)
+                if self.blob_store is not None:
+                    self._store_blobs(doc["results"])
             except Exception:
                 errors.append(traceback.format_exc())
                 log.debug(traceback.format_exc())
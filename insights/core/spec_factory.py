@@ -13,7 +13,7 @@ from insights.core import blacklist, dr
 from insights.core.filters import get_filters
 from insights.core.context import ExecutionContext, FSRoots, HostContext
 from insights.core.plugins import datasource, ContentException, is_datasource
-from insights.util import fs, streams, which
+from insights.util import fs, streams, tail, which
 from insights.util.subproc import Pipeline
 from insights.core.serde import deserializer, serializer
 import shlex
@@ -80,6 +80,61 @@ def mangle_command(command, name_max=255):
     return mangledname
 
 
+class ContentLines(list):
+    """
+    The lines of the content of a datasource.  They remember the results of
+    the common ways of tokenizing them, so that the parsers of the same
+    content share the work.  The results are shared, so must not be
+    changed, and are forgotten if the lines change.
+    """
+    def __init__(self, lines=()):
+        super(ContentLines, self).__init__(lines)
+        self._tokens = {}
+
+    def _cached(self, key, tokenize):
+        try:
+            return self._tokens[key]
+        except KeyError:
+            result = self._tokens[key] = tokenize()
+            return result
+
+    def active_lines(self, comment_char="#"):
+        """
+        list: The lines that aren't empty or commented out, stripped, as
+        :func:`insights.parsers.get_active_lines` returns them.
+        """
+        return self._cached(("active", comment_char), lambda: list(filter(
+            None, (line.split(comment_char, 1)[0].strip() for line in self))))
+
+    def split_rows(self, max_splits=-1):
+        """
+        list: The fields of each line split on white space, with at most
+        `max_splits` splits.
+        """
+        return self._cached(("split", max_splits), lambda: [
+            line.strip().split(None, max_splits) for line in self])
+
+
+def _forget(name):
+    method = getattr(list, name)
+
+    def changed(self, *args):
+        # Unpickling adds the lines before it restores _tokens
+        tokens = getattr(self, "_tokens", None)
+        if tokens:
+            tokens.clear()
+        return method(self, *args)
+    changed.__name__ = name
+    return changed
+
+
+for _name in ("__setitem__", "__delitem__", "__iadd__", "__imul__", "__setslice__",
+              "__delslice__", "append", "clear", "extend", "insert", "pop", "remove",
+              "reverse", "sort"):
+    if hasattr(list, _name):
+        setattr(ContentLines, _name, _forget(_name))
+
+
 class ContentProvider(object):
     def __init__(self):
         self.cmd = None
@@ -121,6 +176,8 @@ class ContentProvider(object):
                 self._exception = ex
                 raise
 
+        if type(self._content) is list:
+            self._content = ContentLines(self._content)
         return self._content
 
     def __repr__(self):
@@ -211,13 +268,33 @@ class TextFileProvider(FileProvider):
     """
     Class used in datasources that returns the contents of a file a list of
     lines. Each line is filtered if filters are defined for the datasource.
+    If the datasource has a ``tail`` window, only the lines within it are
+    read.
     """
+    _tail_start = None
+
+    @property
+    def tail_start(self):
+        """
+        The offset of the first byte read from the file, given by the tail
+        window of the datasource. See :mod:`insights.util.tail`.
+        """
+        if self._tail_start is None:
+            window = getattr(self.ds, "tail", None)
+            self._tail_start = tail.window_start(self.path, window) if window else 0
+        return self._tail_start
 
     def create_args(self):
         args = []
+        if self.tail_start:
+            args.append(["tail", "-c", "+%d" % (self.tail_start + 1), self.path])
+
         filters = "\n".join(get_filters(self.ds)) if self.ds else None
         if filters:
-            args.append(["grep", "-F", filters, self.path])
+            grep = ["grep", "-F", filters]
+            if not args:
+                grep.append(self.path)
+            args.append(grep)
 
         patterns = "\n".join(blacklist.get_disallowed_patterns())
         if patterns:
@@ -538,14 +615,18 @@ class simple_file(object):
         context (ExecutionContext): the context under which the datasource
             should run.
         kind (FileProvider): One of TextFileProvider or RawFileProvider.
+        tail (dict): only read the end of the file, as described in
+            :mod:`insights.util.tail`. It can also be set with
+            :func:`insights.apply_configs`.
 
     Returns:
         function: A datasource that reads all files matching the glob patterns.
     """
-    def __init__(self, path, context=None, deps=[], kind=TextFileProvider, **kwargs):
+    def __init__(self, path, context=None, deps=[], kind=TextFileProvider, tail=None, **kwargs):
         self.path = path
         self.context = context or FSRoots
         self.kind = kind
+        self.tail = tail
         self.raw = kind is RawFileProvider
         self.__name__ = self.__class__.__name__
         datasource(self.context, *deps, raw=self.raw, **kwargs)(self)
@@ -567,11 +648,14 @@ class glob_file(object):
             should run.
         kind (FileProvider): One of TextFileProvider or RawFileProvider.
         max_files (int): Maximum number of glob files to process.
+        tail (dict): only read the end of the file, as described in
+            :mod:`insights.util.tail`. It can also be set with
+            :func:`insights.apply_configs`.
 
     Returns:
         function: A datasource that reads all files matching the glob patterns.
     """
-    def __init__(self, patterns, ignore=None, context=None, deps=[], kind=TextFileProvider, max_files=1000, **kwargs):
+    def __init__(self, patterns, ignore=None, context=None, deps=[], kind=TextFileProvider, max_files=1000, tail=None, **kwargs):
         if not isinstance(patterns, (list, set)):
             patterns = [patterns]
         self.patterns = patterns
@@ -581,6 +665,7 @@ class glob_file(object):
         self.kind = kind
         self.raw = kind is RawFileProvider
         self.max_files = max_files
+        self.tail = tail
         self.__name__ = self.__class__.__name__
         datasource(self.context, *deps, multi_output=True, raw=self.raw, **kwargs)(self)
 
@@ -631,16 +716,20 @@ class first_file(object):
         context (ExecutionContext): the context under which the datasource
             should run.
         kind (FileProvider): One of TextFileProvider or RawFileProvider.
+        tail (dict): only read the end of the file, as described in
+            :mod:`insights.util.tail`. It can also be set with
+            :func:`insights.apply_configs`.
 
     Returns:
         function: A datasource that returns the first file in files that exists
             and is readable
     """
 
-    def __init__(self, paths, context=None, deps=[], kind=TextFileProvider, **kwargs):
+    def __init__(self, paths, context=None, deps=[], kind=TextFileProvider, tail=None, **kwargs):
         self.paths = paths
         self.context = context or FSRoots
         self.kind = kind
+        self.tail = tail
         self.raw = kind is RawFileProvider
         self.__name__ = self.__class__.__name__
         datasource(self.context, *deps, raw=self.raw, **kwargs)(self)
@@ -814,19 +903,23 @@ class foreach_collect(object):
         context (ExecutionContext): the context under which the datasource
             should run.
         kind (FileProvider): one of TextFileProvider or RawFileProvider
+        tail (dict): only read the end of the file, as described in
+            :mod:`insights.util.tail`. It can also be set with
+            :func:`insights.apply_configs`.
 
     Returns:
         function: A datasource that returns a list of file contents created by
             substituting each element of provider into the path template.
     """
 
-    def __init__(self, provider, path, ignore=None, context=HostContext, deps=[], kind=TextFileProvider, **kwargs):
+    def __init__(self, provider, path, ignore=None, context=HostContext, deps=[], kind=TextFileProvider, tail=None, **kwargs):
         self.provider = provider
         self.path = path
         self.ignore = ignore
         self.ignore_func = re.compile(ignore).search if ignore else lambda x: False
         self.context = context
         self.kind = kind
+        self.tail = tail
         self.raw = kind is RawFileProvider
         self.__name__ = self.__class__.__name__
         datasource(self.provider, self.context, *deps, multi_output=True, raw=self.raw, **kwargs)(self)
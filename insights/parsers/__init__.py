@@ -2,6 +2,11 @@ import pkgutil
 from collections import OrderedDict
 from insights.core.dr import SkipComponent
 
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
 
 __all__ = [n for (i, n, p) in pkgutil.iter_modules(__path__) if not p]
 
@@ -53,7 +58,74 @@ def get_active_lines(lines, comment_char="#"):
         >>> get_active_lines(lines)
         ['First line', 'Inline comment', 'Whitespace', 'Last line']
     """
-    return list(filter(None, (line.split(comment_char, 1)[0].strip() for line in lines)))
+    if hasattr(lines, 'active_lines'):
+        # Content from a datasource shares the work with its other parsers
+        return list(lines.active_lines(comment_char))
+    if comment_char is None:
+        # Without a comment string, split splits on white space
+        return list(filter(None, (line.split(None, 1)[0].strip() for line in lines)))
+    return tokenize_config(lines, comment_char=comment_char)
+
+
+def tokenize_config(lines, comment_char="#", split_on=None, use_partition=False,
+                    filter_string=None, cont_char=None, keep_cont_char=False):
+    r"""
+    Tokenizes the lines of a configuration file in a single pass over them.
+
+    Lines ending in `cont_char` are first joined to the line after them, as
+    :func:`unsplit_lines` does.  Comments are then removed and the lines are
+    stripped, leaving out empty ones, as :func:`get_active_lines` does.  When
+    `split_on` is given, each line is finally split into a key and a value at
+    the first occurrence of it, as :func:`split_kv_pairs` does.
+
+    As lines are joined before comments are removed, a comment ending in
+    `cont_char` also comments out the line after it.
+
+    Parameters:
+        lines (list): List of strings to tokenize.
+        comment_char (str): String indicating that all chars following
+            are part of a comment.  If `None`, lines are kept as they are.
+        split_on (str): If not `None`, the string to split the lines into
+            keys and values on.
+        use_partition (bool): If `True`, lines without `split_on` are kept
+            with an empty value, otherwise they are left out.
+        filter_string (str): If not `None`, only lines containing it are
+            kept.
+        cont_char (str): If not `None`, the continuation character at the
+            end of lines that continue on the next line.
+        keep_cont_char (bool): Whether to keep the continuation character
+            when joining lines.
+
+    Returns:
+        list: The remaining lines, or (key, value) tuples for them if
+        `split_on` is given.
+
+    Examples:
+        >>> lines = [
+        ... '# Comment line',
+        ... 'key1 = value1   # Inline comment',
+        ... 'key2 = value2a, \\',
+        ... '    value2b',
+        ... 'key3']
+        >>> tokenize_config(lines, cont_char='\\')
+        ['key1 = value1', 'key2 = value2a,     value2b', 'key3']
+        >>> tokenize_config(lines, split_on='=')
+        [('key1', 'value1'), ('key2', 'value2a, \\')]
+        >>> tokenize_config(lines, split_on='=', use_partition=True, filter_string='3')
+        [('key3', '')]
+    """
+    if cont_char is not None:
+        lines = _unsplit(lines, cont_char, keep_cont_char)
+    elif comment_char is not None and hasattr(lines, 'active_lines'):
+        lines, comment_char = lines.active_lines(comment_char), None
+    if comment_char is not None:
+        lines = filter(None, (line.split(comment_char, 1)[0].strip() for line in lines))
+    if filter_string is not None:
+        lines = (line for line in lines if filter_string in line)
+    if split_on is None:
+        return list(lines)
+    pairs = (line.partition(split_on) for line in lines)
+    return [(k.strip(), v.strip()) for k, sep, v in pairs if sep or use_partition]
 
 
 def optlist_to_dict(optlist, opt_sep=',', kv_sep='=', strip_quotes=False):
@@ -85,18 +157,16 @@ def optlist_to_dict(optlist, opt_sep=',', kv_sep='=', strip_quotes=False):
         >>> optlist_to_dict(optlist)
         {'rw': True, 'ro': True, 'rsize': '32168', 'xyz': True}
     """
-    def make_kv(opt):
-        if kv_sep is not None and kv_sep in opt:
-            k, v = opt.split(kv_sep, 1)
-            k = k.strip()
-            if strip_quotes and v[0] in ('"', "'") and v[-1] == v[0]:
-                return k, v[1:-1]
-            else:
-                return k, v
-        else:
-            return opt, True
-
-    return dict(make_kv(opt) for opt in optlist.split(opt_sep))
+    result = {}
+    for opt in optlist.split(opt_sep):
+        k, sep, v = opt.partition(kv_sep) if kv_sep is not None else (opt, None, None)
+        if not sep:
+            result[opt] = True
+            continue
+        if strip_quotes and v[:1] in ('"', "'") and v[-1] == v[0]:
+            v = v[1:-1]
+        result[k.strip()] = v
+    return result
 
 
 def split_kv_pairs(lines, comment_char="#", filter_string=None, split_on="=", use_partition=False, ordered=False):
@@ -161,19 +231,9 @@ def split_kv_pairs(lines, comment_char="#", filter_string=None, split_on="=", us
         OrderedDict([('keyword1', 'value1'), ('keyword2', 'value2a=True, value2b=100M'), ('keyword3', '')])
 
     """
-    _lines = lines if comment_char is None else get_active_lines(lines, comment_char=comment_char)
-    _lines = _lines if filter_string is None else [l for l in _lines if filter_string in l]
-    kv_pairs = OrderedDict() if ordered else {}
-
-    for line in _lines:
-        if not use_partition:
-            if split_on in line:
-                k, v = line.split(split_on, 1)
-                kv_pairs[k.strip()] = v.strip()
-        else:
-            k, _, v = line.partition(split_on)
-            kv_pairs[k.strip()] = v.strip()
-    return kv_pairs
+    pairs = tokenize_config(lines, comment_char=comment_char, split_on=split_on,
+                            use_partition=use_partition, filter_string=filter_string)
+    return OrderedDict(pairs) if ordered else dict(pairs)
 
 
 def unsplit_lines(lines, cont_char='\\', keep_cont_char=False):
@@ -208,16 +268,21 @@ def unsplit_lines(lines, cont_char='\\', keep_cont_char=False):
         >>> list(unsplit_lines(lines, keep_cont_char=True)
         ['Line one \     line one part 2', 'Line two']
     """
-    unsplit_lines = []
+    return iter(tokenize_config(lines, comment_char=None, cont_char=cont_char,
+                                keep_cont_char=keep_cont_char))
+
+
+def _unsplit(lines, cont_char, keep_cont_char):
+    parts = []
     for line in lines:
         line = line.rstrip()
         if line.endswith(cont_char):
-            unsplit_lines.append(line if keep_cont_char else line[:-1])
+            parts.append(line if keep_cont_char else line[:-1])
         else:
-            yield ''.join(unsplit_lines) + line
-            unsplit_lines = []
-    if unsplit_lines:
-        yield ''.join(unsplit_lines)
+            yield ''.join(parts) + line
+            parts = []
+    if parts:
+        yield ''.join(parts)
 
 
 def calc_offset(lines, target, invert_search=False):
@@ -278,10 +343,126 @@ def calc_offset(lines, target, invert_search=False):
         return 0
 
 
+class TableRow(MutableMapping):
+    """
+    A ``dict`` like view of one row of a :class:`Table`.  Setting or deleting
+    a key changes the table.
+    """
+    __slots__ = ('_table', '_index')
+
+    def __init__(self, table, index):
+        self._table = table
+        self._index = index
+
+    def __getitem__(self, key):
+        value = self._table.columns[key][self._index]
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        columns = self._table.columns
+        if key not in columns:
+            columns[key] = [None] * len(self._table)
+        columns[key][self._index] = value
+
+    def __delitem__(self, key):
+        column = self._table.columns.get(key)
+        if column is None or column[self._index] is None:
+            raise KeyError(key)
+        column[self._index] = None
+
+    def __iter__(self):
+        i = self._index
+        return (k for k, c in self._table.columns.items() if c[i] is not None)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+class Table(object):
+    """
+    Rows of table data stored a column at a time, as returned by
+    :func:`parse_fixed_table` and :func:`parse_delimited_table` when
+    ``columnar`` is set.  Each heading is stored once, rather than once
+    per row, and each row is a :class:`TableRow` that works like the
+    ``dict`` the functions otherwise return.  Rows are created when they're
+    used.
+
+    Attributes:
+        headings (tuple): The column headings, in the order they appear.
+        columns (OrderedDict): The list of values of each column, keyed on
+            heading.  Rows without a value have ``None``.
+
+    Examples:
+        >>> table = parse_fixed_table(table_lines, columnar=True)
+        >>> table.headings
+        ('Column1', 'Column2', 'Column3')
+        >>> table.columns['Column1']
+        ['data1', 'data4']
+        >>> table[1]['Column2']
+        'data5'
+    """
+    def __init__(self, headings, columns, length):
+        self.headings = tuple(headings)
+        self.columns = columns
+        self._length = length
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [TableRow(self, n) for n in range(*i.indices(self._length))]
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError("table index out of range")
+        return TableRow(self, i)
+
+    def __iter__(self):
+        return (TableRow(self, i) for i in range(self._length))
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, Table)):
+            return False
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+def _columns(headings, rows):
+    """
+    Returns the columns of a :class:`Table` from the headings and the list of
+    values of each row.  When headings repeat, the last value a row has for
+    them wins, as it does for the dictionaries of rows.
+    """
+    columns = OrderedDict()
+    for heading in headings:
+        if heading in columns:
+            continue
+        positions = [i for i, h in enumerate(headings) if h == heading]
+        if len(positions) == 1:
+            i = positions[0]
+            columns[heading] = [r[i] if i < len(r) else None for r in rows]
+        else:
+            positions.reverse()
+            columns[heading] = [next((r[i] for i in positions if i < len(r)), None) for r in rows]
+    return columns
+
+
 def parse_fixed_table(table_lines,
                       heading_ignore=[],
                       header_substitute=[],
-                      trailing_ignore=[]):
+                      trailing_ignore=[],
+                      columnar=False):
     """
     Function to parse table data containing column headings in the first row and
     data in fixed positions in each remaining row of table data.
@@ -305,6 +486,8 @@ def parse_fixed_table(table_lines,
         trailing_ignore (list): Optional list of strings to look for at the end
             rows of the content.  Lines starting with these strings will be ignored,
             thereby truncating the rows of data.
+        columnar (bool): If set to `True`, a :class:`Table` is returned in
+            place of the list.
 
     Returns:
         list: Returns a list of dict for each row of column data.  Dict keys
@@ -347,6 +530,12 @@ def parse_fixed_table(table_lines,
     col_headers = header.strip().split()
     col_index = calc_column_indices(header, col_headers)
 
+    if columnar:
+        bounds = list(zip(col_index, col_index[1:] + [None]))
+        rows = [[line[b:e].strip() for b, e in bounds]
+                for line in table_lines[first_line + 1:last_line]]
+        return Table(col_headers, _columns(col_headers, rows), len(rows))
+
     table_data = []
     for line in table_lines[first_line + 1:last_line]:
         col_data = dict(
@@ -367,7 +556,8 @@ def parse_delimited_table(table_lines,
                           heading_ignore=None,
                           header_substitute=None,
                           trailing_ignore=None,
-                          raw_line_key=None):
+                          raw_line_key=None,
+                          columnar=False):
     """
     Parses table-like text.  Uses the first (non-ignored) row as the list of
     column names, which cannot contain the delimiter.  Fields cannot contain
@@ -407,13 +597,16 @@ def parse_delimited_table(table_lines,
             be ignored, thereby truncating the rows of data.
         raw_line_key (str): Key under which to save the raw line. If None, line
             is not saved.
+        columnar (bool): If set to `True`, a :class:`Table` is returned in
+            place of the list.  Rows with fewer fields than headings have
+            ``None`` in the columns they don't have.
     Returns:
         list: Returns a list of dictionaries for each row of column data,
         keyed on the column headings in the same case as input.
 
     """
     if not table_lines:
-        return []
+        return Table([], OrderedDict(), 0) if columnar else []
     first_line = calc_offset(table_lines, heading_ignore)
     try:
         # Ignore everything before the heading in this search
@@ -423,7 +616,7 @@ def parse_delimited_table(table_lines,
     except ValueError:
         # We seem to have run out of content before we found something we
         # wanted - return an empty list.
-        return []
+        return Table([], OrderedDict(), 0) if columnar else []
 
     if header_delim == 'same as delimiter':
         header_delim = delim
@@ -432,20 +625,45 @@ def parse_delimited_table(table_lines,
         for old_val, new_val in header_substitute:
             header = header.replace(old_val, new_val)
 
-    content = table_lines[first_line + 1:last_line]
     headings = [c.strip() if strip else c for c in header.split(header_delim)]
+    rows = _table_rows(table_lines, first_line + 1, last_line, delim, max_splits, strip)
+    if columnar:
+        rows = list(rows)
+        columns = _columns(headings, [f for f, _ in rows])
+        if raw_line_key:
+            columns[raw_line_key] = [l for _, l in rows]
+        return Table(headings, columns, len(rows))
+
     r = []
-    for row in content:
+    for rowsplit, row in rows:
+        o = dict(zip(headings, rowsplit))
+        if raw_line_key:
+            o[raw_line_key] = row
+        r.append(o)
+    return r
+
+
+def _table_rows(table_lines, start, end, delim, max_splits, strip):
+    """
+    Yields the fields and the stripped line of each non-blank line of
+    table_lines from start up to end.
+    """
+    if delim is None and hasattr(table_lines, 'split_rows'):
+        # Share the split with the other parsers of the same content.
+        # Fields split on white space have nothing to strip.
+        split_rows = table_lines.split_rows(max_splits)
+        for i in range(start, end):
+            if split_rows[i]:
+                yield split_rows[i], table_lines[i].strip()
+        return
+
+    for row in table_lines[start:end]:
         row = row.strip()
         if row:
             rowsplit = row.split(delim, max_splits)
             if strip:
                 rowsplit = [i.strip() for i in rowsplit]
-            o = dict(zip(headings, rowsplit))
-            if raw_line_key:
-                o[raw_line_key] = row
-            r.append(o)
-    return r
+            yield rowsplit, row
 
 
 def keyword_search(rows, **kwargs):
@@ -493,36 +711,147 @@ def keyword_search(rows, **kwargs):
         >>> keyword_search(rows, domain__startswith='r')
         [{'domain': 'root', 'type': 'soft', 'item': 'nproc', 'value': -1}]
     """
-    results = []
     if not kwargs:
-        return results
-
-    # Allows us to transform the key and do lookups like __contains and
-    # __startswith
-    matchers = {
-        'default': lambda s, v: s == v,
-        'contains': lambda s, v: v in s,
-        'startswith': lambda s, v: s.startswith(v),
-        'lower_value': lambda s, v: s.lower() == v.lower(),
-    }
-
-    def key_match(row, key, value):
-        # Translate ' ' and '-' of keys in dict to '_' to match keyword arguments.
-        my_row = {}
-        for my_key, val in row.items():
-            my_row[my_key.replace(' ', '_').replace('-', '_')] = val
-        matcher_fn = matchers['default']
-        if '__' in key:
-            key, matcher = key.split('__', 1)
-            if matcher not in matchers:
-                # put key back the way we found it, matcher fn unchanged
-                key = key + '__' + matcher
-            else:
-                matcher_fn = matchers[matcher]
-        return key in my_row and matcher_fn(my_row[key], value)
-
+        return []
+    plan = _keyword_plan(kwargs)
     data = []
     for row in rows:
-        if all(map(lambda kv: key_match(row, kv[0], kv[1]), kwargs.items())):
+        my_row = dict((_search_key(k), v) for k, v in row.items())
+        if all(key in my_row and fn(my_row[key], value) for key, fn, value in plan):
             data.append(row)
     return data
+
+
+def _equals(s, v):
+    return s == v
+
+
+# Allows us to transform the key and do lookups like __contains and
+# __startswith
+_MATCHERS = {
+    'default': _equals,
+    'contains': lambda s, v: v in s,
+    'startswith': lambda s, v: s.startswith(v),
+    'lower_value': lambda s, v: s.lower() == v.lower(),
+}
+
+
+def _search_key(key):
+    # Translate ' ' and '-' of keys in dict to '_' to match keyword arguments.
+    return key.replace(' ', '_').replace('-', '_')
+
+
+def _keyword_plan(kwargs):
+    """
+    Compiles the keyword arguments of :func:`keyword_search` into a list of
+    (key, matcher function, value) tuples.
+    """
+    plan = []
+    for key, value in kwargs.items():
+        matcher_fn = _equals
+        if '__' in key:
+            name, matcher = key.split('__', 1)
+            if matcher in _MATCHERS:
+                key, matcher_fn = name, _MATCHERS[matcher]
+        plan.append((key, matcher_fn, value))
+    return plan
+
+
+class SearchableTable(object):
+    """
+    A list of dictionaries to be searched many times with the keyword
+    arguments of :func:`keyword_search`, which it returns the same results
+    as.
+
+    The keys of the rows are translated once, when the table is created,
+    and the first search for a value of a key builds an index of the rows
+    by that key's values.  Later searches for values of the key only look
+    at the rows with that value.  The rows shouldn't be changed once
+    they're in a table.
+
+    Parameters:
+        rows (list): A list of dictionaries, or objects with an ``items``
+            method, representing the data to be searched.
+
+    Examples:
+        >>> table = SearchableTable(rows)
+        >>> table.search(domain='root')
+        [{'domain': 'root', 'type': 'soft', 'item': 'nproc', 'value': -1}]
+        >>> table.search(domain='oracle', item__contains='s')
+        [{'domain': 'oracle', 'type': 'soft', 'item': 'stack', 'value': 10240},
+         {'domain': 'oracle', 'type': 'hard', 'item': 'stack', 'value': 3276}]
+    """
+    def __init__(self, rows):
+        self.rows = rows
+        keys = {}
+        for row in rows:
+            for key, _ in row.items():
+                keys.setdefault(_search_key(key), set()).add(key)
+        if all(len(k) == 1 for k in keys.values()) and all(isinstance(r, dict) for r in rows):
+            # Look up the original keys in the rows themselves
+            self._names = dict((k, v.pop()) for k, v in keys.items())
+            self._data = rows
+        else:
+            self._names = dict((k, k) for k in keys)
+            self._data = [dict((_search_key(k), v) for k, v in row.items()) for row in rows]
+        self._indexes = {}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _index(self, key):
+        """
+        Returns the numbers of the rows keyed by their value for key, or
+        None if some of the values can't be indexed.
+        """
+        try:
+            return self._indexes[key]
+        except KeyError:
+            pass
+        name = self._names[key]
+        index = {}
+        for i, row in enumerate(self._data):
+            if name in row:
+                try:
+                    index.setdefault(row[name], []).append(i)
+                except TypeError:
+                    index = None
+                    break
+        self._indexes[key] = index
+        return index
+
+    def search(self, **kwargs):
+        """
+        Returns the rows that match all of the keyword arguments, in order.
+        See :func:`keyword_search` for the arguments.  If no keyword
+        arguments are given, no rows are returned.
+        """
+        if not kwargs:
+            return []
+        plan = _keyword_plan(kwargs)
+        if any(key not in self._names for key, _, _ in plan):
+            return []
+
+        candidates = None
+        for key, fn, value in plan:
+            if fn is not _equals:
+                continue
+            index = self._index(key)
+            if index is None:
+                continue
+            try:
+                found = index.get(value, [])
+            except TypeError:
+                continue
+            if candidates is None or len(found) < len(candidates):
+                candidates = found
+        if candidates is None:
+            candidates = range(len(self._data))
+
+        checks = [(self._names[key], fn, value) for key, fn, value in plan]
+        data = []
+        for i in candidates:
+            row = self._data[i]
+            if all(name in row and fn(row[name], value) for name, fn, value in checks):
+                data.append(self.rows[i])
+        return data
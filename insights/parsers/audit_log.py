@@ -3,11 +3,35 @@ audit_log - File ``/var/log/audit/audit.log``
 =============================================
 """
 
+import re
 import shlex
 from datetime import date
 from .. import LogFileOutput, parser, add_filter
 from insights.specs import Specs
 
+_TOKEN = r"""(?:[^ \t\r\n'"]|"[^"]*"|'[^']*')+"""
+_SPLITTABLE = re.compile(r"[ \t\r\n]*(?:{0}(?:[ \t\r\n]+{0})*)?[ \t\r\n]*\Z".format(_TOKEN))
+_tokens = re.compile(_TOKEN).findall
+_quoted = re.compile(r""""([^"]*)"|'([^']*)'""")
+_TIMESTAMP = re.compile(r"type=\S*[ \t\r\n]+msg=audit\((\d+(?:\.\d*)?):\d+\):(?:[ \t\r\n]|\Z)")
+
+
+def _unquote(match):
+    return match.group(1) if match.group(2) is None else match.group(2)
+
+
+def _split(line):
+    """
+    Splits line the same way as ``shlex.split``.  Lines without backslashes
+    and with balanced quotes, which is nearly all audit records, are split
+    with regular expressions; anything else is left to ``shlex``.
+    """
+    if '\\' in line or not _SPLITTABLE.match(line):
+        return shlex.split(line)
+    return [_quoted.sub(_unquote, t) if ('"' in t or "'" in t) else t
+            for t in _tokens(line)]
+
+
 # Currently, only selinux related(AVC type) audit logs are interested.
 # Add this filter in parser directly to filter out too many other types logs.
 # Also, filters can be changed to meet any further requirments.
@@ -52,7 +76,7 @@ class AuditLog(LogFileOutput):
 
         Parsing logic:
 
-            * First, use `shlex.split` to split by empty.
+            * First, split by whitespace the way `shlex.split` does.
             * Next, assert the first two key-value pair is 'type' and 'msg'.
             * Next, parse the remained string reversly to get key-value pair data as more as possible.
             * The left unparsed string will be stored at "unparsed".
@@ -77,7 +101,7 @@ class AuditLog(LogFileOutput):
             possible are pulled from the line.
         """
         info = {'raw_message': line, 'is_valid': False}
-        linesp = shlex.split(line)
+        linesp = _split(line)
 
         if (len(linesp) < 2 or
                 not (linesp[0] and linesp[0].startswith('type=')) or
@@ -127,10 +151,12 @@ class AuditLog(LogFileOutput):
             # If `s` is not None, keywords must be found in the line
             if s and not search_by_expression(line):
                 continue
-            info = self._parse_line(line)
+            # Only lines after the timestamp need parsing
+            match = _TIMESTAMP.match(line)
+            logtime = match.group(1) if match else self._parse_line(line).get('timestamp', 0)
             try:
-                logtime = date.fromtimestamp(float(info.get('timestamp', 0)))
+                logtime = date.fromtimestamp(float(logtime))
                 if logtime > timestamp:
-                    yield info
+                    yield self._record(line)
             except:
                 pass
@@ -79,6 +79,20 @@ class DmesgLineList(CommandParser, LogFileOutput):
                     msgs.append(msg)
         return msgs
 
+    def line_timestamps(self):
+        """
+        Returns the time stamp of each line as the floating point number of
+        seconds after boot, or ``None`` for lines without one.
+
+        Returns:
+            (list): one time stamp or ``None`` for each of the lines.
+        """
+        stamps = []
+        for line in self.lines:
+            match = self._line_re.search(line)
+            stamps.append(float(match.group('timestamp')) if match and match.group('timestamp') else None)
+        return stamps
+
     def get_after(self, timestamp, s=None):
         """
         Find all the (available) logs that are after the given time stamp.
@@ -5,7 +5,7 @@ ForemanTasksConfig - file ``/etc/sysconfig/foreman-tasks``
 from insights.specs import Specs
 from insights.util import deprecated
 from . import split_kv_pairs
-from .. import LegacyItemAccess, Parser, get_active_lines, parser
+from .. import LegacyItemAccess, Parser, parser
 
 
 @parser(Specs.foreman_tasks_config)
@@ -61,4 +61,4 @@ class ForemanTasksConfig(Parser, LegacyItemAccess):
         super(ForemanTasksConfig, self).__init__(*args, **kwargs)
 
     def parse_content(self, content):
-        self.data = split_kv_pairs(get_active_lines(content))
+        self.data = split_kv_pairs(content)
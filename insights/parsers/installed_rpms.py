@@ -73,10 +73,16 @@ import re
 from collections import defaultdict
 
 import six
+from six.moves import intern
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
 
 from ..util import rsplit
 from .. import parser, get_active_lines, CommandParser
-from .rpm_vercmp import rpm_version_compare
+from .rpm_vercmp import evr_key
 from insights.specs import Specs
 
 # This list of architectures is taken from PDC (Product Definition Center):
@@ -141,6 +147,48 @@ This list is taken from the PDC (Product Definition Center) available
 here https://pdc.fedoraproject.org/rest_api/v1/arches/.
 """
 
+_ARCHITECTURES = frozenset(KNOWN_ARCHITECTURES)
+
+_INTERNED = ('name', 'arch', 'epoch', 'vendor', 'buildserver')
+
+
+def _intern(value):
+    # Only native strings can be interned on python 2
+    return intern(value) if type(value) is str else value
+
+
+class _ColumnPackages(Mapping):
+    """
+    Read only ``dict`` of the packages stored in columns.  The
+    :class:`InstalledRpm` objects for a package name are only created when
+    it's looked up, and are then kept.
+    """
+    def __init__(self, columns, rows):
+        self._columns = columns
+        self._rows = rows
+        self._built = {}
+
+    def __getitem__(self, name):
+        try:
+            return self._built[name]
+        except KeyError:
+            pass
+        rpms = [InstalledRpm(self._row(i)) for i in self._rows[name]]
+        self._built[name] = rpms
+        return rpms
+
+    def _row(self, i):
+        return dict((k, c[i]) for k, c in self._columns.items() if c[i] is not None)
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, name):
+        return name in self._rows
+
 
 @parser(Specs.installed_rpms)
 class InstalledRpms(CommandParser):
@@ -148,6 +196,14 @@ class InstalledRpms(CommandParser):
     A parser for working with data containing a list of installed RPM files on the system and
     related information.
     """
+    columnar = False
+    """
+    Set to True on the class to keep the fields of all of the packages in
+    :attr:`columns` instead of an :class:`InstalledRpm` object each.
+    :attr:`packages` then only creates the objects for the package names
+    that are looked up.
+    """
+
     def __init__(self, *args, **kwargs):
         self.errors = []
         """list: List of input lines that indicate an error acquiring the data on the client."""
@@ -155,29 +211,65 @@ class InstalledRpms(CommandParser):
         """list: List of input lines that raised an exception during parsing."""
         self.packages = defaultdict(list)
         """dict (InstalledRpm): Dictionary of RPMs keyed by package name."""
+        self.columns = None
+        """dict: Lists of each field of every package, keyed by field, when
+        :attr:`columnar` is set.  Packages without a field have ``None``."""
 
         super(InstalledRpms, self).__init__(*args, **kwargs)
 
-    def parse_content(self, content):
+    def _fields(self, content):
+        """
+        Yields each package line with the dictionary of its fields.  Whether
+        the packages are JSON or package lines is decided from the first
+        one.
+        """
+        json_input = None
         for line in get_active_lines(content, comment_char='COMMAND>'):
             if line.startswith('error:') or line.startswith('warning:'):
                 self.errors.append(line)
-            else:
+                continue
+            if json_input is None:
+                json_input = line.startswith('{')
+            data = None
+            if json_input:
                 try:
-                    # Try to parse from JSON input
-                    rpm = InstalledRpm.from_json(line)
-                    self.packages[rpm.name].append(rpm)
+                    data = json.loads(line)
+                except ValueError:
+                    pass
+            if not isinstance(data, dict):
+                try:
+                    data = InstalledRpm._parse_line(line)
                 except Exception:
-                    # If that fails, try to parse from line input
-                    if line.strip():
-                        try:
-                            rpm = InstalledRpm.from_line(line)
-                            self.packages[rpm.name].append(rpm)
-                        except Exception:
-                            # Both ways failed
-                            self.unparsed.append(line)
-        # Don't want defaultdict's behavior after parsing is complete
-        self.packages = dict(self.packages)
+                    self.unparsed.append(line)
+                    continue
+            yield line, data
+
+    def parse_content(self, content):
+        if not self.columnar:
+            for line, data in self._fields(content):
+                rpm = InstalledRpm(data)
+                self.packages[rpm.name].append(rpm)
+            # Don't want defaultdict's behavior after parsing is complete
+            self.packages = dict(self.packages)
+            return
+
+        columns = defaultdict(list)
+        rows = defaultdict(list)
+        count = 0
+        for line, data in self._fields(content):
+            if data.get('epoch') == '(none)':
+                del data['epoch']
+            for key, value in data.items():
+                column = columns[key]
+                if len(column) < count:
+                    column.extend([None] * (count - len(column)))
+                column.append(_intern(value) if key in _INTERNED else value)
+            count += 1
+            rows[_intern(data.get('name'))].append(count - 1)
+        for column in columns.values():
+            column.extend([None] * (count - len(column)))
+        self.columns = dict(columns)
+        self.packages = _ColumnPackages(self.columns, dict(rows))
 
     def __contains__(self, package_name):
         """
@@ -325,6 +417,10 @@ class InstalledRpm(object):
     ]
     """list: List of keys for SOS Report RPM information."""
 
+    # Fields most packages don't have, such as the SOS Report ones, go in
+    # __dict__, which is only created when one is set.
+    __slots__ = ('name', 'version', 'release', 'arch', 'epoch', '_evr', '_sort_key', '__dict__')
+
     def __init__(self, data):
         self.name = None
         """str: RPM package name."""
@@ -334,13 +430,15 @@ class InstalledRpm(object):
         """str: RPM package release."""
         self.arch = None
         """str: RPM package architecture."""
+        self._evr = None
+        self._sort_key = None
 
         if isinstance(data, six.string_types):
             data = self._parse_package(data)
 
         for k, v in data.items():
-            setattr(self, k, v)
-        self.epoch = data['epoch'] if 'epoch' in data and data['epoch'] != '(none)' else '0'
+            setattr(self, k, _intern(v) if k in _INTERNED else v)
+        self.epoch = self.epoch if 'epoch' in data and data['epoch'] != '(none)' else '0'
 
     @classmethod
     def from_package(cls, package_string):
@@ -416,7 +514,7 @@ class InstalledRpm(object):
             dict: dictionary containing 'name', 'version', 'release' and 'arch' keys
         """
         pkg, arch = rsplit(package_string, cls._arch_sep(package_string))
-        if arch not in KNOWN_ARCHITECTURES:
+        if arch not in _ARCHITECTURES:
             pkg, arch = (package_string, None)
         pkg, release = rsplit(pkg, '-')
         name, version = rsplit(pkg, '-')
@@ -520,24 +618,37 @@ class InstalledRpm(object):
     def __repr__(self):
         return str(self)
 
-    def __eq__(self, other):
-        if not isinstance(other, InstalledRpm):
-            return False
+    @property
+    def sort_key(self):
+        """
+        tuple: Key that orders packages by epoch, version and release the
+        same way rpm does, so that comparing two packages is a tuple
+        comparison.  It's worked out once and recomputed only if the
+        epoch, version or release change.
+        """
+        evr = (self.epoch, self.version, self.release)
+        if self._evr != evr:
+            self._sort_key = evr_key(*evr)
+            self._evr = evr
+        return self._sort_key
 
+    def _key_against(self, other):
         if self.name != other.name:
             raise ValueError('Cannot compare packages with differing names {0} != {1}'
                              .format(self.name, other.name))
+        return self.sort_key, other.sort_key
 
-        return rpm_version_compare(self, other) == 0
-
-    def __lt__(self, other):
+    def __eq__(self, other):
         if not isinstance(other, InstalledRpm):
             return False
+        mine, theirs = self._key_against(other)
+        return mine == theirs
 
-        if self == other:
+    def __lt__(self, other):
+        if not isinstance(other, InstalledRpm):
             return False
-
-        return rpm_version_compare(self, other) < 0
+        mine, theirs = self._key_against(other)
+        return mine < theirs
 
     def __ne__(self, other):
         return not self == other
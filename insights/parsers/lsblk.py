@@ -103,7 +103,7 @@ Examples:
 from __future__ import division
 import re
 from .. import parser, CommandParser
-from . import ParseException, keyword_search
+from . import ParseException, SearchableTable
 from insights.specs import Specs
 
 MAX_GENERATIONS = 20
@@ -175,6 +175,8 @@ class BlockDevices(CommandParser):
             objects keyed on the 'NAME' column (e.g. ``sda`` or ``rhel-swap``)
     """
 
+    _table = None
+
     def __len__(self):
         return len(self.rows)
 
@@ -203,7 +205,9 @@ class BlockDevices(CommandParser):
         Returns:
             (list): The list of mount points matching the given criteria.
         """
-        return keyword_search(self.rows, **kwargs)
+        if self._table is None:
+            self._table = SearchableTable(self.rows)
+        return self._table.search(**kwargs)
 
 
 @parser(Specs.lsblk)
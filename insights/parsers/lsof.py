@@ -11,6 +11,10 @@ on the ``Scannable`` parser class.  There are several ways to use this:
 
 * If you simply want to know whether a search matched, use the ``any`` method.
 * If you want all lines that match, use the ``collect`` method.
+* The ``any_where`` and ``collect_where`` methods do the same given column
+  conditions instead of a function, and are evaluated over whole columns.
+* If you want to look rows up by column values after parsing, use the
+  ``select`` and ``row`` methods of the parser object.
 
 The way these scanner functions work is:
 
@@ -73,6 +77,17 @@ class Lsof(CommandParser, Scannable):
     widths from the first row and then puts the data in each row into a
     dictionary keyed on the column name and found by the locations of each
     column.  Leading and trailing spaces are stripped from data.
+
+    The column boundaries are computed once from the header, and the data is
+    kept column by column in the ``columns`` attribute, with equal values
+    shared between rows.  Scanners registered with ``collect_keys`` are
+    evaluated over the columns, so only the rows they select are turned into
+    dictionaries.  Rows are only built for every line when ``any`` or
+    ``collect`` scanners are registered.
+
+    Attributes:
+        columns (dict): a list of the values in each row, keyed on column
+            name.
     """
 
     def _calc_indexes(self, line):
@@ -86,14 +101,14 @@ class Lsof(CommandParser, Scannable):
             self.indexes[col_name] = self.mid_cols.index(col_name) + len(col_name)
         self.indexes["FD"] += 2
 
-    def _split_middle(self, middle):
-        mid_dict = {}
+        # (column, start, end) of each column in a line
+        self._slices = [("COMMAND", 0, self.pid_idx)]
         offset = 0
         for col in self.mid_cols.split():
             idx = self.indexes[col]
-            mid_dict[col] = middle[offset:idx].strip()
+            self._slices.append((col, self.pid_idx + offset, min(self.pid_idx + idx, self.name_idx)))
             offset = idx
-        return mid_dict
+        self._slices.append(("NAME", self.name_idx, None))
 
     def _start(self, content):
         """
@@ -114,12 +129,7 @@ class Lsof(CommandParser, Scannable):
         Given a line, returns a dictionary for that line. Requires _start to be
         called first.
         """
-        command, rest = line[:self.pid_idx], line[self.pid_idx:]
-        name = line[self.name_idx:]
-        middle_dict = self._split_middle(rest[:self.name_idx - len(command)])
-        middle_dict["COMMAND"] = command.strip()
-        middle_dict["NAME"] = name.strip()
-        return middle_dict
+        return dict((col, line[start:end].strip()) for col, start, end in self._slices)
 
     def parse(self, content):
         """
@@ -128,6 +138,87 @@ class Lsof(CommandParser, Scannable):
         for line in self._start(content):
             yield self._parse_line(line)
 
+    def _read_columns(self, content):
+        try:
+            lines = self._start(content)
+        except StopIteration:
+            return {}
+        columns = dict((col, []) for col, _, _ in self._slices)
+        appends = [(columns[col].append, start, end) for col, start, end in self._slices]
+        seen = {}
+        for line in lines:
+            for append, start, end in appends:
+                value = line[start:end].strip()
+                append(seen.setdefault(value, value))
+        return columns
+
+    def parse_content(self, content):
+        self.columns = self._read_columns(content)
+        plan = self._condition_plan()
+        if plan:
+            self._run_column_conditions(plan)
+        row_scanners = []
+        for scanner in self.scanners:
+            if hasattr(scanner, "select"):
+                result_key, kwargs = scanner.select
+                setattr(self, result_key, [self.row(i) for i in self.select(**kwargs)])
+            elif not hasattr(scanner, "conditions"):
+                row_scanners.append(scanner)
+        if row_scanners:
+            for i in range(len(self.columns.get("COMMAND", []))):
+                row = self.row(i)
+                for scanner in row_scanners:
+                    scanner(self, row)
+
+    def _run_column_conditions(self, plan):
+        """
+        Evaluates the ``any_where`` and ``collect_where`` scanners over the
+        columns, testing each distinct value of a column only once.
+        """
+        conditions, scans = plan
+        rows = len(self.columns.get("COMMAND", []))
+        masks = []
+        for c in conditions:
+            column = self.columns.get(c.field) if c.field else None
+            masks.append([c.test_value(v) for v in column] if column is not None else [False] * rows)
+        for kind, result_key, nums in scans:
+            selected = (i for i in range(rows) if all(masks[n][i] for n in nums))
+            if kind == "any":
+                setattr(self, result_key, any(True for _ in selected))
+            else:
+                setattr(self, result_key, [self.row(i) for i in selected])
+
+    def row(self, index):
+        """
+        Returns the dictionary for row number index.
+        """
+        return dict((col, values[index]) for col, values in self.columns.items())
+
+    def select(self, **kwargs):
+        """
+        Returns the numbers of the rows whose columns match all the given
+        keyword=value pairs.  Keywords that aren't column names are ignored,
+        and ``SIZE/OFF`` is given as ``SIZE_OFF``.
+
+        Examples:
+            >>> [l.row(i)['COMMAND'] for i in l.select(USER='root', FD='0r')]
+            ['abrt-watc', 'wpa_suppl']
+        """
+        if 'SIZE_OFF' in kwargs:
+            kwargs['SIZE/OFF'] = kwargs.pop('SIZE_OFF')
+        rows = None
+        for key, value in kwargs.items():
+            column = self.columns.get(key)
+            if column is None:
+                continue
+            if rows is None:
+                rows = [i for i, v in enumerate(column) if v == value]
+            else:
+                rows = [i for i in rows if column[i] == value]
+        if rows is None:
+            return list(range(len(self.columns.get("COMMAND", []))))
+        return rows
+
     @classmethod
     def collect_keys(cls, result_key, **kwargs):
         """
@@ -159,4 +250,6 @@ class Lsof(CommandParser, Scannable):
             # OK, save the item now.
             getattr(self, result_key).append(obj)
 
+        # Lsof.parse_content evaluates this over the columns instead
+        scanner.select = (result_key, kwargs)
         cls._scan(result_key, scanner)
@@ -65,8 +65,7 @@ class LsPci(CommandParser, LogFileOutput):
         # Use all the defined scanners to search the log file, setting the
         # properties defined in the scanner.
         self.lines = [l for l in content if len(l) > 0 and l[0].isdigit()]
-        for scanner in self.scanners:
-            scanner(self)
+        self._run_scanners()
         # Parse kernel driver lines
         self.data = {}
         bus_device_function = None
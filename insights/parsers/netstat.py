@@ -27,7 +27,7 @@ SsTUPNA - command ``ss -tupna``
 from collections import defaultdict
 from . import ParseException, parse_delimited_table
 from .. import parser, LegacyItemAccess, CommandParser
-from insights.parsers import keyword_search
+from insights.parsers import SearchableTable
 from insights.specs import Specs
 
 
@@ -472,6 +472,7 @@ class Netstat(CommandParser):
         self.data = dict((s.name, s._merge_data_index()) for s in sections)
         self.lines = dict((s.name, s.lines) for s in sections)
         self.datalist = dict((s.name, s.datalist) for s in sections)
+        self._tables = {}
 
     @property
     def running_processes(self):
@@ -573,7 +574,9 @@ class Netstat(CommandParser):
 
         found = []
         for l in search_list:
-            found.extend(keyword_search(self.datalist[l], **kwargs))
+            if l not in self._tables:
+                self._tables[l] = SearchableTable(self.datalist[l])
+            found.extend(self._tables[l].search(**kwargs))
         return found
 
 
@@ -16,9 +16,9 @@ ConsoleLog - file ``/var/log/ovirt-engine/console.log``
 -------------------------------------------------------
 """
 from time import strptime
-from datetime import datetime
 from insights import LogFileOutput, Syslog, parser
 from insights.specs import Specs
+from insights.util import timestamps
 
 
 @parser(Specs.ovirt_engine_boot_log)
@@ -105,11 +105,10 @@ class EngineLog(LogFileOutput):
         line_splits = line.split()
         dt = ' '.join(line_splits[0:2]).split(',')[0]
         try:
-            if datetime.strptime(dt, self.time_format):
-                msg_info['timestamp'] = datetime.strptime(dt, self.time_format)
-                msg_info['level'] = line_splits[2]
-                msg_info['procname'] = line_splits[3].strip('[]')
-                msg_info['message'] = ' '.join(line_splits[4:])
+            msg_info['timestamp'] = timestamps.strptime(dt, self.time_format)
+            msg_info['level'] = line_splits[2]
+            msg_info['procname'] = line_splits[3].strip('[]')
+            msg_info['message'] = ' '.join(line_splits[4:])
         except ValueError:
             pass
         return msg_info
@@ -114,7 +114,7 @@ References:
 
 from collections import namedtuple
 from .. import Parser, get_active_lines, parser
-from ..parsers import unsplit_lines, keyword_search, optlist_to_dict
+from ..parsers import tokenize_config, keyword_search, optlist_to_dict
 
 import re
 from insights.specs import Specs
@@ -318,8 +318,8 @@ class PamDConf(Parser):
     """
     def parse_content(self, content):
         self.data = []
-        # Need unsplit_lines for handling \ line continuations
-        for line in get_active_lines(unsplit_lines(content)):
+        # Join lines continued with \ before removing comments
+        for line in tokenize_config(content, cont_char='\\'):
             self.data.append(PamConfEntry(line, pamd_conf=True, service=self.file_name))
 
     def __iter__(self):
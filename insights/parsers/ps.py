@@ -5,7 +5,7 @@ Ps - command ``ps auxww`` and others
 This module provides processing for the various outputs of the ``ps`` command.
 """
 from .. import parser, CommandParser
-from . import ParseException, parse_delimited_table, keyword_search
+from . import ParseException, parse_delimited_table, SearchableTable
 from insights.specs import Specs
 from insights.core.filters import add_filter
 
@@ -56,6 +56,10 @@ class Ps(CommandParser):
         self.running = set()
         self.cmd_names = set()
         self.services = []
+        self._table = None
+        self._indexes = {}
+        self._commands = None
+        self._occurrences = {}
         super(Ps, self).__init__(*args, **kwargs)
 
     def parse_content(self, content):
@@ -99,6 +103,23 @@ class Ps(CommandParser):
         for row in self.data:
             yield row
 
+    def _by(self, column):
+        """
+        Returns the rows keyed on their value in column, in order.  Rows
+        without the column are left out.  Each index is built the first
+        time it's used.
+        """
+        try:
+            return self._indexes[column]
+        except KeyError:
+            pass
+        index = {}
+        for row in self.data:
+            if column in row:
+                index.setdefault(row[column], []).append(row)
+        self._indexes[column] = index
+        return index
+
     def running_pids(self):
         """
         Gives the list of process IDs in the order listed.
@@ -124,11 +145,8 @@ class Ps(CommandParser):
         valid_user_columns = ['USER', 'UID']
         ret = {}
         if self.user_name in valid_user_columns:
-            for row in self.data:
-                if proc == row[self.command_name]:
-                    if row[self.user_name] not in ret:
-                        ret[row[self.user_name]] = []
-                    ret[row[self.user_name]].append(row["PID"])
+            for row in self._by(self.command_name).get(proc, []):
+                ret.setdefault(row[self.user_name], []).append(row["PID"])
         return ret
 
     def fuzzy_match(self, proc):
@@ -141,6 +159,10 @@ class Ps(CommandParser):
         .. note::
            'proc' can match anywhere in the command path, name or arguments.
         """
+        if self._commands is None:
+            self._commands = "\n".join(row[self.command_name] for row in self.data)
+        if "\n" not in proc:
+            return bool(self.data) and proc in self._commands
         return any(proc in row[self.command_name] for row in self.data)
 
     def number_occurences(self, proc):
@@ -153,7 +175,9 @@ class Ps(CommandParser):
         .. note::
            'proc' can match anywhere in the command path, name or arguments.
         """
-        return len([True for row in self.data if proc in row[self.command_name]])
+        if proc not in self._occurrences:
+            self._occurrences[proc] = sum(1 for row in self.data if proc in row[self.command_name])
+        return self._occurrences[proc]
 
     def search(self, **kwargs):
         """
@@ -196,7 +220,64 @@ class Ps(CommandParser):
             ... ]
             True
         """
-        return keyword_search(self.data, **kwargs)
+        if self._table is None:
+            self._table = SearchableTable(self.data)
+        return self._table.search(**kwargs)
+
+    def children(self, ppid):
+        """list: Returns a list of dict for all rows with `ppid` as parent PID"""
+        return list(self._by('PPID').get(ppid, []))
+
+    def threads(self, pid):
+        """
+        list: Returns a list of dict for all rows with `pid` as PID, which is
+        one row per thread when ``ps`` lists threads.
+        """
+        return list(self._by('PID').get(pid, []))
+
+    def descendants(self, pid):
+        """
+        Returns the rows of the children of the process `pid`, their
+        children, and so on, nearest first.  The output needs a ``PPID``
+        column for any to be found.
+
+        Returns:
+            list: the rows of the descendants of ``pid``.
+        """
+        by_ppid = self._by('PPID')
+        seen = set([pid])
+        found = []
+        pending = [pid]
+        while pending:
+            parents, pending = pending, []
+            for ppid in parents:
+                for row in by_ppid.get(ppid, []):
+                    if row['PID'] not in seen:
+                        seen.add(row['PID'])
+                        pending.append(row['PID'])
+                        found.append(row)
+        return found
+
+    def ancestors(self, pid):
+        """
+        Returns the rows of the parent of the process `pid`, its parent, and
+        so on up to the first process, nearest first.  The output needs a
+        ``PPID`` column for any to be found.
+
+        Returns:
+            list: the rows of the ancestors of ``pid``.
+        """
+        by_pid = self._by('PID')
+        seen = set([pid])
+        found = []
+        rows = by_pid.get(pid)
+        while rows and 'PPID' in rows[0] and rows[0]['PPID'] not in seen:
+            ppid = rows[0]['PPID']
+            seen.add(ppid)
+            rows = by_pid.get(ppid)
+            if rows:
+                found.append(rows[0])
+        return found
 
 
 add_filter(Specs.ps_auxww, "COMMAND")
@@ -254,9 +335,8 @@ class PsAuxww(Ps):
         .. note::
            'proc' must match the entire command and arguments.
         """
-        for row in self.data:
-            if proc == row[self.command_name]:
-                return row["%CPU"]
+        for row in self._by(self.command_name).get(proc, []):
+            return row["%CPU"]
 
     pass
 
@@ -306,11 +386,10 @@ class PsEf(Ps):
             list: First one is the parent pid corresponding to ``pid`` in command and second one is parent command name.
             ``None`` if ``proc`` is not found.
         """
-        for row in self.data:
-            if pid == row["PID"]:
-                for sub_row in self.data:
-                    if sub_row["PID"] == row["PPID"]:
-                        return [row["PPID"], sub_row[self.command_name]]
+        by_pid = self._by("PID")
+        for row in by_pid.get(pid, []):
+            for sub_row in by_pid.get(row["PPID"], []):
+                return [row["PPID"], sub_row[self.command_name]]
 
     pass
 
@@ -378,10 +457,6 @@ class PsEo(Ps):
         for row in self.data:
             self.pid_info[row['PID']] = row
 
-    def children(self, ppid):
-        """list: Returns a list of dict for all rows with `ppid` as parent PID"""
-        return [row for row in self.data if row['PPID'] == ppid]
-
 
 add_filter(Specs.ps_alxwww, "COMMAND")
 
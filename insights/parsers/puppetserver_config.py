@@ -5,7 +5,7 @@ PuppetserverConfig - file ``/etc/sysconfig/puppetserver``
 from insights.specs import Specs
 from insights.util import deprecated
 from . import split_kv_pairs
-from .. import LegacyItemAccess, Parser, get_active_lines, parser
+from .. import LegacyItemAccess, Parser, parser
 
 
 @parser(Specs.puppetserver_config)
@@ -59,4 +59,4 @@ class PuppetserverConfig(Parser, LegacyItemAccess):
         super(PuppetserverConfig, self).__init__(*args, **kwargs)
 
     def parse_content(self, content):
-        self.data = split_kv_pairs(get_active_lines(content))
+        self.data = split_kv_pairs(content)
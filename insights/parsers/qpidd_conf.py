@@ -5,7 +5,7 @@ QpiddConfig - file ``/etc/qpid/qpidd.conf``
 from insights.specs import Specs
 
 from . import split_kv_pairs
-from .. import LegacyItemAccess, Parser, get_active_lines, parser
+from .. import LegacyItemAccess, Parser, parser
 
 
 @parser(Specs.qpidd_conf)
@@ -46,4 +46,4 @@ class QpiddConf(Parser, LegacyItemAccess):
     """
 
     def parse_content(self, content):
-        self.data = split_kv_pairs(get_active_lines(content))
+        self.data = split_kv_pairs(content)
@@ -12,6 +12,7 @@ from datetime import datetime
 from .. import parser, LogFileOutput
 import re
 from insights.specs import Specs
+from insights.util import timestamps
 
 
 @parser(Specs.rhn_taskomatic_daemon_log)
@@ -137,7 +138,7 @@ class ServerXMLRPCLog(LogFileOutput):
             try:
                 stamp = match.group('timestamp')
                 # Cannot guess time zone from e.g. '+01:00', so strip timezone
-                msg_info['datetime'] = datetime.strptime(
+                msg_info['datetime'] = timestamps.strptime(
                     stamp[0:19], self.time_format)
             except ValueError:
                 pass
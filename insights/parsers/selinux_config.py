@@ -2,7 +2,7 @@
 SelinuxConfig - file ``/etc/selinux/config``
 ============================================
 """
-from .. import get_active_lines, Parser, parser, LegacyItemAccess
+from .. import Parser, parser, LegacyItemAccess
 from . import split_kv_pairs
 from insights.specs import Specs
 
@@ -40,4 +40,4 @@ class SelinuxConfig(Parser, LegacyItemAccess):
     """
 
     def parse_content(self, content):
-        self.data = split_kv_pairs(get_active_lines(content))
+        self.data = split_kv_pairs(content)
@@ -5,7 +5,7 @@ SSSDLog - files matching ``/var/log/sssd/*.log``
 """
 
 from .. import parser, LogFileOutput
-from datetime import datetime
+from insights.util import timestamps
 from insights.specs import Specs
 
 
@@ -80,7 +80,7 @@ class SSSDLog(LogFileOutput):
         }
         # Try to convert the datetime if possible
         try:
-            parsed_line['datetime'] = datetime.strptime(
+            parsed_line['datetime'] = timestamps.strptime(
                 parsed_line['timestamp'],
                 '%a %b %d %H:%M:%S %Y'
             )
@@ -127,3 +127,22 @@ def test_audit_log():
     logtime = date.fromtimestamp(1506047401.407)
     logs = list(auditlog.get_after(timestamp=logtime))
     assert logs[0]['raw_message'] == LAST_LINE_OF_TEMPLATE
+
+
+def test_split_matches_shlex():
+    import shlex
+    from insights.parsers.audit_log import _split
+
+    lines = (AUDIT_LOG_TEMPALTE % AUDIT_LOG_NORMAL).splitlines() + [
+        AUDIT_LOG_START_WITH_SOME_WIRED_STRINGS,
+        'type=USER msg=audit(1.0:1): msg=\'a "b c" d\' e="f \'g\'"h',
+        'type=USER msg=audit(1.0:1): a="" b=\'\'',
+        'type=USER msg=audit(1.0:1): a=b\\ c',
+        '  leading\tand trailing  ',
+        '',
+    ]
+    for line in lines:
+        assert _split(line) == shlex.split(line)
+
+    with pytest.raises(ValueError):
+        _split('type=USER msg="unbalanced')
@@ -82,3 +82,11 @@ def test_dmesg():
     assert len(list(ts_info.get_after(0.024847, 'x2apic'))) == 3
     assert ts_info.logs_startwith('perf') == ['perf: interrupt took too long (2507 > 2500), lowering kernel.perf_event_max_sample_rate to 79750']
     assert ts_info.logs_startwith('systemd') == []
+
+
+def test_line_timestamps():
+    dmesg_info = DmesgLineList(context_wrap(MSGINFO))
+    stamps = dmesg_info.line_timestamps()
+    assert len(stamps) == len(dmesg_info.lines)
+    assert stamps[0] is None
+    assert 8.687252 in stamps
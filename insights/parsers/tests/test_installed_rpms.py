@@ -1,4 +1,5 @@
 import pytest
+import pickle
 from insights.parsers.installed_rpms import InstalledRpms, InstalledRpm, pad_version
 from insights.tests import context_wrap
 
@@ -507,3 +508,52 @@ def test_vmaas():
     assert isinstance(rpm, InstalledRpm)
     assert rpm.version == "5.2.2"
     assert rpm.release == "1.el7"
+
+
+def test_sort_key():
+    older = InstalledRpm.from_package('bash-4.2.45-5.el7.x86_64')
+    newer = InstalledRpm.from_package('bash-4.2.46-5.el7.x86_64')
+    key = older.sort_key
+    assert older.sort_key is key
+    assert older < newer and not newer < older
+
+    older.epoch = '1'
+    assert older.sort_key is not key
+    assert older > newer
+
+    with pytest.raises(ValueError):
+        older < InstalledRpm.from_package('zsh-5.0.2-28.el7.x86_64')
+
+
+@pytest.mark.parametrize("data", [
+    RPMS_PACKAGE, RPMS_PACKAGE_WITH_GARBAGE, RPMS_LINE, RPM_MANIFEST, RPMS_JSON,
+    RPMS_MULTIPLE_KERNEL, ERROR_DB, ORACLEASM_RPMS,
+])
+def test_columnar(monkeypatch, data):
+    rpms = InstalledRpms(context_wrap(data))
+    monkeypatch.setattr(InstalledRpms, "columnar", True)
+    columnar = InstalledRpms(context_wrap(data))
+
+    assert rpms.columns is None
+    assert sorted(columnar.packages) == sorted(rpms.packages)
+    assert columnar.errors == rpms.errors
+    assert columnar.unparsed == rpms.unparsed
+    for name, expected in rpms.packages.items():
+        assert name in columnar
+        actual = columnar.packages[name]
+        assert actual is columnar.packages[name]
+        assert [str(r) for r in actual] == [str(r) for r in expected]
+        assert [vars(r) for r in actual] == [vars(r) for r in expected]
+        assert columnar.get_max(name) == rpms.get_max(name)
+
+
+def test_compact_records():
+    rpms = InstalledRpms(context_wrap(RPMS_LINE))
+    rpm = rpms.get_max('yum')
+    assert vars(rpm).get('vendor') == 'Red Hat, Inc.'
+    assert not hasattr(InstalledRpm.from_package('bash-4.2.46-20.el7_2.x86_64'), 'vendor')
+    assert rpms.get_max('kernel').arch is rpms.get_max('BESAgent').arch
+
+    restored = pickle.loads(pickle.dumps(rpm, pickle.HIGHEST_PROTOCOL))
+    assert restored.nevra == rpm.nevra
+    assert vars(restored) == vars(rpm)
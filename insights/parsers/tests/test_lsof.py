@@ -1,3 +1,4 @@
+import pytest
 from insights.parsers import lsof
 from insights.tests import context_wrap
 
@@ -152,3 +153,78 @@ def test_lsof_scan():
     assert l.root_stdin[1]['SIZE/OFF'] == '0t0'
     assert l.root_stdin[1]['NODE'] == '4674'
     assert l.root_stdin[1]['NAME'] == '/dev/null'
+
+
+class ColumnLsof(lsof.Lsof):
+    pass
+
+
+ColumnLsof.collect_keys('polkitd_stdin', USER='polkitd', FD='0u', SIZE_OFF='0t0')
+ColumnLsof.collect_keys('everything', NOT_A_COLUMN='x')
+
+
+def test_lsof_columns():
+    l = ColumnLsof(context_wrap(LSOF_GOOD_V1))
+    rows = list(lsof.Lsof(context_wrap(LSOF_GOOD_V1)).parse(LSOF_GOOD_V1.splitlines()))
+
+    assert set(l.columns) == set(columns)
+    assert l.columns['PID'][:3] == ['602', '602', '602']
+    assert l.columns['TID'][4] == '615'
+    assert [l.row(i) for i in range(len(rows))] == rows
+    # Repeated values are shared
+    assert l.columns['NAME'][3] is l.columns['NAME'][4]
+
+    assert l.select(TYPE='BLK') == [16]
+    assert l.select(USER='root', FD='0r') == [5, 6]
+    assert l.select(SIZE_OFF='0t0', NODE='6406') == [0]
+    assert l.select(USER='nobody') == []
+    assert len(l.select()) == len(rows)
+
+    assert [r['COMMAND'] for r in l.polkitd_stdin] == ['polkitd', 'gmain', 'gdbus']
+    assert l.everything == rows
+
+
+def test_lsof_no_header():
+    l = ColumnLsof(context_wrap("lsof: WARNING: can't stat() fuse file system"))
+    assert l.columns == {}
+    assert l.polkitd_stdin == []
+    assert l.select(USER='root') == []
+
+
+ColumnLsof.any_where('has_sda', NAME='/dev/sda')
+ColumnLsof.any_where('has_sdb', NAME='/dev/sdb')
+ColumnLsof.collect_where('polkitd_dev', USER='polkitd', NAME__startswith='/dev/', FD__regex='^[12]')
+ColumnLsof.collect_where('tty', NAME__contains='tty')
+
+
+def test_lsof_scan_where():
+    l = ColumnLsof(context_wrap(LSOF_GOOD_V1))
+    assert l.has_sda is True
+    assert l.has_sdb is False
+    assert len(l.polkitd_dev) == 9
+    assert [r['NAME'] for r in l.tty] == ['/dev/tty6']
+    assert l.tty[0] == l.row(2)
+
+
+def test_lsof_push_filter():
+    from insights.core import filters
+    from insights.specs import Specs
+
+    class PushedLsof(lsof.Lsof):
+        pass
+
+    # Not registered as a parser, so there's no datasource
+    with pytest.raises(ValueError):
+        PushedLsof.collect_where('sda', push_filter=True, TYPE='BLK', NAME='/dev/sda')
+
+    try:
+        lsof.Lsof.collect_where('sda_pushed', push_filter=True, TYPE='BLK', NAME='/dev/sda')
+        assert '/dev/sda' in filters.get_filters(Specs.lsof)
+    finally:
+        filters.FILTERS[Specs.lsof].discard('/dev/sda')
+        filters._CACHE.clear()
+        lsof.Lsof.scanners[:] = [s for s in lsof.Lsof.scanners
+                                 if getattr(s, 'conditions', (None, None))[1] != 'sda_pushed']
+        lsof.Lsof.scanner_keys.discard('sda_pushed')
+        if '_cached_condition_plan' in lsof.Lsof.__dict__:
+            del lsof.Lsof._cached_condition_plan
@@ -1,8 +1,9 @@
 import pytest
 from collections import OrderedDict
-from insights.parsers import split_kv_pairs, unsplit_lines, parse_fixed_table
-from insights.parsers import calc_offset, optlist_to_dict, keyword_search
-from insights.parsers import parse_delimited_table, ParseException, SkipException
+from insights.core.spec_factory import ContentLines
+from insights.parsers import get_active_lines, split_kv_pairs, unsplit_lines, parse_fixed_table, tokenize_config
+from insights.parsers import calc_offset, optlist_to_dict, keyword_search, SearchableTable
+from insights.parsers import parse_delimited_table, ParseException, SkipException, Table
 
 SPLIT_TEST_1 = """
 # Comment line
@@ -123,6 +124,28 @@ web.default_taskmaster_tasks = RHN::Task::SessionCleanup, RHN::Task::ErrataQueue
 db_host ="""
 
 
+def test_tokenize_config():
+    lines = SPLIT_TEST_1.splitlines()
+    assert tokenize_config(lines) == [
+        'keyword1 = value1', 'keyword3', 'keyword2 = value2a=True, value2b=100M'
+    ]
+    assert tokenize_config(lines, split_on='=') == [
+        ('keyword1', 'value1'), ('keyword2', 'value2a=True, value2b=100M')
+    ]
+    assert tokenize_config(lines, split_on='=', use_partition=True, filter_string='3') == [('keyword3', '')]
+    assert tokenize_config(SPLIT_LINES.splitlines(), comment_char=None, cont_char='\\') == list(unsplit_lines(SPLIT_LINES.splitlines()))
+
+    # Lines are joined before comments are removed, so key3 is commented out
+    lines = ['key1 = value1 \\', '  value2 # comment', '# key2 = value \\', 'key3 = value3']
+    assert tokenize_config(lines, split_on='=', cont_char='\\') == [('key1', 'value1   value2')]
+
+
+def test_get_active_lines_without_comment_char():
+    lines = ['a b # c', ' x y']
+    assert get_active_lines(lines, comment_char=None) == ['a', 'x']
+    assert get_active_lines(ContentLines(lines), comment_char=None) == ['a', 'x']
+
+
 def test_unsplit_lines():
     lines = list(unsplit_lines(SPLIT_LINES.splitlines()))
     assert len(lines) == 3
@@ -290,6 +313,24 @@ def test_parse_fixed_table():
     assert data[0] == {'NAMESPACE': 'default', 'NAME': 'foo', 'LABELS': 'app=superawesome'}
 
 
+@pytest.mark.parametrize("lines,kwargs", [
+    (FIXED_CONTENT_1, {}),
+    (FIXED_CONTENT_2, {'heading_ignore': ['Column1 ']}),
+    (FIXED_CONTENT_4, {'heading_ignore': ['Column1 '],
+                       'header_substitute': [('Column 2', 'Column_2'), ('Column 3', 'Column_3')],
+                       'trailing_ignore': ['Trailing', 'Another']}),
+    (FIXED_CONTENT_DUP_HEADER_PREFIXES, {}),
+])
+def test_parse_fixed_table_columnar(lines, kwargs):
+    expected = parse_fixed_table(lines.splitlines(), **kwargs)
+    table = parse_fixed_table(lines.splitlines(), columnar=True, **kwargs)
+    assert isinstance(table, Table)
+    assert len(table) == len(expected)
+    assert table == expected
+    assert [dict(r) for r in table] == expected
+    assert set(table.headings) == set(expected[0])
+
+
 def test_optlist_standard():
     d = optlist_to_dict('key1,key2=val2,key1=val1,key3')
     assert sorted(d.keys()) == sorted(['key1', 'key2', 'key3'])
@@ -456,6 +497,46 @@ def test_parse_delimited_table():
     assert expected == result
 
 
+@pytest.mark.parametrize("lines,kwargs", [
+    ([], {}),
+    (PS_AUX_TEST.splitlines(), {'max_splits': 10, 'heading_ignore': ['USER'], 'raw_line_key': '_line'}),
+    (MISSING_DATA_TEST.splitlines(), {'delim': '|', 'heading_ignore': ['LVM2_PV_FMT'],
+                                      'trailing_ignore': ['WARNING', 'ERROR', 'Cannot get lock']}),
+    (SUBSTITUTE_HEADERS_TEST.splitlines(), {'delim': ',', 'strip': False,
+                                            'header_substitute': [('read-only', 'read_only')]}),
+    (POSTGRESQL_LOG.splitlines(), {'delim': '|', 'trailing_ignore': ['(']}),
+    (TABLE3.splitlines(), {'delim': '^', 'header_delim': '|'}),
+    (TABLE2, {'delim': '|', 'header_delim': None}),
+    (['A B A C', '1 2 3 4', '5 6'], {}),
+])
+def test_parse_delimited_table_columnar(lines, kwargs):
+    expected = parse_delimited_table(lines, **kwargs)
+    table = parse_delimited_table(lines, columnar=True, **kwargs)
+    assert isinstance(table, Table)
+    assert table == expected
+    assert [dict(r) for r in table] == expected
+    assert table[-1:] == expected[-1:]
+
+
+def test_table_rows():
+    table = parse_delimited_table(['A B', '1 2', '3'], columnar=True)
+    assert table.headings == ('A', 'B')
+    assert table.columns == {'A': ['1', '3'], 'B': ['2', None]}
+    row = table[1]
+    assert 'B' not in row
+    with pytest.raises(KeyError):
+        row['B']
+    row['C'] = 'new'
+    del row['A']
+    assert dict(row) == {'C': 'new'}
+    assert table.columns['C'] == [None, 'new']
+    assert dict(table[0]) == {'A': '1', 'B': '2'}
+    with pytest.raises(KeyError):
+        del table[0]['C']
+    with pytest.raises(IndexError):
+        table[2]
+
+
 DATA_LIST = [
     {'name': 'test 1', 'role': 'server', 'memory_gb': 16, 'ssd': True},
     {'name': 'test 2', 'role': 'server', 'memory_gb': 256, 'ssd': False},
@@ -588,6 +669,40 @@ def test_keyword_search():
     ) == []
 
 
+@pytest.mark.parametrize("rows,kwargs", [
+    (DATA_LIST, {}),
+    (DATA_LIST, {'cpu_count': 4}),
+    (DATA_LIST, {'memory_gb': 16}),
+    (DATA_LIST, {'memory_gb': 16, 'ssd': False}),
+    (DATA_LIST, {'ssd': False, 'role__contains': 'e'}),
+    (DATA_LIST, {'role__startswith': 'e'}),
+    (DATA_LIST, {'role': ['unhashable']}),
+    (CERT_LIST, {'pre_save_command': '',
+                 'key_pair_storage__startswith': "type=NSSDB,location='/etc/dirsrv/slapd-PKI-IPA'"}),
+    (CERT_LIST, {'status__lower_value': 'Monitoring'}),
+    (CERT_LIST, {'dash__space': 'tested'}),
+    (CERT_LIST, {'certificate__contains': 'type'}),
+    ([], {'role': 'server'}),
+    ([{'a b': 1, 'a-b': 2}, {'a_b': 1}], {'a_b': 2}),
+    ([{'a b': 1, 'a-b': 2}, {'a_b': 1}], {'a_b': 1}),
+])
+def test_searchable_table(rows, kwargs):
+    table = SearchableTable(rows)
+    assert len(table) == len(rows)
+    expected = keyword_search(rows, **kwargs)
+    assert table.search(**kwargs) == expected
+    # Again, from the indexes built by the first search
+    assert table.search(**kwargs) == expected
+
+
+def test_searchable_table_index():
+    rows = [{'name': 'n%d' % (i % 10), 'id': i} for i in range(100)]
+    table = SearchableTable(rows)
+    assert table.search(name='n3') == [r for r in rows if r['name'] == 'n3']
+    assert table._indexes['name']['n3'] == list(range(3, 100, 10))
+    assert table.search(name='n3', id=13) == [rows[13]]
+
+
 def test_parse_exception():
     with pytest.raises(ParseException) as e_info:
         raise ParseException('This is a parse exception')
@@ -387,6 +387,46 @@ def test_ps_eo():
         {'PID': '18379', 'PPID': '18347', 'COMMAND': 'ps', 'COMMAND_NAME': 'ps', 'ARGS': ''}
     ]
     assert len(p.children('2')) == 6
+    assert p.children('18379') == []
+
+
+def test_ps_eo_tree():
+    p = ps.PsEo(context_wrap(PS_EO_NORMAL))
+    assert [r['PID'] for r in p.descendants('18302')] == ['18303', '18338', '18346', '18347', '18379']
+    assert [r['PID'] for r in p.descendants('2419')] == ['2421']
+    assert p.descendants('18379') == []
+    assert [r['PID'] for r in p.ancestors('2421')] == ['2419', '2416', '1']
+    # 3357 isn't listed, so the walk stops at 18294
+    assert [r['PID'] for r in p.ancestors('18303')] == ['18302', '18294']
+    assert p.ancestors('99999') == []
+    assert p.threads('2416') == [p.pid_info['2416']]
+
+
+def test_ps_tree_cycle():
+    p = ps.PsEo(context_wrap("""
+  PID  PPID COMMAND
+   10    11 a
+   11    10 b
+"""))
+    assert [r['PID'] for r in p.descendants('10')] == ['11']
+    assert [r['PID'] for r in p.ancestors('10')] == ['11']
+
+
+def test_ps_lookups():
+    p = ps.PsAuxww(context_wrap(PsAuxww_TEST_DOC))
+    assert p.users('/bin/bash') == {'root': ['20457'], 'user1': ['20160']}
+    assert p.users('/bin/zsh') == {}
+    assert p.fuzzy_match('crond -n')
+    assert not p.fuzzy_match('-n\n')
+    assert not p.fuzzy_match('-n\nroot')
+    assert p.number_occurences('bash') == 2
+    assert p.number_occurences('bash') == 2
+    assert p.number_occurences('zsh') == 0
+    assert p.cpu_usage('/usr/sbin/crond -n') == '0.0'
+    assert p.cpu_usage('/bin/zsh') is None
+    # No PPID column
+    assert p.children('1') == []
+    assert p.descendants('1') == []
 
 
 PS_ALXWWW_DATA = """
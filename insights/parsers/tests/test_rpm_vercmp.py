@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 import pytest
-from insights.parsers.rpm_vercmp import _rpm_vercmp
+from insights.parsers.rpm_vercmp import _rpm_vercmp, version_key
 
 
 # data copied from
@@ -174,3 +174,16 @@ def test_rpm_vercmp(rpm_data):
     for l, r, expected in rpm_data:
         actual = _rpm_vercmp(l, r)
         assert actual == expected, (l, r, actual, expected)
+
+
+def test_version_key_order(rpm_data):
+    versions = set(l for l, _, _ in rpm_data) | set(r for _, r, _ in rpm_data)
+    ordered = sorted(versions, key=version_key)
+    for i, left in enumerate(ordered):
+        for right in ordered[i + 1:]:
+            assert _rpm_vercmp(left, right) <= 0, (left, right)
+
+
+def test_version_key_cached():
+    assert version_key("1.2.3~rc1") is version_key("1.2.3~rc1")
+    assert version_key("1.02") == version_key("1.2")
@@ -7,6 +7,7 @@ import re
 from insights import LogFileOutput, parser
 from datetime import datetime
 from insights.specs import Specs
+from insights.util import timestamps
 
 
 @parser(Specs.vdsm_log)
@@ -89,6 +90,7 @@ class VDSMLog(LogFileOutput):
         This will NOT parse Python Traceback. Any unparsed line(s) will be yield as a list
         """
         time_format = '%Y-%m-%d %H:%M:%S,%f'
+        parse_time = timestamps.get_parser(time_format)
 
         # Parse data & time including milisecond at the begining of
         # line. Will ignore TZ hours difference.
@@ -130,7 +132,7 @@ class VDSMLog(LogFileOutput):
                 fields['logname'] = re_name_obj.findall(line)[0]
                 fields['message'] = re_message_obj.findall(line)[0].strip()
                 fields['module'], fields['lineno'] = thread_and_module[-1].split(':')  # noqa
-                fields['asctime'] = datetime.strptime(timestamp, time_format)
+                fields['asctime'] = parse_time(timestamp)
                 yield fields
             else:
                 # VDSM version 3 log parser
@@ -150,8 +152,7 @@ class VDSMLog(LogFileOutput):
                 if 'timestamp' in fields:
                     # Try to convert the datetime if possible
                     try:
-                        fields['asctime'] = datetime.strptime(
-                            fields['timestamp'], time_format)
+                        fields['asctime'] = parse_time(fields['timestamp'])
                         del fields['timestamp']
                     except:
                         pass
@@ -5,7 +5,7 @@ VirtlogdConf - file ``/etc/libvirt/virtlogd.conf``
 The VirtlogdConf class parses the file ``/etc/libvirt/virtlogd.conf``.
 """
 from .. import LegacyItemAccess, Parser, parser
-from insights.parsers import split_kv_pairs, get_active_lines
+from insights.parsers import split_kv_pairs
 from insights.specs import Specs
 
 
@@ -94,4 +94,4 @@ class VirtlogdConf(LegacyItemAccess, Parser):
         data (dict): Ex: ``{'max_backups': '3'}``
     """
     def parse_content(self, content):
-        self.data = split_kv_pairs(get_active_lines(content))
+        self.data = split_kv_pairs(content)
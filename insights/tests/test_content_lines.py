@@ -0,0 +1,83 @@
+import pickle
+
+from insights.core import YAMLParser
+from insights.core.spec_factory import ContentLines, DatasourceProvider
+from insights.parsers import get_active_lines, parse_delimited_table
+
+LINES = [
+    "# comment",
+    "",
+    "NAME   SIZE  OWNER",
+    "  sda    10G  root  ",
+    "sdb    20G  some user # not a comment here",
+    "   ",
+    "sdc    30G  adm",
+]
+
+
+def test_provider_wraps_content():
+    provider = DatasourceProvider(list(LINES), relative_path="/lines")
+    content = provider.content
+    assert isinstance(content, ContentLines)
+    assert provider.content is content
+    assert content == LINES
+
+
+def test_yaml_parser_on_provider_content():
+    provider = DatasourceProvider(["a: 1", "b: 2"], relative_path="/x.yaml")
+    assert YAMLParser(provider).data == {"a": 1, "b": 2}
+
+
+def test_active_lines_shared():
+    lines = ContentLines(LINES)
+    active = lines.active_lines()
+    assert active == get_active_lines(list(LINES))
+    assert lines.active_lines() is active
+    assert get_active_lines(lines) == active
+    assert get_active_lines(lines) is not active
+    assert lines.active_lines(";") != active
+
+
+def test_changes_forget_results():
+    lines = ContentLines(LINES)
+    active = lines.active_lines()
+    lines.append("sdd 40G root")
+    assert lines.active_lines() is not active
+    assert lines.active_lines()[-1] == "sdd 40G root"
+    lines[-1] = "sde 50G root"
+    assert lines.active_lines()[-1] == "sde 50G root"
+    del lines[-1]
+    assert lines.active_lines() == active
+
+    lines = ContentLines(["a", "b"])
+    assert lines.active_lines() == ["a", "b"]
+    if hasattr(list, "clear"):
+        lines.clear()
+        assert lines.active_lines() == []
+
+
+def test_split_rows():
+    lines = ContentLines(LINES)
+    assert lines.split_rows()[3] == ["sda", "10G", "root"]
+    assert lines.split_rows(2)[4] == ["sdb", "20G", "some user # not a comment here"]
+    assert lines.split_rows(2)[3] == ["sda", "10G", "root"]
+    assert lines.split_rows()[5] == []
+    assert lines.split_rows() is lines.split_rows()
+
+
+def test_parse_delimited_table_same_results():
+    for max_splits in (-1, 2):
+        for strip in (True, False):
+            kwargs = dict(heading_ignore=["NAME"], max_splits=max_splits, strip=strip, raw_line_key="raw")
+            expected = parse_delimited_table(list(LINES), **kwargs)
+            assert parse_delimited_table(ContentLines(LINES), **kwargs) == expected
+            assert parse_delimited_table(ContentLines(LINES), columnar=True, **kwargs) == expected
+
+
+def test_pickle():
+    lines = ContentLines(LINES)
+    lines.active_lines()
+    loaded = pickle.loads(pickle.dumps(lines))
+    assert isinstance(loaded, ContentLines)
+    assert loaded == lines
+    assert loaded.active_lines() == lines.active_lines()
@@ -0,0 +1,59 @@
+import bz2
+import gzip
+import io
+import os
+import tarfile
+import tempfile
+import zipfile
+from contextlib import closing
+
+from insights.util import content_type
+
+
+def _tar_bytes():
+    buf = io.BytesIO()
+    with closing(tarfile.open(fileobj=buf, mode="w")) as tf:
+        info = tarfile.TarInfo("hello")
+        info.size = 5
+        tf.addfile(info, io.BytesIO(b"hello"))
+    return buf.getvalue()
+
+
+def _zip_bytes():
+    buf = io.BytesIO()
+    with closing(zipfile.ZipFile(buf, "w")) as zf:
+        zf.writestr("hello", "hello")
+    return buf.getvalue()
+
+
+def _gzip_bytes():
+    buf = io.BytesIO()
+    with closing(gzip.GzipFile(fileobj=buf, mode="wb")) as gz:
+        gz.write(b"hello")
+    return buf.getvalue()
+
+
+def test_sniff():
+    assert content_type.sniff(_tar_bytes()) == "application/x-tar"
+    assert content_type.sniff(_zip_bytes()) == "application/zip"
+    assert content_type.sniff(_gzip_bytes()) == "application/x-gzip"
+    assert content_type.sniff(bz2.compress(b"hello")) == "application/x-bzip2"
+    assert content_type.sniff(b"\xfd7zXZ\x00\x00") == "application/x-xz"
+    assert content_type.sniff(b"\x28\xb5\x2f\xfd\x00") == "application/zstd"
+    assert content_type.sniff(b"hello world") is None
+    assert content_type.sniff(b"") is None
+
+
+def test_from_file_sniffs_archives():
+    fd, path = tempfile.mkstemp()
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_gzip_bytes())
+        assert content_type.sniff_file(path) == "application/x-gzip"
+        assert content_type.from_file(path) == "application/x-gzip"
+    finally:
+        os.remove(path)
+
+
+def test_sniff_missing_file():
+    assert content_type.sniff_file("/does/not/exist") is None
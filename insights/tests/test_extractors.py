@@ -44,3 +44,33 @@ def test_with_zip():
         os.unlink("/tmp/test.zip")
 
     subprocess.call(shlex.split("rm -rf %s" % tmp_dir))
+
+
+def test_tar_flags():
+    ex = archives.TarExtractor()
+    assert ex._tar_flag_for_content_type("application/x-gzip") == "-z"
+    assert ex._tar_flag_for_content_type("application/zstd") == "--use-compress-program=zstd"
+
+
+def test_tar_flags_parallel(monkeypatch):
+    monkeypatch.setattr(archives, "which", lambda p: "/usr/bin/" + p if p == "pigz" else None)
+    ex = archives.TarExtractor(parallel=True)
+    assert ex._tar_flag_for_content_type("application/x-gzip") == "--use-compress-program=pigz"
+    assert ex._tar_flag_for_content_type("application/x-xz") == "-J"
+
+
+def test_with_tar_gz_parallel():
+    tmp_dir = tempfile.mkdtemp()
+    d = os.path.join(tmp_dir, "data", "etc")
+    os.makedirs(d)
+    with open(os.path.join(d, "hostname"), "w") as f:
+        f.write("example.com")
+
+    archive = os.path.join(tmp_dir, "test.tar.gz")
+    subprocess.call(shlex.split("tar -C %s -czf %s data" % (tmp_dir, archive)))
+    try:
+        with extract(archive, parallel=True) as ex:
+            assert ex.content_type == "application/x-gzip"
+            assert any(f.endswith("/data/etc/hostname") for f in archives.get_all_files(ex.tmp_dir))
+    finally:
+        subprocess.call(shlex.split("rm -rf %s" % tmp_dir))
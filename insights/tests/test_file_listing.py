@@ -315,3 +315,57 @@ def test_single_directory_with_special_path():
 
     ctx = context_wrap(SINGLE_DIRECTORY, path='ls_-la')
     _content_asserts(FileListing(ctx), '/')
+
+
+PERMISSIONS = """
+/usr/bin:
+total 12
+dr-xr-xr-x.  2 0 0 4096 Jun 28  2017 .
+drwxr-xr-x. 13 0 0 4096 Jun 28  2017 ..
+-rwsr-xr-x.  1 0 0 2764 Jun 28  2017 passwd
+-rwxr-sr-x.  1 0 5 1234 Jun 28  2017 write
+lrwxrwxrwx.  1 0 0    4 Jun 28  2017 sh -> bash
+
+/tmp:
+total 4
+drwxrwxrwt. 10 0 0 4096 Jun 28  2017 .
+drwxr-xr-x. 13 0 0 4096 Jun 28  2017 ..
+-rw-rw-rw-.  1 0 0   10 Jun 28  2017 shared
+drwxrwxrwt.  2 0 0 4096 Jun 28  2017 scratch
+
+/tmp/scratch:
+total 0
+drwxrwxrwt.  2 0 0 4096 Jun 28  2017 .
+drwxrwxrwt. 10 0 0 4096 Jun 28  2017 ..
+"""
+
+
+def test_scan():
+    dirs = FileListing(context_wrap(PERMISSIONS))
+    found = dirs.scan('world_writable', 'setuid', 'setgid', 'sticky', lambda e: e.owner == '0' and e.group == '5')
+    assert found['world_writable'] == ['/tmp/scratch', '/tmp/shared']
+    assert found['setuid'] == ['/usr/bin/passwd']
+    assert found['setgid'] == ['/usr/bin/write']
+    assert found['sticky'] == ['/tmp/scratch']
+    assert [v for k, v in found.items() if callable(k)] == [['/usr/bin/write']]
+
+
+def test_listings_under():
+    dirs = FileListing(context_wrap(PERMISSIONS))
+    assert dirs.listings_under('/tmp') == ['/tmp', '/tmp/scratch']
+    assert dirs.listings_under('/tmp/') == ['/tmp', '/tmp/scratch']
+    assert dirs.listings_under('/') == ['/tmp', '/tmp/scratch', '/usr/bin']
+    assert dirs.listings_under('/usr') == ['/usr/bin']
+    assert dirs.listings_under('/var') == []
+
+
+def test_lazy_entries():
+    dirs = FileListing(context_wrap(PERMISSIONS))
+    entries = dirs.listing_of('/usr/bin')
+    assert entries.records['sh'].link == 'bash'
+    assert entries.records['passwd'].major is None
+    assert entries['sh'] is entries['sh']
+    assert entries['sh']['link'] == 'bash'
+    assert dirs.path_entry('/usr/bin/passwd')['perms'] == 'rwsr-xr-x.'
+    assert dirs.path_entry('/usr/bin/missing') is None
+    assert dirs.path_entry('/usr/lib/passwd') is None
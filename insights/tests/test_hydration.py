@@ -0,0 +1,81 @@
+import os
+from tempfile import mkdtemp
+
+from insights.core import archives
+from insights.core.context import HostArchiveContext, SerializedArchiveContext, SosArchiveContext
+from insights.core.hydration import create_context, probe
+from insights.util import fs
+
+
+def _touch(root, *parts):
+    path = os.path.join(root, *parts)
+    fs.ensure_path(os.path.dirname(path))
+    fs.touch(path)
+    return path
+
+
+def test_probe_sos():
+    tmp = mkdtemp()
+    try:
+        _touch(tmp, "sosreport-host", "sos_commands", "general", "date")
+        _touch(tmp, "sosreport-host", "etc", "hostname")
+        assert probe(tmp) == (os.path.join(tmp, "sosreport-host"), SosArchiveContext)
+    finally:
+        fs.remove(tmp)
+
+
+def test_probe_prefers_shallow_marker():
+    tmp = mkdtemp()
+    try:
+        _touch(tmp, "insights_archive.txt")
+        _touch(tmp, "data", "insights_commands", "date")
+        assert probe(tmp) == (tmp, SerializedArchiveContext)
+    finally:
+        fs.remove(tmp)
+
+
+def test_probe_max_depth():
+    tmp = mkdtemp()
+    try:
+        _touch(tmp, "a", "b", "insights_commands", "date")
+        assert probe(tmp, max_depth=1) == (None, None)
+        assert probe(tmp, max_depth=2) == (os.path.join(tmp, "a", "b"), HostArchiveContext)
+    finally:
+        fs.remove(tmp)
+
+
+def test_create_context_defers_listing():
+    tmp = mkdtemp()
+    try:
+        date = _touch(tmp, "insights-host", "insights_commands", "date")
+        ctx = create_context(tmp)
+        assert isinstance(ctx, HostArchiveContext)
+        assert ctx.root == os.path.join(tmp, "insights-host")
+        assert callable(ctx._all_files)
+        assert date in ctx.all_files
+        assert not callable(ctx._all_files)
+    finally:
+        fs.remove(tmp)
+
+
+def test_create_context_without_markers():
+    tmp = mkdtemp()
+    try:
+        hostname = _touch(tmp, "archive", "etc", "hostname")
+        ctx = create_context(tmp)
+        assert isinstance(ctx, HostArchiveContext)
+        assert ctx.all_files == [hostname]
+    finally:
+        fs.remove(tmp)
+
+
+def test_create_context_empty():
+    tmp = mkdtemp()
+    try:
+        try:
+            create_context(tmp)
+            assert False, "expected InvalidArchive"
+        except archives.InvalidArchive:
+            pass
+    finally:
+        fs.remove(tmp)
@@ -1,5 +1,7 @@
 # -*- coding: UTF-8 -*-
-from insights.core import LogFileOutput
+from insights.core import LineIndex, LogFileOutput, filters
+from insights.core.filters import add_filter
+from insights.core.plugins import datasource, parser
 from insights.parsers import ParseException
 from insights.tests import context_wrap
 
@@ -132,6 +134,97 @@ def test_messages_scanners_list():
     assert log.error_info is False
 
 
+class FusedScanLog(LogFileOutput):
+    pass
+
+
+class OverriddenGetLog(LogFileOutput):
+    def get(self, s):
+        return [{'raw_message': l.upper()} for l in self.lines if s in l]
+
+
+def test_fused_scanners_match_unfused():
+    FusedScanLog.keep_scan('pulp_lines', 'pulp')
+    FusedScanLog.keep_scan('pulp_errors', ['pulp', 'ERROR'])
+    FusedScanLog.token_scan('has_imuxsock', 'imuxsock')
+    FusedScanLog.token_scan('has_cron', 'CRONTAB')
+    FusedScanLog.scan('line_count', lambda self: len(self.lines))
+
+    log = FusedScanLog(context_wrap(MESSAGES, path='/var/log/messages'))
+    assert FusedScanLog._scan_plan() is not None
+    assert log.pulp_lines == log.get('pulp')
+    assert log.pulp_errors == log.get(['pulp', 'ERROR'])
+    assert log.pulp_lines is not log.pulp_errors
+    assert log.has_imuxsock is True
+    assert log.has_cron is False
+    assert log.line_count == 31
+
+    # Registering another scanner recompiles the plan
+    FusedScanLog.keep_scan('rsyslog_lines', 'rsyslogd')
+    log = FusedScanLog(context_wrap(MESSAGES, path='/var/log/messages'))
+    assert log.rsyslog_lines == log.get('rsyslogd')
+    assert len(log.rsyslog_lines) == 8
+
+
+def test_scanners_not_fused_when_get_overridden():
+    OverriddenGetLog.keep_scan('pulp_lines', 'pulp')
+    assert OverriddenGetLog._scan_plan() is None
+    log = OverriddenGetLog(context_wrap(MESSAGES, path='/var/log/messages'))
+    assert log.pulp_lines[0]['raw_message'].isupper()
+
+
+class IndexedLog(FakeMessagesClass):
+    indexed = True
+
+
+def test_line_index():
+    lines = MESSAGES.strip().splitlines()
+    index = LineIndex(lines, seeds=['pulp', 'imuxsock'])
+    assert sorted(index.postings) == ['imuxsock', 'pulp']
+    pulp = index.lookup('pulp')
+    assert pulp == [i for i, l in enumerate(lines) if 'pulp' in l]
+    # 'pulp.server' is only looked for in the lines containing 'pulp'
+    assert index.lookup('pulp.server') == [i for i, l in enumerate(lines) if 'pulp.server' in l]
+    assert index.search(['pulp', 'ERROR']) == [i for i, l in enumerate(lines) if 'pulp' in l and 'ERROR' in l]
+    assert index.search(['CRONTAB']) == []
+
+
+@datasource(filterable=True)
+def filtered_messages(broker):
+    pass
+
+
+@parser(filtered_messages)
+class FilteredIndexedLog(FakeMessagesClass):
+    indexed = True
+
+
+def test_index_seeded_with_filters():
+    add_filter(filtered_messages, ['pulp', 'imuxsock'])
+    try:
+        log = FilteredIndexedLog(context_wrap(MESSAGES, path='/var/log/messages'))
+        assert len(log.get('pulp')) == 8
+        index = LogFileOutput._line_indexes[log]
+        assert set(['pulp', 'imuxsock']) <= set(index.postings)
+    finally:
+        del filters.FILTERS[filtered_messages]
+        filters._CACHE.pop(filtered_messages, None)
+
+
+def test_indexed_searches_match_unindexed():
+    ctx = context_wrap(MESSAGES, path='/var/log/messages')
+    plain = FakeMessagesClass(ctx)
+    log = IndexedLog(ctx)
+    for s in ['pulp', ['pulp', 'ERROR'], 'imuxsock lost', 'CRONTAB']:
+        assert log.get(s) == plain.get(s)
+        assert (s in log) == (s in plain)
+    ts = datetime(2017, 3, 27, 3, 20, 30)
+    assert list(log.get_after(ts, 'pulp')) == list(plain.get_after(ts, 'pulp'))
+    assert list(log.get_after(ts)) == list(plain.get_after(ts))
+    with pytest.raises(TypeError):
+        log.get([])
+
+
 def test_messages_get_after():
     ctx = context_wrap(MESSAGES, path='/var/log/messages')
     log = FakeMessagesClass(ctx)
@@ -236,6 +329,11 @@ def test_logs_with_year():
 
     assert len(list(log.get_after(datetime(2016, 2, 14, 3, 18, 55)))) == 4
 
+    stamps = log.line_timestamps()
+    assert log.timestamps_have_year
+    assert len(stamps) == len(log.lines)
+    assert stamps[0] == datetime(2016, 2, 14, 3, 18, 54)
+
 
 DATE_CHANGE_MARIADB_LOG = """
 161109  9:25:42 [Warning] SSL error: SSL_CTX_set_default_verify_paths failed
@@ -278,3 +376,56 @@ def test_logs_with_two_timestamps():
         logerr = BadClassMariaDBLog(ctx)
         assert list(logerr.get_after(datetime(2017, 3, 27, 3, 39, 46))) is None
     assert 'get_after does not recognise time formats of type ' in str(exc)
+
+
+ORDERED_LOG = """
+2018-01-01 00:00:00 start
+2018-01-01 01:00:00 first item
+  continued first
+2018-01-01 02:00:00 second item
+  continued second
+2018-01-01 03:00:00 third thing
+  continued third
+2018-01-01 04:00:00 fourth item
+"""
+
+UNORDERED_LOG = """
+2018-01-01 03:00:00 third item
+2018-01-01 01:00:00 first item
+  continued first
+2018-01-01 04:00:00 fourth item
+2018-01-01 02:00:00 second item
+"""
+
+
+class YearLog(LogFileOutput):
+    pass
+
+
+def test_get_after_ordered_log():
+    log = YearLog(context_wrap(ORDERED_LOG))
+    after = [l['raw_message'] for l in log.get_after(datetime(2018, 1, 1, 2, 0, 0))]
+    assert after == log.lines[3:]
+    column = LogFileOutput._timestamp_columns[log]
+    assert column.ordered is True
+    assert column.first_at_or_after(datetime(2018, 1, 1, 2, 30, 0)) == 5
+
+    # with a search string the continuation of a skipped line isn't included
+    after = [l['raw_message'] for l in log.get_after(datetime(2018, 1, 1, 2, 0, 0), 'item')]
+    assert after == ['2018-01-01 02:00:00 second item', '2018-01-01 04:00:00 fourth item']
+    after = [l['raw_message'] for l in log.get_after(datetime(2018, 1, 1, 2, 0, 0), 'continued')]
+    assert after == []
+    assert list(log.get_after(datetime(2018, 1, 2))) == []
+    assert len(list(log.get_after(datetime(2017, 1, 1)))) == len(log.lines)
+
+    # the regular expression is built once per class and format
+    assert YearLog.__dict__['_time_parsers'][YearLog.time_format] is log._time_parser()
+
+
+def test_get_after_unordered_log():
+    log = YearLog(context_wrap(UNORDERED_LOG))
+    after = [l['raw_message'] for l in log.get_after(datetime(2018, 1, 1, 2, 30, 0))]
+    assert after == ['2018-01-01 03:00:00 third item', '2018-01-01 04:00:00 fourth item']
+    assert LogFileOutput._timestamp_columns[log].ordered is False
+    after = [l['raw_message'] for l in log.get_after(datetime(2018, 1, 1, 2, 30, 0), 'item')]
+    assert after == ['2018-01-01 03:00:00 third item', '2018-01-01 04:00:00 fourth item']
@@ -0,0 +1,52 @@
+import re
+
+import pytest
+
+from insights.core import LogFileOutput
+from insights.tests import context_wrap
+from insights.util import parallel_search
+
+LINES = ["line %d %s" % (i, "ERROR disk full" if i % 97 == 0 else "ok")
+         for i in range(5000)]
+
+
+class FakeLog(LogFileOutput):
+    search_workers = 2
+
+
+@pytest.fixture
+def small(monkeypatch):
+    monkeypatch.setattr(parallel_search, "MIN_LINES", 10)
+
+
+@pytest.mark.parametrize("query", [
+    "ERROR",
+    ["disk", "full"],
+    ["disk", "nothing"],
+    re.compile(r"line 4\d{3} ERROR"),
+])
+def test_search_matches_serial(small, query):
+    serial = parallel_search.search(LINES, query, workers=1)
+    assert parallel_search.search(LINES, query, workers=2) == serial
+    assert parallel_search.contains(LINES, query, workers=2) is bool(serial)
+
+
+def test_search_serial_below_min_lines():
+    assert parallel_search.search(LINES[:200], "ERROR", workers=4) == [0, 97, 194]
+    assert parallel_search.contains(LINES[:200], "nothing", workers=4) is False
+
+
+def test_bad_query(small):
+    with pytest.raises(TypeError):
+        parallel_search.search(LINES, 42, workers=2)
+    with pytest.raises(TypeError):
+        parallel_search.contains(LINES, [], workers=2)
+
+
+def test_log_file_output(small):
+    log = FakeLog(context_wrap("\n".join(LINES), path="/var/log/fake"))
+    result = log.get("ERROR")
+    assert len(result) == len(range(0, 5000, 97))
+    assert result[1]["raw_message"] == LINES[97]
+    assert "disk full" in log
+    assert "nothing" not in log
@@ -0,0 +1,97 @@
+from tempfile import mkdtemp
+
+from insights import dr
+from insights.core import Parser, StreamParser
+from insights.core import parser_cache
+from insights.core.parser_cache import ParserCache, get_cache, set_cache
+from insights.core.plugins import datasource, parser
+from insights.core.spec_factory import DatasourceProvider
+from insights.tests import context_wrap
+from insights.util import fs
+
+CALLS = []
+
+
+class Counted(Parser):
+    def parse_content(self, content):
+        CALLS.append(self.file_path)
+        self.lines = list(content)
+
+
+class Streamed(StreamParser):
+    def parse_content(self, content):
+        CALLS.append(self.file_path)
+        self.lines = list(content)
+
+
+@datasource()
+def lines(broker):
+    return DatasourceProvider("one\ntwo", relative_path="/lines")
+
+
+@parser(lines)
+class CountedLines(Parser):
+    def parse_content(self, content):
+        CALLS.append(self.file_path)
+        self.lines = content
+
+
+def test_cache_hit_and_miss():
+    del CALLS[:]
+    tmp = mkdtemp()
+    try:
+        cache = ParserCache(tmp)
+        first = cache.parse(Counted, context_wrap("a\nb"))
+        second = cache.parse(Counted, context_wrap("a\nb"))
+        assert CALLS == ["/path"]
+        assert second is not first
+        assert second.lines == first.lines == ["a", "b"]
+
+        cache.parse(Counted, context_wrap("a\nc"))
+        cache.parse(Counted, context_wrap("a\nb", path="other"))
+        assert len(CALLS) == 3
+    finally:
+        fs.remove(tmp)
+
+
+def test_stream_parsers_not_cached():
+    del CALLS[:]
+    tmp = mkdtemp()
+    try:
+        cache = ParserCache(tmp)
+        assert cache.key(Streamed, context_wrap("a")) is None
+        cache.parse(Streamed, context_wrap("a"))
+        cache.parse(Streamed, context_wrap("a"))
+        assert len(CALLS) == 2
+    finally:
+        fs.remove(tmp)
+
+
+def test_parser_component_uses_cache():
+    del CALLS[:]
+    tmp = mkdtemp()
+    old = get_cache()
+    set_cache(ParserCache(tmp))
+    try:
+        for _ in range(2):
+            broker = dr.run(dr.get_dependency_graph(CountedLines))
+            assert broker[CountedLines].lines == ["one", "two"]
+        assert CALLS == ["/lines"]
+    finally:
+        set_cache(old)
+        fs.remove(tmp)
+
+
+def test_helper_changes_invalidate():
+    tmp = mkdtemp()
+    old = parser_cache._HELPERS
+    try:
+        version = ParserCache(tmp).version(Counted)
+        assert "insights.parsers" in parser_cache.HELPER_MODULES
+        assert parser_cache._HELPERS is not None
+
+        parser_cache._HELPERS = "changed"
+        assert ParserCache(tmp).version(Counted) != version
+    finally:
+        parser_cache._HELPERS = old
+        fs.remove(tmp)
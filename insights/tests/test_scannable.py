@@ -98,3 +98,60 @@ def test_duplicate_scanner():
     with pytest.raises(ValueError) as exc:
         assert FakeAnacondaLog.collect('warnings', lambda x: x + 'extra stuff')
     assert 'is already a registered scanner key' in str(exc)
+
+
+class DeclaredAnacondaLog(Scannable):
+    def parse(self, content):
+        for line in content:
+            if ' : ' in line:
+                level, message = line[13:].split(' : ', 1)
+                yield {'level': level.strip(), 'message': message}
+
+
+DeclaredAnacondaLog.any_where('has_fcoe', message__contains='/usr/libexec/fcoe/fcoe_edd.sh')
+DeclaredAnacondaLog.any_where('panic', message__contains='kernel panic')
+DeclaredAnacondaLog.collect_where('warnings', level='WARNING')
+DeclaredAnacondaLog.collect_where('eth0_activated', level='INFO', message__regex=r'eth0 activated$')
+DeclaredAnacondaLog.collect_where('modules', level='DEBUG', message__startswith='Saving module')
+
+
+def test_scan_where():
+    log = DeclaredAnacondaLog(context_wrap(ANACONDA_LOG))
+    assert log.has_fcoe is True
+    assert log.panic is False
+    assert [w['message'] for w in log.warnings] == ["'/usr/libexec/fcoe/fcoe_edd.sh' specified as full path"]
+    assert len(log.eth0_activated) == 2
+    assert len(log.modules) == 18
+
+    plan = DeclaredAnacondaLog._condition_plan()
+    # level == 'INFO' and level == 'DEBUG' and level == 'WARNING' plus
+    # four message conditions
+    assert len(plan[0]) == 7
+
+    empty = DeclaredAnacondaLog(context_wrap(''))
+    assert empty.has_fcoe is False
+    assert empty.warnings == []
+
+
+class LineAnacondaLog(Scannable):
+    pass
+
+
+LineAnacondaLog.any_where('has_fcoe', contains='/usr/libexec/fcoe/fcoe_edd.sh')
+LineAnacondaLog.collect('warnings', warnings)
+LineAnacondaLog.collect_where('errors', regex=r'\d ERROR ')
+
+
+def test_scan_where_mixed_with_functions():
+    log = LineAnacondaLog(context_wrap(ANACONDA_LOG))
+    assert log.has_fcoe is True
+    assert log.warnings == ["'/usr/libexec/fcoe/fcoe_edd.sh' specified as full path"]
+    assert log.errors == ['02:22:35,065 ERROR   : got to setupCdrom without a CD device']
+
+
+def test_scan_where_errors():
+    with pytest.raises(ValueError):
+        LineAnacondaLog.collect_where('nothing')
+    with pytest.raises(ValueError):
+        # Not a registered parser, so there's no datasource to filter
+        LineAnacondaLog.collect_where('pushed', push_filter=True, contains='x')
@@ -2,7 +2,7 @@ import os
 from tempfile import mkdtemp
 from insights import dr
 from insights.core.plugins import component
-from insights.core.serde import Hydration
+from insights.core.serde import BlobStore, Hydration, referenced_blobs
 from insights.core.spec_factory import (
                                         RawFileProvider,
                                         TextFileProvider,
@@ -48,3 +48,35 @@ def test_raw_file():
     finally:
         if tmp_path and os.path.exists(tmp_path):
             fs.remove(tmp_path)
+
+
+def test_blob_store_dedup():
+    tmp_path = mkdtemp()
+    try:
+        store = BlobStore(os.path.join(tmp_path, "blobs"))
+        for name in ("one", "two"):
+            before = TextFileProvider(relative_path, root)
+            broker = dr.Broker()
+            broker[thing] = before
+
+            hydra = Hydration(os.path.join(tmp_path, name), blob_store=store)
+            hydra.dehydrate(thing, broker)
+            assert not os.path.exists(os.path.join(hydra.data, relative_path))
+
+        blobs = list(store)
+        assert len(blobs) == 1
+        meta = [os.path.join(tmp_path, n, "meta_data") for n in ("one", "two")]
+        assert referenced_blobs(*meta) == set(blobs)
+
+        hydra = Hydration(os.path.join(tmp_path, "two"), blob_store=store)
+        after = hydra.hydrate()[thing]
+        assert after.content == before.content
+
+        fs.remove(os.path.join(tmp_path, "one"))
+        assert store.gc(referenced_blobs(*meta)) == []
+        fs.remove(os.path.join(tmp_path, "two"))
+        assert store.gc(referenced_blobs(*meta)) == blobs
+        assert list(store) == []
+    finally:
+        if tmp_path and os.path.exists(tmp_path):
+            fs.remove(tmp_path)
@@ -102,3 +102,31 @@ def test_datasource_provider():
     p = MyParser(ds)
     assert p.content == data.splitlines()
     assert list(ds.stream()) == data.splitlines()
+
+
+class TailSpecs(SpecSet):
+    messages = simple_file("/messages", filterable=True)
+
+
+def test_tail_window(tmpdir):
+    from insights import apply_configs
+
+    with open(str(tmpdir.join("messages")), "w") as f:
+        f.write("\n".join("line %d" % i for i in range(100)) + "\n")
+
+    messages = TailSpecs.messages
+    apply_configs({"configs": [{"name": dr.get_name(messages), "enabled": True, "tail": {"lines": 10}}]})
+    assert messages.tail == {"lines": 10}
+
+    broker = dr.Broker()
+    broker[HostContext] = HostContext(root=str(tmpdir))
+    assert messages(broker).content == ["line %d" % i for i in range(90, 100)]
+    assert list(messages(broker).stream()) == ["line %d" % i for i in range(90, 100)]
+
+    add_filter(messages, "line 9")
+    assert messages(broker).content == ["line 9%d" % i for i in range(10)]
+
+    dst = str(tmpdir.join("collected"))
+    messages(broker).write(dst)
+    with open(dst) as f:
+        assert f.read().splitlines() == ["line 9%d" % i for i in range(10)]
@@ -35,3 +35,44 @@ def test_syslog():
     assert crontab_logs[1]['raw_message'] == "Apr 22 10:41:13 boy-bona crontab[32515]: (root) LIST (root)"
     systemd_logs = msg_info.get_logs_by_procname('systemd')
     assert len(list(systemd_logs)) == 1
+
+
+class LazySyslog(Syslog):
+    lazy_records = True
+
+
+def test_syslog_lazy_records():
+    import pickle
+    from insights.core import LogRecord
+
+    eager = Syslog(context_wrap(MSGINFO))
+    lazy = LazySyslog(context_wrap(MSGINFO))
+    records = lazy.get('CROND')
+    assert all(isinstance(r, LogRecord) for r in records)
+    assert records[0]._fields is None
+    assert records[0]['raw_message'].startswith('Apr 22 10:35:01')
+    assert records[0]._fields is None
+    assert records[0]['procname'] == 'CROND[27921]'
+    assert records == eager.get('CROND')
+    assert sorted(records[1]) == sorted(eager.get('CROND')[1])
+    assert pickle.loads(pickle.dumps(records[1])) == eager.get('CROND')[1]
+    assert 'hostname' in records[1]
+
+
+def test_syslog_get_columns():
+    msg_info = Syslog(context_wrap(MSGINFO))
+    columns = msg_info.get_columns('yum', ['procname', 'message'])
+    assert columns == {
+        'procname': ['yum[11597]', 'yum[11954]'],
+        'message': ['Installed: lynx-2.8.6-27.el6.x86_64', 'Updated: sos-3.2-40.el6.noarch'],
+    }
+    assert msg_info.get_columns('yum', ['raw_message']) == {
+        'raw_message': [r['raw_message'] for r in msg_info.get('yum')]
+    }
+
+    columns = msg_info.get_columns()
+    rows = msg_info.get(' ')
+    assert set(columns) == set(['raw_message', 'message', 'timestamp', 'hostname', 'procname'])
+    assert all(len(c) == len(rows) for c in columns.values())
+    for i, row in enumerate(rows):
+        assert dict((k, v[i]) for k, v in columns.items() if v[i] is not None) == row
@@ -0,0 +1,91 @@
+import pytest
+
+from insights.util import tail
+
+MESSAGES = """
+Dec 31 22:59:58 host systemd: Started Session 1 of user root.
+Dec 31 23:30:01 host systemd: Started Session 2 of user root.
+Traceback (most recent call last):
+  File "x.py", line 1
+Jan  1 00:10:00 host systemd: Started Session 3 of user root.
+Jan  1 00:20:00 host systemd: Started Session 4 of user root.
+""".lstrip()
+
+ACCESS = """
+2018-03-01 10:00:00 first
+2018-03-02 10:00:00 second
+2018-03-02 11:30:00 third
+2018-03-02 12:00:00 fourth
+""".lstrip()
+
+
+@pytest.fixture
+def log(tmpdir):
+    def write(content):
+        path = str(tmpdir.join("log"))
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+    return write
+
+
+def rest(path, window):
+    with open(path) as f:
+        f.seek(tail.window_start(path, window))
+        return f.read()
+
+
+def test_no_window(log):
+    path = log(MESSAGES)
+    assert tail.window_start(path, None) == 0
+    assert tail.window_start(path, {}) == 0
+
+
+def test_bytes(log):
+    path = log(ACCESS)
+    assert rest(path, {"bytes": 27}) == "2018-03-02 12:00:00 fourth\n"
+    # A partial first line is skipped
+    assert rest(path, {"bytes": 26}) == ""
+    assert rest(path, {"bytes": 30}) == "2018-03-02 12:00:00 fourth\n"
+    assert rest(path, {"bytes": 10000}) == ACCESS
+    assert rest(path, {"bytes": 0}) == ""
+
+
+def test_lines(log, monkeypatch):
+    monkeypatch.setattr(tail, "BLOCK_SIZE", 7)
+    path = log(ACCESS)
+    assert rest(path, {"lines": 1}) == "2018-03-02 12:00:00 fourth\n"
+    assert rest(path, {"lines": 2}) == ACCESS.split("\n", 2)[2]
+    assert rest(path, {"lines": 4}) == ACCESS
+    assert rest(path, {"lines": 40}) == ACCESS
+
+    path = log(ACCESS.rstrip("\n"))
+    assert rest(path, {"lines": 1}) == "2018-03-02 12:00:00 fourth"
+
+
+def test_hours(log):
+    path = log(ACCESS)
+    fmt = "%Y-%m-%d %H:%M:%S"
+    assert rest(path, {"hours": 1, "time_format": fmt}) == ACCESS.split("\n", 2)[2]
+    assert rest(path, {"hours": 0.25, "time_format": fmt}) == "2018-03-02 12:00:00 fourth\n"
+    assert rest(path, {"hours": 48, "time_format": fmt}) == ACCESS
+
+
+def test_hours_without_year(log):
+    path = log(MESSAGES)
+    # Continuation lines stay with the line they follow, and the new year
+    # doesn't end the window.
+    assert rest(path, {"hours": 1}) == MESSAGES.split("\n", 1)[1]
+    assert rest(path, {"hours": 0.5}).startswith("Jan  1 00:10:00")
+
+
+def test_smallest_window_wins(log):
+    path = log(ACCESS)
+    window = {"lines": 3, "bytes": 30}
+    assert rest(path, window) == "2018-03-02 12:00:00 fourth\n"
+
+
+def test_unsupported_format(log):
+    path = log(ACCESS)
+    with pytest.raises(ValueError):
+        tail.window_start(path, {"hours": 1, "time_format": "%Y-%j"})
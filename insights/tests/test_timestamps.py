@@ -0,0 +1,52 @@
+from datetime import datetime
+
+import pytest
+
+from insights.util import timestamps
+
+CASES = [
+    ('%b %d %H:%M:%S', 'May 18 15:13:34'),
+    ('%b %d %H:%M:%S', 'Aug  4 09:03:05'),
+    ('%d/%b/%Y:%H:%M:%S', '27/Apr/2017:14:41:07'),
+    ('%Y-%m-%d %H:%M:%S,%f', '2017-04-18 14:00:00,331'),
+    ('%Y-%m-%d %H:%M:%S.%f', '2017-04-18 14:00:00.123456'),
+    ('%b %d, %Y %I:%M:%S %p', 'Jan 06, 2017 12:15:08 AM'),
+    ('%b %d, %Y %I:%M:%S %p', 'Jan 06, 2017 12:15:08 PM'),
+    ('%b %d, %Y %I:%M:%S %p', 'Jan 06, 2017 3:15:08 pm'),
+    ('%y%m%d %H:%M:%S', '170418 14:00:00'),
+    ('%y%m%d %H:%M:%S', '700418 14:00:00'),
+    ('%a %b %d %H:%M:%S %Y', 'Mon Oct 12 09:15:01 2015'),
+    ('%A %d %B %Y', 'Thursday 02 February 2017'),
+    ('%Y-%m-%d %H:%M:%S%%', '2017-04-18 14:00:00%'),
+]
+
+
+@pytest.mark.parametrize("fmt,s", CASES)
+def test_matches_strptime(fmt, s):
+    assert timestamps.strptime(s, fmt) == datetime.strptime(s, fmt)
+
+
+@pytest.mark.parametrize("fmt,s", [
+    ('%b %d %H:%M:%S', 'Foo 18 15:13:34'),
+    ('%b %d %H:%M:%S', 'May 18 15:13:34 trailing'),
+    ('%Y-%m-%d', '2017-02-30'),
+    ('%H:%M:%S', '24:00:00'),
+])
+def test_mismatch(fmt, s):
+    with pytest.raises(ValueError):
+        datetime.strptime(s, fmt)
+    with pytest.raises(ValueError):
+        timestamps.strptime(s, fmt)
+
+
+def test_parsers_are_cached():
+    fmt = '%Y-%m-%d %H:%M:%S'
+    parse = timestamps.get_parser(fmt)
+    assert timestamps.get_parser(fmt) is parse
+    assert parse('2017-04-18 14:00:00') is parse('2017-04-18 14:00:00')
+
+
+def test_fallback():
+    fmt = '%Y-%m-%d %j'
+    s = '2017-04-18 108'
+    assert timestamps.strptime(s, fmt) == datetime.strptime(s, fmt)
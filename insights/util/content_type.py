@@ -1,3 +1,11 @@
+"""
+Helpers for determining the mime type of files and buffers.
+
+The archive formats insights accepts are recognized directly from their
+leading bytes, which is cheap and safe to do from many threads at once.
+Anything else is handed to libmagic, or to ``file --mime-type`` if libmagic
+isn't available.
+"""
 import shlex
 import subprocess
 from subprocess import PIPE
@@ -21,8 +29,46 @@ else:
 # libmagic is not thread safe so we must lock access to file
 magic_lock = Lock()
 
+SIGNATURES = [
+    (0, b"\x1f\x8b", "application/x-gzip"),
+    (0, b"\xfd7zXZ\x00", "application/x-xz"),
+    (0, b"BZh", "application/x-bzip2"),
+    (0, b"\x28\xb5\x2f\xfd", "application/zstd"),
+    (0, b"PK\x03\x04", "application/zip"),
+    (0, b"PK\x05\x06", "application/zip"),
+    (257, b"ustar", "application/x-tar"),
+]
+"""
+(offset, magic bytes, mime type) for the archive formats recognized without
+libmagic.
+"""
+
+SNIFF_SIZE = max(o + len(m) for o, m, _ in SIGNATURES)
+
+
+def sniff(b):
+    """
+    Returns the mime type of the archive format whose signature b starts
+    with or ``None`` if it doesn't match any of :py:data:`SIGNATURES`.
+    """
+    for offset, magic_bytes, mime in SIGNATURES:
+        if b[offset:offset + len(magic_bytes)] == magic_bytes:
+            return mime
+
+
+def sniff_file(name):
+    """ Like :py:func:`sniff` but reads the leading bytes of a file. """
+    try:
+        with open(name, "rb") as f:
+            return sniff(f.read(SNIFF_SIZE))
+    except (IOError, OSError):
+        return None
+
 
 def from_file(name):
+    mime = sniff_file(name)
+    if mime:
+        return mime
     if magic_loaded:
         with magic_lock:
             return six.b(_magic.file(name)).decode("unicode-escape").splitlines()[0].strip()
@@ -34,6 +80,9 @@ def from_file(name):
 
 
 def from_buffer(b):
+    mime = sniff(b)
+    if mime:
+        return mime
     if magic_loaded:
         with magic_lock:
             return _magic.buffer(b)
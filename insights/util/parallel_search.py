@@ -0,0 +1,159 @@
+"""
+Searches long lists of lines with several worker processes.
+
+The lines are split into ranges that are searched by a pool of forked
+processes.  The workers inherit the lines from the parent when they're
+forked, so only the ranges and the numbers of the matching lines are passed
+between processes.  Results are returned in the original order.
+
+A query is a string that must be contained in a line, a list of strings that
+must all be contained in it, or a compiled regular expression that must be
+found in it.
+
+Searches fall back to a single process for lists shorter than
+:data:`MIN_LINES` and on platforms that can't fork.
+
+Examples:
+    >>> from insights.util import parallel_search
+    >>> parallel_search.search(lines, 'Out of memory', workers=8)
+    [1021, 4000213]
+    >>> parallel_search.contains(lines, re.compile(r'segfault at [0-9a-f]+'), workers=8)
+    True
+"""
+import multiprocessing
+import os
+import threading
+
+import six
+
+MIN_LINES = 100000
+"""
+Lists with fewer lines than this are searched in the calling process, where
+it's quicker than starting workers.
+"""
+
+CHUNKS_PER_WORKER = 4
+"""
+The number of ranges given to each worker, which evens out the load when
+matches are clustered.
+"""
+
+_LINES = None
+_LOCK = threading.Lock()
+
+
+def matcher(query):
+    """
+    Returns a function that tests a line against query.
+
+    Raises:
+        TypeError: if query isn't a string, a list of strings or a compiled
+            regular expression.
+    """
+    if isinstance(query, six.string_types):
+        return lambda l: query in l
+    if isinstance(query, list) and query and all(isinstance(w, six.string_types) for w in query):
+        return lambda l: all(w in l for w in query)
+    if hasattr(query, "search") and hasattr(query, "pattern"):
+        return lambda l: query.search(l) is not None
+    raise TypeError("Queries must be a string, a list of strings or a compiled regular expression")
+
+
+def _search_range(args):
+    start, end, query, first_only = args
+    match = matcher(query)
+    lines = _LINES
+    found = []
+    for i in six.moves.range(start, end):
+        if match(lines[i]):
+            found.append(i)
+            if first_only:
+                break
+    return found
+
+
+def _ranges(count, workers):
+    chunks = max(1, workers * CHUNKS_PER_WORKER)
+    size = max(1, -(-count // chunks))
+    return [(start, min(start + size, count)) for start in six.moves.range(0, count, size)]
+
+
+def _pool(workers):
+    if not hasattr(os, "fork"):
+        return None
+    try:
+        return multiprocessing.get_context("fork").Pool(workers)
+    except AttributeError:
+        # Python 2 always forks where it can
+        return multiprocessing.Pool(workers)
+
+
+def _run(lines, query, workers, first_only):
+    """
+    Returns the matches of query in each range of lines, in order, or None
+    if it should be searched in this process instead.
+    """
+    global _LINES
+    if not workers or workers < 2 or len(lines) < MIN_LINES:
+        return None
+    matcher(query)
+
+    # The workers get the lines when they're forked, so only hold on to
+    # them while the pool starts.
+    with _LOCK:
+        _LINES = lines
+        try:
+            pool = _pool(workers)
+        finally:
+            _LINES = None
+    if pool is None:
+        return None
+
+    try:
+        tasks = [(start, end, query, first_only) for start, end in _ranges(len(lines), workers)]
+        if first_only:
+            for found in pool.imap_unordered(_search_range, tasks):
+                if found:
+                    return [found]
+            return []
+        return pool.map(_search_range, tasks)
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def search(lines, query, workers=None):
+    """
+    Returns the numbers of the lines that match query, in order.
+
+    Parameters:
+        lines (list): the lines to search.
+        query (str, list or regular expression): what to look for.
+        workers (int): the number of processes to use.  Defaults to the
+            number of CPUs.
+
+    Returns:
+        list: the numbers of the matching lines.
+    """
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    results = _run(lines, query, workers, False)
+    if results is None:
+        match = matcher(query)
+        return [i for i, l in enumerate(lines) if match(l)]
+    return [i for found in results for i in found]
+
+
+def contains(lines, query, workers=None):
+    """
+    Returns True if any line matches query.  The search stops as soon as
+    any worker finds a match.  The parameters are the same as for
+    :func:`search`.
+    """
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    results = _run(lines, query, workers, True)
+    if results is None:
+        match = matcher(query)
+        return any(match(l) for l in lines)
+    return bool(results)
@@ -0,0 +1,139 @@
+"""
+Finds where the recent part of a log file starts.
+
+A tail window limits what is read from a log that grows without bound to
+its end.  It's given as a dictionary with any of the following keys, and
+when several are given the smallest window wins:
+
+* ``bytes`` - the last number of bytes of the file
+* ``lines`` - the last number of lines of the file
+* ``hours`` - the lines written in the given hours before the last time
+  stamp in the file, found by reading the file backwards.  The
+  ``time_format`` key gives the ``strptime`` format of the time stamps and
+  defaults to :data:`DEFAULT_TIME_FORMAT`.
+
+:func:`window_start` returns the offset of the first byte of the window,
+which is always the start of a line.
+
+Examples:
+    >>> window_start('/var/log/messages', {'hours': 24})
+    5120377
+"""
+import datetime
+import os
+
+from insights.util import timestamps
+
+BLOCK_SIZE = 64 * 1024
+"""
+The number of bytes read at a time when reading a file backwards.
+"""
+
+DEFAULT_TIME_FORMAT = '%b %d %H:%M:%S'
+"""
+The syslog time stamp format used for ``hours`` windows without a
+``time_format``.
+"""
+
+
+def _reverse_lines(f, end):
+    """
+    Yields (offset, line) for each line of binary file f that starts before
+    end, last line first.  Lines keep their newline.
+    """
+    pos = end
+    buf = b''
+    while True:
+        i = buf.rfind(b'\n', 0, len(buf) - 1)
+        if i >= 0:
+            yield pos + i + 1, buf[i + 1:]
+            buf = buf[:i + 1]
+        elif pos > 0:
+            start = max(0, pos - BLOCK_SIZE)
+            f.seek(start)
+            buf = f.read(pos - start) + buf
+            pos = start
+        else:
+            if buf:
+                yield 0, buf
+            return
+
+
+def _bytes_start(f, size, count):
+    if count >= size:
+        return 0
+    offset = size - count
+    f.seek(offset - 1)
+    if f.read(1) != b'\n':
+        f.readline()
+    return f.tell()
+
+
+def _lines_start(f, size, count):
+    if count <= 0:
+        return size
+    for n, (offset, _) in enumerate(_reverse_lines(f, size), 1):
+        if n == count:
+            return offset
+    return 0
+
+
+def _time_start(f, size, hours, time_format):
+    search = timestamps.get_regex(time_format)
+    if search is None:
+        raise ValueError("Unsupported time format for a tail window: %r" % time_format)
+    search = search.search
+    parse = timestamps.get_parser(time_format)
+    has_year = '%Y' in time_format or '%y' in time_format
+    one_year = datetime.timedelta(days=365)
+
+    latest = cutoff = None
+    start = 0
+    for offset, line in _reverse_lines(f, size):
+        match = search(line.decode('utf-8', 'replace'))
+        if not match:
+            continue
+        try:
+            stamp = parse(match.group(0))
+        except ValueError:
+            continue
+        if latest is None:
+            latest = stamp
+            cutoff = latest - datetime.timedelta(hours=hours)
+        elif not has_year and stamp > latest:
+            # Logs without a year that span the new year
+            stamp -= one_year
+        if stamp < cutoff:
+            return start
+        start = offset
+    return 0
+
+
+def window_start(path, window):
+    """
+    Returns the offset of the first byte of the file at path that's inside
+    the tail window, or 0 if window is empty or covers the whole file.
+
+    Parameters:
+        path (str): the file to examine
+        window (dict): the tail window described in the module documentation
+
+    Returns:
+        int: the offset of the start of the first line in the window
+
+    Raises:
+        ValueError: if an ``hours`` window's time format isn't supported.
+    """
+    if not window:
+        return 0
+    size = os.path.getsize(path)
+    start = 0
+    with open(path, 'rb') as f:
+        if window.get('bytes') is not None:
+            start = max(start, _bytes_start(f, size, int(window['bytes'])))
+        if window.get('lines') is not None:
+            start = max(start, _lines_start(f, size, int(window['lines'])))
+        if window.get('hours') is not None:
+            time_format = window.get('time_format', DEFAULT_TIME_FORMAT)
+            start = max(start, _time_start(f, size, float(window['hours']), time_format))
+    return start
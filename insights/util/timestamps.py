@@ -0,0 +1,179 @@
+"""
+Fast parsing of the fixed time stamp formats found in logs.
+
+:func:`get_parser` turns a ``strptime`` format into a function that accepts
+the same strings as ``datetime.datetime.strptime`` and returns the same
+``datetime``, but does so with one precompiled regular expression and a few
+table lookups.  Formats using directives it doesn't know about fall back to
+``strptime``.  Parsers for formats without fractional seconds also remember
+the results for recently seen time stamps, since consecutive log lines
+usually share them.
+
+Month and day names are matched in English, as logs are collected with
+``LC_ALL=C``.
+
+Examples:
+    >>> parse = get_parser('%b %d %H:%M:%S')
+    >>> parse('May 18 15:13:34')
+    datetime.datetime(1900, 5, 18, 15, 13, 34)
+"""
+import datetime
+import re
+
+MONTHS = ["jan", "feb", "mar", "apr", "may", "jun",
+          "jul", "aug", "sep", "oct", "nov", "dec"]
+FULL_MONTHS = ["january", "february", "march", "april", "may", "june", "july",
+               "august", "september", "october", "november", "december"]
+DAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+FULL_DAYS = ["monday", "tuesday", "wednesday", "thursday", "friday",
+             "saturday", "sunday"]
+
+DIRECTIVES = {
+    'd': r'(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])',
+    'm': r'(1[0-2]|0[1-9]|[1-9])',
+    'y': r'(\d\d)',
+    'Y': r'(\d\d\d\d)',
+    'H': r'(2[0-3]|[0-1]\d|\d)',
+    'I': r'(1[0-2]|0[1-9]|[1-9])',
+    'M': r'([0-5]\d|\d)',
+    'S': r'(6[0-1]|[0-5]\d|\d)',
+    'f': r'([0-9]{1,6})',
+    'b': r'(' + '|'.join(MONTHS) + r')',
+    'B': r'(' + '|'.join(FULL_MONTHS) + r')',
+    'a': r'(' + '|'.join(DAYS) + r')',
+    'A': r'(' + '|'.join(FULL_DAYS) + r')',
+    'p': r'(am|pm)',
+}
+"""
+Regular expressions for the supported ``strptime`` directives.  They match
+exactly what ``strptime`` matches for them in the C locale.
+"""
+
+MEMO_SIZE = 4096
+"""
+The number of time stamps each parser remembers before starting over.
+"""
+
+_directive_re = re.compile(r'%(.)|(\s+)|([^%\s]+)')
+_PARSERS = {}
+
+
+def _pattern(time_format):
+    """
+    Returns (pattern, fields) for time_format or None if it has a directive
+    that isn't supported.
+    """
+    pattern = []
+    fields = []
+    for directive, space, literal in _directive_re.findall(time_format):
+        if space:
+            pattern.append(r'\s+')
+        elif literal:
+            pattern.append(re.escape(literal))
+        elif directive == '%':
+            pattern.append('%')
+        elif directive in DIRECTIVES:
+            pattern.append(DIRECTIVES[directive])
+            fields.append(directive)
+        else:
+            return None
+    return ''.join(pattern), fields
+
+
+def get_regex(time_format):
+    """
+    Returns a compiled regular expression that finds time stamps in
+    ``strptime`` format time_format within a string, or ``None`` if the
+    format has a directive that isn't supported.
+    """
+    compiled = _pattern(time_format)
+    if compiled is not None:
+        return re.compile(compiled[0], re.IGNORECASE)
+
+
+def _build(values):
+    year, month, day, hour, minute, second, micro = 1900, 1, 1, 0, 0, 0, 0
+    pm = None
+    twelve_hour = False
+    for d, v in values:
+        if d == 'Y':
+            year = int(v)
+        elif d == 'y':
+            year = int(v)
+            year += 2000 if year < 69 else 1900
+        elif d == 'm':
+            month = int(v)
+        elif d == 'b':
+            month = MONTHS.index(v.lower()) + 1
+        elif d == 'B':
+            month = FULL_MONTHS.index(v.lower()) + 1
+        elif d == 'd':
+            day = int(v)
+        elif d == 'H':
+            hour = int(v)
+        elif d == 'I':
+            hour = int(v)
+            twelve_hour = True
+        elif d == 'M':
+            minute = int(v)
+        elif d == 'S':
+            second = int(v)
+        elif d == 'f':
+            micro = int(v + '0' * (6 - len(v)))
+        elif d == 'p':
+            pm = v.lower() == 'pm'
+    if twelve_hour:
+        if pm:
+            hour = hour if hour == 12 else hour + 12
+        elif hour == 12:
+            hour = 0
+    return datetime.datetime(year, month, day, hour, minute, second, micro)
+
+
+def get_parser(time_format):
+    """
+    Returns a function that parses strings in ``strptime`` format
+    time_format into ``datetime`` objects.  Like ``strptime``, it raises
+    ``ValueError`` for strings that don't match the format.  Parsers are
+    cached per format.
+    """
+    try:
+        return _PARSERS[time_format]
+    except KeyError:
+        pass
+
+    compiled = _pattern(time_format)
+    if compiled is None:
+        def parse(s):
+            return datetime.datetime.strptime(s, time_format)
+    else:
+        pattern, fields = compiled
+        match = re.compile(pattern + r'\Z', re.IGNORECASE).match
+        memo = {} if 'f' not in fields else None
+
+        def parse(s):
+            if memo is not None:
+                try:
+                    return memo[s]
+                except KeyError:
+                    pass
+            m = match(s)
+            if m is None:
+                raise ValueError("time data %r does not match format %r" % (s, time_format))
+            result = _build(zip(fields, m.groups()))
+            if memo is not None:
+                if len(memo) >= MEMO_SIZE:
+                    memo.clear()
+                memo[s] = result
+            return result
+
+    _PARSERS[time_format] = parse
+    return parse
+
+
+def strptime(s, time_format):
+    """
+    Drop in replacement for ``datetime.datetime.strptime`` that uses
+    :func:`get_parser`.
+    """
+    return get_parser(time_format)(s)